@@ -0,0 +1,101 @@
+"""Memory and aggregation time of one day of per-minute statistics for 500
+tables: the nested dicts of get_hubs_stats_metrics against a MetricFrame.
+
+    PYTHONPATH=. python benchmarks/bench_columnar.py
+"""
+
+import json
+import time
+import tracemalloc
+
+from pyhvr.pyhvr_columnar import MetricFrame
+
+
+def answer(tables=500, minutes=1440):
+    tstamps = [
+        "2022-03-01T%02d:%02d:00Z" % (minute // 60, minute % 60)
+        for minute in range(minutes)
+    ]
+    return {
+        metric: {
+            "1": {
+                "clt": {
+                    "chn": {
+                        "src": {
+                            "table%d" % t: {ts: t + m for m, ts in enumerate(tstamps)}
+                            for t in range(tables)
+                        }
+                    }
+                }
+            }
+        }
+        for metric in ("Captured Rows", "Integrated Changes")
+    }
+
+
+def measured(label, function):
+    # timed without tracemalloc, which slows down allocations
+    begin = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - begin
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print("%-40s %8.1f ms %8.1f MB" % (label, elapsed * 1000, size / 1e6))
+    return result
+
+
+def dict_sum(data):
+    totals = {}
+    for metric, grans in data.items():
+        for scopes in grans.values():
+            for channels in scopes.values():
+                for locs in channels.values():
+                    for tables in locs.values():
+                        for values in tables.values():
+                            totals[metric] = totals.get(metric, 0) + sum(
+                                values.values()
+                            )
+    return totals
+
+
+def dict_sum_per_table_and_minute(data):
+    totals = {}
+    for grans in data.values():
+        for scopes in grans.values():
+            for channels in scopes.values():
+                for locs in channels.values():
+                    for tables in locs.values():
+                        for table, values in tables.items():
+                            for tstamp, value in values.items():
+                                key = (table, tstamp)
+                                totals[key] = totals.get(key, 0) + value
+    return totals
+
+
+def main():
+    text = json.dumps(answer())
+    data = measured("json.loads, nested dicts", lambda: json.loads(text))
+    frame = measured("MetricFrame.from_answer", lambda: MetricFrame.from_answer(data))
+    print("%d values, %.1f MB of columns" % (len(frame), frame.nbytes / 1e6))
+    measured("sum per metric, dicts", lambda: dict_sum(data))
+    measured("sum per metric, MetricFrame", lambda: frame.aggregate())
+    measured(
+        "sum per table and minute, dicts", lambda: dict_sum_per_table_and_minute(data)
+    )
+    measured(
+        "sum per table and minute, MetricFrame",
+        lambda: frame.aggregate(by=("table", "tstamp")),
+    )
+    measured(
+        "sum per table and minute, to_dict()",
+        lambda: frame.aggregate(by=("table", "tstamp")).to_dict(),
+    )
+    measured(
+        "max per table and minute, MetricFrame",
+        lambda: frame.aggregate(by=("table", "tstamp"), how="max"),
+    )
+
+
+main()
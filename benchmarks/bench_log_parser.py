@@ -0,0 +1,91 @@
+"""Parsing 100k log lines: per-line regexes over str.splitlines() against
+pyhvr_log_parser.parse_log() on the response bytes.
+
+    PYTHONPATH=. python benchmarks/bench_log_parser.py
+"""
+
+import re
+import time
+
+from pyhvr.pyhvr_log_parser import parse_log
+
+LINE = re.compile(r"^(\S+): (\S+): (?:([A-Z])_(J\w+): )?(.*)$")
+
+
+def log(lines=100000):
+    out = []
+    for i in range(lines):
+        tstamp = "2022-03-01T%02d:%02d:%02d+01:00" % (
+            i // 3600 % 24,
+            i // 60 % 60,
+            i % 60,
+        )
+        if i % 50 == 0:
+            out.append("%s: chn-integ-tgt: F_JR071E: Integrate failed." % tstamp)
+            out.append("  ORA-00942: table or view does not exist")
+        else:
+            out.append(
+                "%s: chn-cap-src: Captured %d changes from 'orders'." % (tstamp, i)
+            )
+    return ("\n".join(out) + "\n").encode()
+
+
+def splitlines(data, severity=None):
+    records = []
+    for line in data.decode().splitlines():
+        match = LINE.match(line)
+        if match is None:
+            if records:
+                records[-1]["message"] += "\n" + line
+            continue
+        record = {
+            "tstamp": match.group(1),
+            "job": match.group(2),
+            "severity": {"F": "error", "W": "warning"}.get(match.group(3), "info"),
+            "code": match.group(4),
+            "message": match.group(5),
+        }
+        records.append(record)
+    if severity is not None:
+        records = [r for r in records if r["severity"] in severity]
+    return records
+
+
+def timed(label, function, runs=5):
+    best = None
+    for _ in range(runs):
+        begin = time.perf_counter()
+        n = len(function())
+        elapsed = time.perf_counter() - begin
+        best = elapsed if best is None else min(best, elapsed)
+    print("%-40s %7.1f ms  %6d records" % (label, best * 1000, n))
+
+
+def main():
+    data = log()
+    print("%d bytes" % len(data))
+    timed("splitlines + regex", lambda: splitlines(data))
+    timed("parse_log", lambda: list(parse_log(data)))
+    timed(
+        "parse_log, with messages",
+        lambda: [r.message for r in parse_log(data)],
+    )
+    timed("splitlines + regex, errors only", lambda: splitlines(data, {"error"}))
+    timed("parse_log, errors only", lambda: list(parse_log(data, severity=["error"])))
+    timed(
+        "parse_log, errors only, with messages",
+        lambda: [r.message for r in parse_log(data, severity=["error"])],
+    )
+    timed(
+        "parse_log, one hour",
+        lambda: list(
+            parse_log(
+                data,
+                tstamp_begin="2022-03-01T10:00:00",
+                tstamp_end="2022-03-01T11:00:00",
+            )
+        ),
+    )
+
+
+main()
@@ -0,0 +1,116 @@
+"""Import time, memory and per-call overhead of the route table dispatch.
+
+    git show <rev>:pyhvr/pyhvr_client.py > legacy_client.py
+    python benchmarks/bench_routes.py legacy_client.py
+
+Compares the route table (pyhvr_routes.py, methods compiled on first use)
+against a client module with one generated method per operation. No
+requests are sent, Client.request and the verbs are replaced by no-ops.
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+
+import pyhvr
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(pyhvr.__file__)))
+
+LOAD = """
+import importlib.util, sys, time, tracemalloc
+import pyhvr
+
+def load(paths, prefix):
+    for n, path in enumerate(paths):
+        spec = importlib.util.spec_from_file_location(prefix + str(n), path)
+        spec.loader.exec_module(importlib.util.module_from_spec(spec))
+
+begin = time.perf_counter()
+load(sys.argv[1:], "timed_")
+elapsed = time.perf_counter() - begin
+tracemalloc.start()
+load(sys.argv[1:], "traced_")
+print(elapsed, tracemalloc.get_traced_memory()[0])
+"""
+
+
+def load_cost(paths, runs=20):
+    # fresh interpreter per run; the first run writes the .pyc files
+    samples = []
+    for _ in range(runs + 1):
+        out = subprocess.check_output([sys.executable, "-c", LOAD] + paths)
+        samples.append([float(v) for v in out.split()])
+    samples = samples[1:]
+    elapsed = sorted(s[0] for s in samples)[len(samples) // 2]
+    return elapsed, samples[-1][1]
+
+
+def load_module(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def call_cost(client_class, calls=50000):
+    class NoRequest(client_class):
+        # generated methods call request() (with timeout=), those of older
+        # clients call the verbs, which send the request themselves
+        def request(
+            self, verb, path, query, headers, payload, is_json, *args, **kwargs
+        ):
+            return None
+
+        def get(self, path, query, headers, payload, is_json, *args, **kwargs):
+            return None
+
+        post = put = delete = patch = get
+
+    hvr_client = NoRequest(uri="http://localhost:4340", setup_mode=False)
+    hvr_client.get_hubs_jobs(hub="hvrhub")
+    hvr_client.post_hubs_channels_refresh(
+        hub="hvrhub", channel="c", source_loc="s", target_loc="t"
+    )
+
+    begin = time.perf_counter()
+    for _ in range(calls):
+        hvr_client.get_hubs_jobs(hub="hvrhub", channel=["c1", "c2"])
+        hvr_client.post_hubs_channels_refresh(
+            hub="hvrhub",
+            channel="c",
+            source_loc="s",
+            target_loc="t",
+            tables=["t1"],
+            start_immediate=True,
+        )
+    return (time.perf_counter() - begin) / (2 * calls) * 1e6
+
+
+def main():
+    legacy_path = sys.argv[1]
+    routes_paths = [
+        os.path.join(ROOT, "pyhvr", "pyhvr_routes.py"),
+        os.path.join(ROOT, "pyhvr", "pyhvr_client.py"),
+    ]
+
+    print("module load (median of 20, ms) and allocated memory (KiB):")
+    for label, paths in (
+        ("generated methods", [legacy_path]),
+        ("route table", routes_paths),
+    ):
+        elapsed, memory = load_cost(paths)
+        print(f"  {label:18} {elapsed * 1000:7.2f} ms {memory / 1024:8.0f} KiB")
+
+    print("per-call overhead (us):")
+    legacy = load_module(legacy_path, "legacy_client")
+    for label, client_class in (
+        ("generated methods", legacy.Client),
+        ("route table", pyhvr.Client),
+    ):
+        print(f"  {label:18} {call_cost(client_class):7.2f} us")
+
+
+if __name__ == "__main__":
+    main()
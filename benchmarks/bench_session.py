@@ -0,0 +1,49 @@
+"""Calls/sec of a pooled Client against per-call connections.
+
+    python benchmarks/bench_session.py [calls]
+
+"per-call" reproduces the former behaviour of opening a new connection for
+every request (module level requests.request), "pooled" is the Client's own
+keep-alive session.
+"""
+
+import sys
+import time
+
+import requests
+from standin_hub import start
+
+import pyhvr
+
+
+class PerCallSession:
+    request = staticmethod(requests.request)
+    post = staticmethod(requests.post)
+
+    def close(self):
+        pass
+
+
+def run(hvr_client, calls):
+    hvr_client.login()
+    begin = time.perf_counter()
+    for _ in range(calls):
+        hvr_client.get_hubs_jobs(hub="hvrhub")
+    return calls / (time.perf_counter() - begin)
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    server, uri = start()
+
+    per_call = pyhvr.client(username="admin", password="pw", uri=uri)
+    per_call.session = PerCallSession()
+    pooled = pyhvr.client(username="admin", password="pw", uri=uri)
+
+    print(f"per-call: {run(per_call, calls):8.0f} calls/sec")
+    print(f"pooled:   {run(pooled, calls):8.0f} calls/sec")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
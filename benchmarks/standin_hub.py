@@ -0,0 +1,46 @@
+"""Local stand-in for a hub server, used by the benchmarks.
+
+Answers login and returns a small JSON document for every other request,
+over HTTP/1.1 so that clients can keep connections alive.
+"""
+
+import json
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+LOGIN = json.dumps({"access_token": "token", "expires_in": 3600}).encode()
+BODY = json.dumps({"tstamp": "2022-01-01T00:00:00Z", "state": "RUNNING"}).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # buffer the response so that headers and body go out in one segment
+    wbufsize = -1
+
+    def log_message(self, *args):
+        pass
+
+    def handle_any(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        data = LOGIN if self.path.startswith("/auth/") else BODY
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = handle_any
+
+
+class Server(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def start():
+    """Start the stand-in hub in a background thread, return (server, uri)"""
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, "http://127.0.0.1:%d" % server.server_address[1]
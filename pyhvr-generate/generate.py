@@ -8,6 +8,7 @@ from jinja2 import Environment, FileSystemLoader
 
 def generate(yaml_file):
     function_mapping = yaml.safe_load(open("function_mapping.yaml"))
+    retry_safe = yaml.safe_load(open("retry_safe.yaml"))
     # pprint(function_mapping)
 
     openapi = yaml.safe_load(open(yaml_file))
@@ -72,28 +73,34 @@ def generate(yaml_file):
             if python_functions.get(python_function_name):
                 print("Duplicate: " + python_function_name)
 
-            python_functions[python_function_name] = generate_function(
-                python_function_name, verb, path_openapi, verb_path_openapi, openapi
+            python_functions[python_function_name] = generate_route(
+                verb,
+                path_openapi,
+                verb_path_openapi,
+                openapi,
+                retry_safe.get(uri, {}).get(verb, False),
             )
 
     env = Environment(loader=FileSystemLoader("./"))
 
-    main_template = env.get_template("pyhvr_client.py.jinja")
+    for template in (
+        "pyhvr_routes.py.jinja",
+        "pyhvr_client.py.jinja",
+        "pyhvr_async_client.py.jinja",
+    ):
+        rendered = env.get_template(template).render(routes=python_functions)
 
-    main_rendered = main_template.render(function_definitions=python_functions)
+        with open(template[: -len(".jinja")], "w") as text_file:
+            text_file.write(rendered)
 
-    with open("pyhvr_client.py", "w") as text_file:
-        text_file.write(main_rendered)
-    # print(main_rendered)
 
-
-def generate_function(function_name, verb, uri, openapi, full_openapi):
+def generate_route(verb, uri, openapi, full_openapi, retry_safe):
 
     # pprint(uri)
 
-    parameters = ["self"]
-    query_builder_entries = []
-    header_builder_entries = []
+    parameters = []
+    query_params = []
+    header_params = []
 
     if openapi.get("parameters"):
         for p in openapi["parameters"]:
@@ -103,30 +110,22 @@ def generate_function(function_name, verb, uri, openapi, full_openapi):
                 param = p["name"]
                 schema = p["schema"]
                 is_bool = schema.get("type") == "boolean"
-                if is_bool:
-                    value = f"self.from_bool({param})"
-                else:
-                    value = f"{param}"
                 parameters.append(param + "=None")
-                query_builder_entries.append(
-                    f'        if {param}:\n          query["{param}"]={value}'
-                )
+                query_params.append((param, is_bool))
             elif p["in"] == "header":
                 param = p["name"]
                 py_name = param.replace("-", "_").lower()
                 schema = p["schema"]
                 parameters.append(py_name + "=None")
-                header_builder_entries.append(
-                    f'        if {py_name}:\n          headers["{param}"]={py_name}'
-                )
+                header_params.append((py_name, param))
             else:
                 print("Unsupported parameter type: " + p["in"])
 
-    payload_builder = ""
+    # None: no request body, "**": the keyword arguments are the body,
+    # otherwise (property, required, is_bool) for each body property
+    body_params = None
     if openapi.get("requestBody"):
         schema = openapi["requestBody"]["content"]["application/json"]["schema"]
-        payload_builder_entries = []
-        payload_builder = "payload=''"
 
         if schema.get("properties"):
             schema_to_parse = schema["properties"]
@@ -148,8 +147,9 @@ def generate_function(function_name, verb, uri, openapi, full_openapi):
 
         if param_passthrough:
             parameters.append("**payload")
-            payload_builder = ""
+            body_params = "**"
         else:
+            body_params = []
             for property in schema_to_parse:
                 is_bool = False
                 try:
@@ -158,44 +158,12 @@ def generate_function(function_name, verb, uri, openapi, full_openapi):
                 except KeyError:
                     pass
 
-                if is_bool:
-                    value = f"self.from_bool({property})"
-                else:
-                    value = f"{property}"
                 if property in required:
                     parameters.append(property)
-                    payload_builder_entries.append(
-                        f'        payload["{property}"] = {value}'
-                    )
                 else:
                     parameters.append(property + "=None")
-                    payload_builder_entries.append(
-                        f'        if {property} is not None:\n          payload["{property}"]={value}'
-                    )
-
-            if payload_builder_entries:
-                payload_builder = "        payload={}\n" + "\n".join(
-                    payload_builder_entries
-                )
-
-        # pprint(schema)
-        payload = "payload"
-    else:
-        payload = "None"
-
-    if query_builder_entries:
-        query_builder = "        query={}\n" + "\n".join(query_builder_entries)
-        query = "query"
-    else:
-        query_builder = ""
-        query = "None"
-
-    if header_builder_entries:
-        header_builder = "        headers={}\n" + "\n".join(header_builder_entries)
-        header = "headers"
-    else:
-        header_builder = ""
-        header = "{}"
+                body_params.append((property, property in required, is_bool))
+            body_params = tuple(body_params)
 
     is_json = True
     if openapi.get("responses"):
@@ -216,28 +184,18 @@ def generate_function(function_name, verb, uri, openapi, full_openapi):
     ]
     passthrough_params = [param for param in parameters if ("**" in param)]
     optional_params = [param for param in parameters if ("=" in param)]
-    parameters_joined = ", ".join(
-        required_params + optional_params + passthrough_params
+    signature = tuple(required_params + optional_params + passthrough_params)
+
+    return (
+        verb.upper(),
+        uri,
+        signature,
+        tuple(query_params),
+        tuple(header_params),
+        body_params,
+        is_json,
+        retry_safe,
     )
 
-    # if uri is parametrized, make it so
-    if "{" in uri:
-        f = "f"
-    else:
-        f = ""
-
-    fun = f"""
-    def {function_name}({parameters_joined}):
-{query_builder}
-{header_builder}
-{payload_builder}
-        return self.{verb}(
-            {f}"{uri}", {query}, {header}, {payload}, {is_json}
-        )
-"""
-
-    return fun
-    # print(fun)
-
 
 generate(sys.argv[1])
@@ -5,7 +5,7 @@ export owner=606319127842.dkr.ecr.ap-southeast-2.amazonaws.com
 echo "Create local python environment"
 python3 -m venv venv || python -m venv venv
 source venv/bin/activate
-pip install pytest pyyaml jinja2 requests
+pip install pytest pyyaml jinja2 requests aiohttp
 
 cd ..
 bash build.sh
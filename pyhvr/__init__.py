@@ -3,9 +3,20 @@ __version__ = "0.1.0"
 from pyhvr.pyhvr_client import Client
 
 
-def client(username, password, uri):
-    return Client(username=username, password=password, uri=uri, setup_mode=False)
+def client(username, password, uri, **kwargs):
+    return Client(
+        username=username, password=password, uri=uri, setup_mode=False, **kwargs
+    )
 
 
-def client_setup_mode(uri):
-    return Client(uri=uri, setup_mode=True)
+def client_setup_mode(uri, **kwargs):
+    return Client(uri=uri, setup_mode=True, **kwargs)
+
+
+def async_client(username, password, uri, **kwargs):
+    # aiohttp is an optional dependency (pip install pyhvr[async])
+    from pyhvr.pyhvr_async_client import AsyncClient
+
+    return AsyncClient(
+        username=username, password=password, uri=uri, setup_mode=False, **kwargs
+    )
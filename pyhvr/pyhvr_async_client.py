@@ -0,0 +1,236 @@
+import asyncio
+import json
+import time
+
+import aiohttp
+
+import pyhvr.pyhvr_deadline
+import pyhvr.pyhvr_exceptions
+import pyhvr.pyhvr_retry
+import pyhvr.pyhvr_routes
+
+
+def query_items(query):
+    # aiohttp takes neither lists nor booleans as query values
+    items = []
+    for key, value in (query or {}).items():
+        if isinstance(value, (list, tuple)):
+            items.extend((key, str(v)) for v in value)
+        elif value is not None:
+            items.append((key, str(value)))
+    return items
+
+
+def client_timeout(timeout):
+    # requests style seconds or (connect, read) as an aiohttp.ClientTimeout
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+    else:
+        connect = read = timeout
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+
+class AsyncClient:
+    username: str
+    password: str
+    uri: str
+    bearer_token: str = None
+    bearer_token_valid_until: int = 0
+    setup_mode: bool = False
+    session: aiohttp.ClientSession = None
+
+    def __init__(
+        self,
+        uri,
+        setup_mode,
+        username=None,
+        password=None,
+        pool_maxsize=100,
+        max_concurrency=100,
+        retry=None,
+        timeout=(10, 300),
+    ):
+        self.username = username
+        self.password = password
+        self.uri = uri
+        self.setup_mode = setup_mode
+        self.pool_maxsize = pool_maxsize
+        self.max_concurrency = max_concurrency
+        self.retry = retry if retry is not None else pyhvr.pyhvr_retry.RetryPolicy()
+        # default (connect, read) timeout in seconds, None waits forever
+        self.timeout = timeout
+        # session, semaphore and lock bind to the running event loop, so
+        # they are created on first use
+        self.semaphore = None
+        self.login_lock = None
+
+    def get_session(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self.pool_maxsize)
+            )
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+            self.login_lock = asyncio.Lock()
+        return self.session
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def deadline(self, seconds):
+        return pyhvr.pyhvr_deadline.deadline(seconds)
+
+    async def login(self):
+        await self.login_token()
+        return None  # do not leak the token
+
+    def header_nonauth(self):
+        return {"Content-type": "application/json", "Accept": "application/json"}
+
+    def header_auth(self, bearer_token):
+        return {
+            "Content-type": "application/json",
+            "Accept": "application/json",
+            "Authorization": "bearer " + bearer_token,
+        }
+
+    async def login_token(self):
+        if self.bearer_token_valid_until >= time.time():
+            return self.bearer_token
+        session = self.get_session()
+        # only the first coroutine to see an expired token logs in, the
+        # others wait for it and pick up the new token
+        async with self.login_lock:
+            if self.bearer_token_valid_until >= time.time():
+                return self.bearer_token
+            timeout = client_timeout(pyhvr.pyhvr_deadline.cap_timeout(self.timeout))
+            try:
+                if self.setup_mode:
+                    rq = await session.post(
+                        self.uri + "/auth/v1/setup",
+                        headers=self.header_nonauth(),
+                        timeout=timeout,
+                    )
+                else:
+                    rq = await session.post(
+                        self.uri + "/auth/v1/password",
+                        data=json.dumps(
+                            {
+                                "username": self.username,
+                                "password": self.password,
+                                "refresh": "token",
+                            }
+                        ),
+                        headers=self.header_nonauth(),
+                        timeout=timeout,
+                    )
+                text = await rq.text()
+            except asyncio.TimeoutError as e:
+                raise pyhvr.pyhvr_exceptions.TimeoutError(
+                    message="Cannot login: " + str(e)
+                )
+            except Exception as e:
+                raise pyhvr.pyhvr_exceptions.ConnectionError(
+                    message="Cannot login: " + str(e)
+                )
+
+            if rq.status < 400:
+                token = json.loads(text)
+                self.bearer_token = token["access_token"]
+                # Force renew 60 seconds before expiry
+                self.bearer_token_valid_until = time.time() + (token["expires_in"] - 60)
+                return self.bearer_token
+
+            raise pyhvr.pyhvr_exceptions.LoginError(status_code=rq.status, message=text)
+
+    async def request(
+        self,
+        verb,
+        path,
+        query,
+        headers,
+        payload,
+        is_json,
+        retry_safe=False,
+        timeout=None,
+    ):
+        retryable = self.retry.retryable(verb, retry_safe)
+        self.retry.budget.deposit()
+        attempt = 0
+        while True:
+            headers.update(self.header_auth(await self.login_token()))
+            session = self.get_session()
+            try:
+                async with self.semaphore:
+                    async with session.request(
+                        verb,
+                        self.uri + path,
+                        params=query_items(query),
+                        data=json.dumps(payload),
+                        headers=headers,
+                        timeout=client_timeout(
+                            pyhvr.pyhvr_deadline.cap_timeout(
+                                timeout if timeout is not None else self.timeout
+                            )
+                        ),
+                    ) as rq:
+                        text = await rq.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                delay = self.retry.delay(attempt) if retryable else None
+                if delay is None or not pyhvr.pyhvr_deadline.allows(delay):
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise pyhvr.pyhvr_exceptions.TimeoutError(
+                            message=str(e) or "Request timed out"
+                        )
+                    raise pyhvr.pyhvr_exceptions.ConnectionError(message=str(e))
+            else:
+                if rq.status < 400:
+                    if text and is_json:
+                        return json.loads(text)
+                    elif text:
+                        return text
+                    else:
+                        return None
+
+                delay = None
+                if retryable:
+                    delay = self.retry.delay(
+                        attempt, rq.status, rq.headers.get("Retry-After")
+                    )
+                if delay is None or not pyhvr.pyhvr_deadline.allows(delay):
+                    raise pyhvr.pyhvr_exceptions.RestError(
+                        status_code=rq.status, message=text
+                    )
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, path, query, headers, payload, is_json):
+        return await self.request("GET", path, query, headers, payload, is_json)
+
+    async def post(self, path, query, headers, payload, is_json):
+        return await self.request("POST", path, query, headers, payload, is_json)
+
+    async def put(self, path, query, headers, payload, is_json):
+        return await self.request("PUT", path, query, headers, payload, is_json)
+
+    async def delete(self, path, query, headers, payload, is_json):
+        return await self.request("DELETE", path, query, headers, payload, is_json)
+
+    async def patch(self, path, query, headers, payload, is_json):
+        return await self.request("PATCH", path, query, headers, payload, is_json)
+
+    def from_bool(self, b):
+        if b:
+            return "true"
+        else:
+            return "false"
+
+
+pyhvr.pyhvr_routes.bind_routes(AsyncClient, is_async=True)
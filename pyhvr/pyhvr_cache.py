@@ -0,0 +1,120 @@
+import collections
+import threading
+import time
+
+# Definition changes that can alter any part of the hub definition, e.g. a
+# location rename is reflected in the location groups of all channels
+HUB_WIDE = ("action_modify", "action_replace", "import", "rename", "copy")
+
+
+def definition_path(path):
+    # The path components below /hubs/{hub}/definition, or None for other paths
+    parts = path.strip("/").split("/")
+    for i in range(len(parts) - 2):
+        if parts[i] == "hubs" and parts[i + 2] == "definition":
+            return parts[: i + 3], parts[i + 3 :]
+    return None
+
+
+def mutation_scope(path):
+    """The path components whose cached subtree and ancestors a definition
+    change at ``path`` invalidates, None if it is no definition change."""
+    split = definition_path(path)
+    if split is None:
+        return None
+    root, below = split
+    if below[:2] == ["import", "analyze"]:
+        return None
+    if any(p in HUB_WIDE for p in below) or (below[:1] == ["locs"] and len(below) <= 2):
+        return tuple(root)
+    if below and below[-1].endswith("_delete"):
+        below = below[:-1] + [below[-1][: -len("_delete")]]
+    return tuple(root + below)
+
+
+class ResponseCache:
+    """Size bounded LRU cache with a time to live for the GET requests of
+    hub definitions (``/hubs/{hub}/definition/...``).
+
+    Definition changes through the same client invalidate the changed
+    subtree and the cached definitions that contain it.
+
+    :param maxsize: number of responses kept
+    :param ttl: seconds a response is used
+    """
+
+    def __init__(self, maxsize=256, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = collections.OrderedDict()
+        self.lock = threading.Lock()
+        # Bumped by every invalidation; a response fetched while a definition
+        # changed may be stale and is not stored
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def key(self, verb, path, query):
+        # None for requests that are not cached
+        if verb != "GET" or path.endswith("/definition/change/events"):
+            return None
+        if definition_path(path) is None:
+            return None
+        items = sorted(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k, v in (query or {}).items()
+            if v is not None
+        )
+        return path, tuple(items)
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, text, generation):
+        with self.lock:
+            if generation != self.generation:
+                return
+            self.entries[key] = (time.monotonic() + self.ttl, text)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, path):
+        scope = mutation_scope(path)
+        if scope is None:
+            return
+        with self.lock:
+            self.generation += 1
+            for key in list(self.entries):
+                cached = tuple(key[0].strip("/").split("/"))
+                n = min(len(cached), len(scope))
+                if cached[:n] == scope[:n]:
+                    del self.entries[key]
+                    self.invalidations += 1
+
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self.entries),
+            }
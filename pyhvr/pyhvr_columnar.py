@@ -0,0 +1,269 @@
+import array
+
+import numpy
+
+import pyhvr.pyhvr_metrics
+import pyhvr.pyhvr_routes
+
+# numpy is an optional dependency (pip install pyhvr[columnar])
+
+CATEGORIES = ("channel", "loc", "table", "metric")
+AGGREGATES = ("sum", "count", "mean", "min", "max")
+
+
+def number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class Epochs(dict):
+    # epoch() of each timestamp, parsed once; a series has few distinct ones
+    def __missing__(self, tstamp):
+        seconds = self[tstamp] = pyhvr.pyhvr_metrics.epoch(tstamp)
+        return seconds
+
+
+class Columns:
+    """Growing columns of a MetricFrame, appended one series at a time."""
+
+    def __init__(self):
+        self.names = {column: {} for column in CATEGORIES}
+        self.codes = {column: array.array("i") for column in CATEGORIES}
+        self.tstamp = array.array("q")
+        self.value = array.array("d")
+        self.time_gran = array.array("h")
+        self.epochs = Epochs()
+
+    def add(self, channel, loc, table, metric, time_gran, values):
+        # values is the {tstamp: value} dict of one series
+        n = len(values)
+        for column, key in zip(CATEGORIES, (channel, loc, table, metric)):
+            names = self.names[column]
+            self.codes[column].extend(
+                array.array("i", [names.setdefault(key, len(names))]) * n
+            )
+        self.time_gran.extend(array.array("h", [int(time_gran)]) * n)
+        self.tstamp.extend(map(self.epochs.__getitem__, values))
+        try:
+            self.value.extend(values.values())
+        except TypeError:
+            # strings, e.g. from JSON; extend() keeps the numbers it took
+            del self.value[len(self.tstamp) - n :]
+            self.value.extend(map(number, values.values()))
+
+    def frame(self):
+        return MetricFrame(
+            numpy.frombuffer(self.tstamp, dtype=numpy.int64),
+            numpy.frombuffer(self.value, dtype=numpy.float64),
+            numpy.frombuffer(self.time_gran, dtype=numpy.int16),
+            {k: numpy.frombuffer(v, dtype=numpy.int32) for k, v in self.codes.items()},
+            {k: numpy.array(list(v), dtype=object) for k, v in self.names.items()},
+        )
+
+
+class MetricFrame:
+    """Statistics as columns instead of nested dicts.
+
+    ``tstamp`` (int64 seconds since 1970), ``value`` (float64) and
+    ``time_gran`` (int16) are numpy arrays with one entry per value. The
+    channel, loc, table and metric columns are dictionary encoded: the
+    int32 array ``codes[column]`` indexes the names in
+    ``categories[column]``. Values that are not numbers become NaN.
+    """
+
+    def __init__(self, tstamp, value, time_gran, codes, categories):
+        self.tstamp = tstamp
+        self.value = value
+        self.time_gran = time_gran
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def from_values(cls, values):
+        """Build a frame from (channel, loc, table, metric, time_gran,
+        tstamp, value) tuples."""
+        columns = Columns()
+        for *key, tstamp, value in values:
+            columns.add(*key, {tstamp: value})
+        return columns.frame()
+
+    @classmethod
+    def from_answer(cls, answer):
+        """Build a frame from a get_hubs_stats_metrics answer."""
+        columns = Columns()
+        for metric, grans in (answer or {}).items():
+            for time_gran, scopes in grans.items():
+                for channels in scopes.values():
+                    for channel, locs in channels.items():
+                        for loc, tables in locs.items():
+                            for table, values in tables.items():
+                                columns.add(
+                                    channel, loc, table, metric, time_gran, values
+                                )
+        return columns.frame()
+
+    def __len__(self):
+        return len(self.value)
+
+    @property
+    def nbytes(self):
+        arrays = [self.tstamp, self.value, self.time_gran] + list(self.codes.values())
+        return sum(a.nbytes for a in arrays)
+
+    def column(self, name):
+        """Decoded column: an object array of names, or the numeric array."""
+        if name in self.codes:
+            return self.categories[name][self.codes[name]]
+        return getattr(self, name)
+
+    def mask(
+        self,
+        channel=None,
+        loc=None,
+        table=None,
+        metric=None,
+        time_gran=None,
+        tstamp_begin=None,
+        tstamp_end=None,
+    ):
+        keep = numpy.ones(len(self), dtype=bool)
+        for column, names in zip(CATEGORIES, (channel, loc, table, metric)):
+            if names is not None:
+                wanted = [
+                    i for i, name in enumerate(self.categories[column]) if name in names
+                ]
+                keep &= numpy.isin(self.codes[column], wanted)
+        if time_gran is not None:
+            keep &= numpy.isin(self.time_gran, [int(t) for t in time_gran])
+        if tstamp_begin is not None:
+            keep &= self.tstamp >= pyhvr.pyhvr_metrics.epoch(tstamp_begin)
+        if tstamp_end is not None:
+            keep &= self.tstamp < pyhvr.pyhvr_metrics.epoch(tstamp_end)
+        return keep
+
+    def select(self, **filters):
+        """Frame with the values matching the filters of mask(): lists of
+        channel, loc, table, metric and time_gran, or a tstamp range."""
+        keep = self.mask(**filters)
+        return MetricFrame(
+            self.tstamp[keep],
+            self.value[keep],
+            self.time_gran[keep],
+            {k: v[keep] for k, v in self.codes.items()},
+            self.categories,
+        )
+
+    def aggregate(self, by=("metric",), how="sum"):
+        """Aggregate the values per group, NaNs are skipped; returns an
+        Aggregate with one entry per group, a group being a combination of
+        the ``by`` columns.
+
+        :param by: columns to group by: channel, loc, table, metric,
+            time_gran or tstamp
+        :param how: sum, count, mean, min or max
+        """
+        if how not in AGGREGATES:
+            raise ValueError("how must be one of %s" % ", ".join(AGGREGATES))
+        valid = ~numpy.isnan(self.value)
+        if valid.all():
+            valid = slice(None)
+        values = self.value[valid]
+        # one integer per group: the columns are factorized and combined
+        # like the digits of a number
+        keys, names = [], []
+        for c in by:
+            if c in self.codes:
+                keys.append(self.codes[c][valid])
+                names.append(self.categories[c])
+            else:
+                distinct, inverse = factorize(getattr(self, c)[valid])
+                keys.append(inverse)
+                names.append(distinct)
+        if not len(values):
+            return Aggregate(by, {c: n[:0] for c, n in zip(by, names)}, values)
+        dims = tuple(len(n) for n in names)
+        size = int(numpy.prod(dims))
+        if len(keys) == 1:
+            combined = keys[0]
+        else:
+            combined = numpy.ravel_multi_index(keys, dims)
+        if size <= 2 * len(values):
+            # few possible groups: each has a slot of its own, no sorting
+            slot, slots = combined, size
+        else:
+            groups, slot = numpy.unique(combined, return_inverse=True)
+            slot, slots = slot.reshape(-1), len(groups)
+        count = numpy.bincount(slot, minlength=slots)
+        if slots == size:
+            groups = numpy.flatnonzero(count)
+        if how in ("min", "max"):
+            # reduce the runs of equal slots of the sorted values
+            order = numpy.argsort(slot, kind="stable")
+            starts = numpy.flatnonzero(numpy.diff(slot[order], prepend=-1))
+            function = numpy.minimum if how == "min" else numpy.maximum
+            result = function.reduceat(values[order], starts)
+        elif how == "count":
+            result = count[groups] if slots == size else count
+        else:
+            result = numpy.bincount(slot, weights=values, minlength=slots)
+            if slots == size:
+                result, count = result[groups], count[groups]
+            if how == "mean":
+                result = result / count
+        labels = {
+            c: n[i] for c, n, i in zip(by, names, numpy.unravel_index(groups, dims))
+        }
+        return Aggregate(by, labels, result)
+
+
+class Aggregate:
+    """Result of MetricFrame.aggregate(), one entry per group in the order
+    of the ``by`` columns.
+
+    ``labels[column]`` is the value of a ``by`` column of each group (names
+    for channel, loc, table and metric, numbers for time_gran and tstamp)
+    and ``values`` the aggregated value of each group; all are numpy
+    arrays.
+    """
+
+    def __init__(self, by, labels, values):
+        self.by = tuple(by)
+        self.labels = labels
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def to_dict(self):
+        """{group: value}, a group being a tuple of the ``by`` values."""
+        keys = zip(*(self.labels[c].tolist() for c in self.by))
+        return dict(zip(keys, self.values.tolist()))
+
+
+def factorize(values):
+    # the distinct values and the index of each value in them; integers of a
+    # small range, like the timestamps of a period, are counted not sorted
+    if len(values) and values.dtype.kind in "iu":
+        low = int(values.min())
+        span = int(values.max()) - low + 1
+        if span <= 4 * len(values):
+            offset = values - low
+            present = numpy.zeros(span, dtype=bool)
+            present[offset] = True
+            index = numpy.cumsum(present) - 1
+            distinct = (numpy.flatnonzero(present) + low).astype(values.dtype)
+            return distinct, index[offset]
+    distinct, inverse = numpy.unique(values, return_inverse=True)
+    return distinct, inverse.reshape(-1)
+
+
+def get_metrics(client, hub, **query):
+    """get_hubs_stats_metrics(fetch_values=True) as a MetricFrame; ``query``
+    takes the same filters, e.g. channel=["chn"], time_gran=["1"]."""
+    path = pyhvr.pyhvr_routes.ROUTES["get_hubs_stats_metrics"].path.format(hub=hub)
+    query = {k: v for k, v in query.items() if v}
+    query["fetch_values"] = "true"
+    rq = client.send("GET", path, query, {}, None)
+    return MetricFrame.from_answer(rq.json() if rq.content else None)
@@ -0,0 +1,59 @@
+import contextlib
+import contextvars
+import time
+
+import pyhvr.pyhvr_exceptions
+
+# Absolute time.monotonic() by which the current operation has to finish.
+# A context variable, so each thread and each asyncio task has its own.
+current_deadline = contextvars.ContextVar("pyhvr_deadline", default=None)
+
+
+@contextlib.contextmanager
+def until(end):
+    # A nested deadline can only make the budget shorter
+    outer = current_deadline.get()
+    if outer is not None and (end is None or outer < end):
+        end = outer
+    token = current_deadline.set(end)
+    try:
+        yield end
+    finally:
+        current_deadline.reset(token)
+
+
+def deadline(seconds):
+    """Give all calls inside the ``with`` block one overall time budget.
+
+    Every request's timeout is capped by the time left, and retries that
+    would not finish in time are not attempted.
+    """
+    return until(time.monotonic() + seconds)
+
+
+def remaining():
+    """Seconds left until the current deadline, None if there is none."""
+    end = current_deadline.get()
+    if end is None:
+        return None
+    return end - time.monotonic()
+
+
+def allows(delay):
+    left = remaining()
+    return left is None or delay < left
+
+
+def cap_timeout(timeout):
+    """Cap a requests style timeout (seconds or (connect, read)) by the time
+    left until the current deadline."""
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise pyhvr.pyhvr_exceptions.TimeoutError(message="Deadline exceeded")
+    if timeout is None:
+        return left
+    if isinstance(timeout, tuple):
+        return tuple(left if t is None else min(t, left) for t in timeout)
+    return min(timeout, left)
@@ -0,0 +1,172 @@
+import time
+
+import pyhvr.pyhvr_deadline
+import pyhvr.pyhvr_exceptions
+import pyhvr.pyhvr_metrics
+
+# Event states after which an event does not change anymore
+FINAL_STATES = ("DONE", "CANCELED", "FAILED")
+
+
+def is_final(event):
+    return event.get("state") in FINAL_STATES
+
+
+def poll_events(client, hub, ev_ids, ids_per_call=100):
+    """The events (with results) of ev_ids, in as few get_hubs_events calls
+    as possible; an id the hub does not know raises RestError 404."""
+    events = {}
+    for i in range(0, len(ev_ids), ids_per_call):
+        chunk = ev_ids[i : i + ids_per_call]
+        answer = client.get_hubs_events(hub=hub, ev_id=chunk, fetch_results=True)
+        events.update(answer or {})
+    missing = [ev_id for ev_id in ev_ids if ev_id not in events]
+    if missing:
+        raise pyhvr.pyhvr_exceptions.RestError(
+            status_code=404, message="Event not found: %s" % ", ".join(missing)
+        )
+    return events
+
+
+def wait_for_events(
+    client,
+    hub,
+    ev_ids,
+    timeout=None,
+    poll_min=0.5,
+    poll_max=30.0,
+    backoff=2.0,
+    ids_per_call=100,
+):
+    """Wait until all events are DONE, CANCELED or FAILED and return them
+    as {ev_id: event}, each event with its state and results.
+
+    All unfinished events are fetched together with one get_hubs_events
+    call per cycle. The interval between cycles starts at ``poll_min`` and
+    grows by ``backoff`` up to ``poll_max``; it starts over when an event
+    finishes. The last poll is made at the end of ``timeout`` seconds (or
+    at the current deadline); raises TimeoutError when they are not
+    finished then.
+    """
+    pending = list(ev_ids)
+    finished = {}
+    delay = poll_min
+    left = pyhvr.pyhvr_deadline.remaining()
+    if timeout is not None and (left is None or timeout < left):
+        left = timeout
+    end = None if left is None else time.monotonic() + left
+    while True:
+        events = poll_events(client, hub, pending, ids_per_call)
+        done = {ev_id: event for ev_id, event in events.items() if is_final(event)}
+        finished.update(done)
+        pending = [ev_id for ev_id in pending if ev_id not in done]
+        if not pending:
+            return {ev_id: finished[ev_id] for ev_id in ev_ids}
+
+        delay = poll_min if done else min(poll_max, delay * backoff)
+        if end is not None:
+            left = end - time.monotonic()
+            if left <= 0:
+                raise pyhvr.pyhvr_exceptions.TimeoutError(
+                    message="Events not finished in time: %s" % ", ".join(pending)
+                )
+            # the next poll is at the end at the latest
+            delay = min(delay, left)
+        time.sleep(delay)
+
+
+def wait_for_event(client, hub, ev_id, timeout=None, **kwargs):
+    """Wait until the event is DONE, CANCELED or FAILED and return it, see
+    wait_for_events()."""
+    return wait_for_events(client, hub, [ev_id], timeout, **kwargs)[ev_id]
+
+
+class EventHistory:
+    """Events of a period, fetched window by window and yielded one by one.
+
+    The period is walked in windows of ev_tstamp_begin..ev_tstamp_end (or
+    updated_begin..updated_end with ``updated=True``), at most
+    ``max_events`` per get_hubs_events call. A window that returns
+    ``max_events`` may be cut off, so it is fetched again at half the size;
+    one that returns less than a quarter of it doubles the next window.
+    Events on the edge of two windows are only yielded once. Only one
+    window of events is held at a time.
+
+    :param hub: name of the hub, None for get_repos_events
+    :param filters: further get_hubs_events/get_repos_events arguments,
+        e.g. channel=["chn"], type=["Refresh"]
+    """
+
+    def __init__(
+        self,
+        client,
+        hub,
+        tstamp_begin,
+        tstamp_end=None,
+        updated=False,
+        window=3600,
+        max_events=1000,
+        min_window=1,
+        max_window=30 * 86400,
+        **filters
+    ):
+        self.client = client
+        self.hub = hub
+        self.begin = pyhvr.pyhvr_metrics.epoch(tstamp_begin)
+        self.end = (
+            pyhvr.pyhvr_metrics.epoch(tstamp_end) if tstamp_end else int(time.time())
+        )
+        self.updated = updated
+        self.window = window
+        self.max_events = max_events
+        self.min_window = min_window
+        self.max_window = max_window
+        self.filters = filters
+        self.calls = 0
+        # windows fetched again because they may have been cut off
+        self.splits = 0
+        # windows of min_window that still returned max_events
+        self.truncated = 0
+
+    def fetch(self, begin, end):
+        bounds = (
+            ("updated_begin", "updated_end")
+            if self.updated
+            else ("ev_tstamp_begin", "ev_tstamp_end")
+        )
+        kwargs = dict(self.filters, max_events=self.max_events)
+        kwargs[bounds[0]] = pyhvr.pyhvr_metrics.utc_tstamp(begin)
+        kwargs[bounds[1]] = pyhvr.pyhvr_metrics.utc_tstamp(end)
+        self.calls += 1
+        if self.hub is None:
+            return self.client.get_repos_events(**kwargs) or {}
+        return self.client.get_hubs_events(hub=self.hub, **kwargs) or {}
+
+    def __iter__(self):
+        begin = self.begin
+        size = self.window
+        previous = set()
+        while begin < self.end:
+            end = min(begin + size, self.end)
+            events = self.fetch(begin, end)
+            if len(events) >= self.max_events:
+                if end - begin > self.min_window:
+                    self.splits += 1
+                    size = max(self.min_window, (end - begin) // 2)
+                    continue
+                self.truncated += 1
+            for ev_id in sorted(events):
+                # both bounds are inclusive, the last window may have it
+                if ev_id not in previous:
+                    event = dict(events[ev_id], ev_id=ev_id)
+                    yield event
+            previous = set(events)
+            if len(events) < self.max_events // 4:
+                size = min(self.max_window, size * 2)
+            begin = end
+
+
+def event_history(client, hub, tstamp_begin, tstamp_end=None, **kwargs):
+    """Iterator of the events of a hub (None for the repository events)
+    between two timestamps in time order, see EventHistory."""
+    return iter(EventHistory(client, hub, tstamp_begin, tstamp_end, **kwargs))
@@ -59,3 +59,32 @@ class ConnectionError(PyhvrError):
     """
 
     fmt = "{message}"
+
+
+class TimeoutError(ConnectionError):
+    """HTTP request or the surrounding deadline timed out
+    :ivar message: Text of the underlying requests exception
+    """
+
+    fmt = "{message}"
+
+
+class DownloadError(PyhvrError):
+    """Downloaded data does not match what the hub reports
+    :ivar message: What did not match
+    """
+
+    fmt = "{message}"
+
+
+class EventFailed(PyhvrError):
+    """An event the client waited for ended in state FAILED
+    :ivar message: Id and response of the event
+    :ivar event: The event as get_hubs_events returned it
+    """
+
+    fmt = "{message}"
+
+    def __init__(self, **kwargs):
+        PyhvrError.__init__(self, **kwargs)
+        self.event = kwargs.get("event")
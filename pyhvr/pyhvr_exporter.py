@@ -0,0 +1,276 @@
+"""Prometheus exporter for HVR hubs.
+
+    python -m pyhvr.pyhvr_exporter --uri http://localhost:4340 --username admin --hub hvrhub
+
+The hubs are polled in the background every ``--interval`` seconds;
+/metrics serves the values of the last poll in the Prometheus text format,
+so a scrape never waits for the hub. The password is read from the
+PYHVR_PASSWORD environment variable unless --password is given.
+"""
+
+import argparse
+import collections
+import os
+import re
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pyhvr
+import pyhvr.pyhvr_metrics
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Samples that count up; all others are gauges
+COUNTERS = ("hvr_exporter_errors_total", "hvr_exporter_poll_failures_total")
+
+
+def metric_name(name):
+    """Prometheus name of an HVR metric, e.g. hvr_captured_rows."""
+    return "hvr_" + re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+
+def escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def render(samples):
+    """Text exposition of {name: [(labels, value)]}, a gauge per name unless
+    it is one of COUNTERS."""
+    lines = []
+    for name in sorted(samples):
+        lines.append(
+            "# TYPE %s %s" % (name, "counter" if name in COUNTERS else "gauge")
+        )
+        for labels, value in samples[name]:
+            text = ",".join('%s="%s"' % (k, escape(v)) for k, v in labels)
+            lines.append("%s{%s} %r" % (name, text, float(value)))
+    return ("\n".join(lines) + "\n").encode()
+
+
+class Exporter:
+    """Polls get_hubs_stats_metrics, get_hubs_jobs and get_hubs_stats_oldest
+    of some hubs and keeps the result as a ready-made /metrics page.
+
+    Statistics are fetched incrementally with a MetricsPoller per hub, at
+    granularity ``time_gran``; only the newest value of each metric is
+    kept. A failing call keeps the values of the previous poll and is
+    counted in hvr_exporter_errors_total. A poll that fails as a whole
+    is counted in hvr_exporter_poll_failures_total and reports all hubs
+    down; the next poll is tried as usual.
+
+    :param client: the Client used for all calls
+    :param hubs: names of the hubs
+    :param interval: seconds between polls
+    :param metrics: names of the HVR metrics to export, None for all
+    """
+
+    def __init__(self, client, hubs, interval=30, time_gran="1", metrics=None):
+        self.client = client
+        self.hubs = list(hubs)
+        self.interval = interval
+        # the first poll only needs the last values of each metric
+        lookback = max(3600, 2 * 60 * int(time_gran))
+        since = pyhvr.pyhvr_metrics.utc_tstamp(time.time() - lookback)
+        self.pollers = {
+            hub: pyhvr.pyhvr_metrics.MetricsPoller(
+                client, hub, since, metric=metrics, time_gran=[str(time_gran)]
+            )
+            for hub in self.hubs
+        }
+        self.jobs = {}
+        self.oldest = {}
+        self.errors = collections.Counter()
+        self.failures = 0
+        self.up = {}
+        self.duration = 0.0
+        self.polled = 0.0
+        self.page = render({})
+        self.stop = threading.Event()
+        self.thread = None
+
+    def fetch(self, hub, endpoint, function, *args):
+        # None if the call failed, the previous values are kept then; not
+        # only PyhvrErrors, also e.g. an answer that is not JSON
+        try:
+            return function(*args)
+        except Exception:
+            self.errors[(hub, endpoint)] += 1
+            return None
+
+    def get_oldest(self, hub):
+        # get_hubs_stats_oldest with the timestamps as epoch seconds
+        oldest = self.client.get_hubs_stats_oldest(hub) or {}
+        return {
+            time_gran: {
+                scope: pyhvr.pyhvr_metrics.epoch(tstamp)
+                for scope, tstamp in scopes.items()
+            }
+            for time_gran, scopes in oldest.items()
+        }
+
+    def poll_hub(self, hub):
+        changed = self.fetch(hub, "stats_metrics", self.pollers[hub].poll)
+        jobs = self.fetch(hub, "jobs", self.client.get_hubs_jobs, hub)
+        oldest = self.fetch(hub, "stats_oldest", self.get_oldest, hub)
+        if jobs is not None:
+            self.jobs[hub] = jobs or {}
+        if oldest is not None:
+            self.oldest[hub] = oldest
+        self.up[hub] = None not in (changed, jobs, oldest)
+        store = self.pollers[hub].store
+        for values in store.values():
+            # only the newest value is exported
+            newest = max(values)
+            for tstamp in [t for t in values if t != newest]:
+                del values[tstamp]
+
+    def poll(self):
+        """Poll all hubs once and rebuild the page."""
+        begin = time.monotonic()
+        for hub in self.hubs:
+            self.poll_hub(hub)
+        self.duration = time.monotonic() - begin
+        self.polled = time.time()
+        self.page = render(self.samples())
+
+    def samples(self):
+        samples = collections.defaultdict(list)
+        for hub, poller in self.pollers.items():
+            for key, values in poller.store.items():
+                channel, loc, table, metric, time_gran = key
+                labels = (
+                    ("hub", hub),
+                    ("channel", channel),
+                    ("loc", loc),
+                    ("table", table),
+                    ("time_gran", time_gran),
+                )
+                for value in values.values():
+                    value = number(value)
+                    if value is not None:
+                        samples[metric_name(metric)].append((labels, value))
+        for hub, jobs in self.jobs.items():
+            for job, info in jobs.items():
+                labels = (("hub", hub), ("job", job))
+                samples["hvr_job_state"].append(
+                    (labels + (("state", info.get("state")),), 1)
+                )
+                for field in ("num_retries", "latency"):
+                    if info.get(field) is not None:
+                        samples["hvr_job_" + field].append((labels, info[field]))
+        for hub, grans in self.oldest.items():
+            for time_gran, scopes in grans.items():
+                for scope, seconds in scopes.items():
+                    labels = (("hub", hub), ("time_gran", time_gran), ("scope", scope))
+                    samples["hvr_stats_oldest_timestamp_seconds"].append(
+                        (labels, seconds)
+                    )
+        samples.update(self.status())
+        return samples
+
+    def status(self):
+        # samples of the exporter itself, also when a poll failed
+        samples = collections.defaultdict(list)
+        for hub, ok in self.up.items():
+            samples["hvr_up"].append(((("hub", hub),), int(ok)))
+        for (hub, endpoint), count in self.errors.items():
+            samples["hvr_exporter_errors_total"].append(
+                ((("hub", hub), ("endpoint", endpoint)), count)
+            )
+        samples["hvr_exporter_poll_failures_total"].append(((), self.failures))
+        samples["hvr_exporter_poll_duration_seconds"].append(((), self.duration))
+        samples["hvr_exporter_last_poll_timestamp_seconds"].append(((), self.polled))
+        return samples
+
+    def run(self):
+        while not self.stop.is_set():
+            try:
+                self.poll()
+            except Exception:
+                # the thread goes on; until a poll succeeds the page only
+                # says that the hubs are down
+                self.failures += 1
+                self.up = dict.fromkeys(self.hubs, False)
+                self.page = render(self.status())
+            self.stop.wait(self.interval)
+
+    def start(self):
+        """Poll in a background thread until close()."""
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.stop.set()
+        if self.thread is not None:
+            self.thread.join()
+
+    def server(self, host="", port=9105):
+        """HTTP server answering /metrics with the page of the last poll."""
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                page = exporter.page
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(page)))
+                self.end_headers()
+                self.wfile.write(page)
+
+            def log_message(self, *args):
+                pass
+
+        class Server(socketserver.ThreadingMixIn, HTTPServer):
+            daemon_threads = True
+
+        return Server((host, port), Handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prometheus exporter for HVR hubs")
+    parser.add_argument("--uri", required=True, help="URI of the hub server")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", default=os.environ.get("PYHVR_PASSWORD"))
+    parser.add_argument(
+        "--hub", action="append", required=True, help="hub to export, may be repeated"
+    )
+    parser.add_argument(
+        "--metric",
+        action="append",
+        help="HVR metric to export, may be repeated; default all",
+    )
+    parser.add_argument("--time-gran", default="1", choices=["1", "10", "60", "1440"])
+    parser.add_argument(
+        "--interval", type=float, default=30, help="seconds between polls"
+    )
+    parser.add_argument("--host", default="")
+    parser.add_argument("--port", type=int, default=9105)
+    args = parser.parse_args(argv)
+
+    client = pyhvr.client(username=args.username, password=args.password, uri=args.uri)
+    exporter = Exporter(client, args.hub, args.interval, args.time_gran, args.metric)
+    exporter.start()
+    server = exporter.server(args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        exporter.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import collections
+import time
+
+import pyhvr.pyhvr_routes
+
+# Changes reported by watch_jobs(); info is the job as get_hubs_jobs returns it
+JobAdded = collections.namedtuple("JobAdded", "job info")
+JobRemoved = collections.namedtuple("JobRemoved", "job info")
+JobStateChanged = collections.namedtuple("JobStateChanged", "job old_state state info")
+JobError = collections.namedtuple("JobError", "job tstamp info")
+SchedulerError = collections.namedtuple("SchedulerError", "tstamp")
+
+
+def is_true(header):
+    return (header or "").lower() in ("true", "1")
+
+
+class JobWatch:
+    """The jobs of a hub, kept up to date by incremental get_hubs_jobs calls.
+
+    The first poll() fetches all jobs. Later polls pass updated_jobs_since
+    and updated_err_since, the X-Hvr-Jobs-Last-Updated and
+    X-Hvr-Err-Last-Updated headers of the previous answer, so the hub only
+    returns the jobs that changed. Deleted jobs are not part of such an
+    answer; they are found by fetching all jobs again every ``full_every``
+    seconds, or when the hub sets X-Hvr-Reload-Cache.
+
+    :param client: the Client used for all calls
+    :param hub: name of the hub
+    :param channel: only watch the jobs of this channel (or list of channels)
+    """
+
+    def __init__(self, client, hub, channel=None, full_every=300):
+        self.client = client
+        self.hub = hub
+        self.channel = [channel] if isinstance(channel, str) else channel
+        self.full_every = full_every
+        self.path = pyhvr.pyhvr_routes.ROUTES["get_hubs_jobs"].path.format(hub=hub)
+        self.jobs = None
+        self.jobs_since = None
+        self.err_since = None
+        self.schederr = None
+        self.full_at = 0
+
+    def fetch(self, full):
+        query = {}
+        if self.channel:
+            query["channel"] = self.channel
+        if not full:
+            if self.jobs_since:
+                query["updated_jobs_since"] = self.jobs_since
+            if self.err_since:
+                query["updated_err_since"] = self.err_since
+        rq = self.client.send("GET", self.path, query, {}, None)
+        return (rq.json() if rq.content else None) or {}, rq.headers
+
+    def poll(self):
+        """Fetch the changed jobs; returns the list of change events."""
+        full = self.jobs is None or time.monotonic() >= self.full_at
+        answer, headers = self.fetch(full)
+        if not full and is_true(headers.get("X-Hvr-Reload-Cache")):
+            full = True
+            answer, headers = self.fetch(full)
+        if full:
+            self.full_at = time.monotonic() + self.full_every
+
+        events = self.diff(answer, full)
+        self.jobs_since = headers.get("X-Hvr-Jobs-Last-Updated", self.jobs_since)
+        self.err_since = headers.get("X-Hvr-Err-Last-Updated", self.err_since)
+        schederr = headers.get("X-Hvr-Schederr-Last-Updated")
+        if schederr and self.schederr and schederr != self.schederr:
+            events.append(SchedulerError(schederr))
+        self.schederr = schederr or self.schederr
+        return events
+
+    def diff(self, answer, full):
+        # the first answer is the starting point, it is not reported
+        if self.jobs is None:
+            self.jobs = dict(answer)
+            return []
+        events = []
+        for job, info in sorted(answer.items()):
+            before = self.jobs.get(job)
+            if before is None:
+                events.append(JobAdded(job, info))
+                continue
+            if before.get("state") != info.get("state"):
+                events.append(
+                    JobStateChanged(job, before.get("state"), info.get("state"), info)
+                )
+            error = info.get("log_job_err_tstamp")
+            if error and error != before.get("log_job_err_tstamp"):
+                events.append(JobError(job, error, info))
+        if full:
+            for job in sorted(set(self.jobs) - set(answer)):
+                events.append(JobRemoved(job, self.jobs[job]))
+            self.jobs = dict(answer)
+        else:
+            self.jobs.update(answer)
+        return events
+
+
+def watch_jobs(client, hub, channel=None, poll_min=1.0, poll_max=30.0, full_every=300):
+    """Yield JobAdded, JobRemoved, JobStateChanged, JobError and
+    SchedulerError events of the jobs of a hub as they happen, see JobWatch.
+
+    :param poll_min: seconds between polls while jobs change; while nothing
+        changes the interval doubles up to ``poll_max``
+    :param full_every: seconds between fetches of all jobs, which find
+        deleted jobs
+    """
+    watch = JobWatch(client, hub, channel, full_every)
+    delay = poll_min
+    while True:
+        events = watch.poll()
+        for event in events:
+            yield event
+        delay = poll_min if events else min(poll_max, delay * 2)
+        time.sleep(delay)
@@ -0,0 +1,209 @@
+import collections
+import itertools
+import re
+
+import pyhvr.pyhvr_logs
+
+# Log records start with "<timestamp>: <job>: <error code>: <message>"; the
+# job and the error code (e.g. F_JR071E) are optional. Lines that do not
+# start with a timestamp continue the message of the record before them.
+TSTAMP = rb"(\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d(?:\.\d+)?(?:Z|[+-]\d\d:?\d\d)?): "
+CODE_TEXT = rb"[A-Z]_J[A-Z0-9]+"
+CODE = b"(" + CODE_TEXT + b")"
+# a job is any word before ": " that is not an error code
+JOB_TEXT = rb"(?!" + CODE_TEXT + rb": )[^\s:]+"
+JOB = b"(" + JOB_TEXT + b")"
+
+# Start of the next record, with the timestamp up to the seconds
+NEXT = re.compile(rb"\n(\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d)")
+FIRST = re.compile(rb"(\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d)")
+
+# Severity of the first letter of an error code; records without one are info
+SEVERITY = {b"F": "error", b"E": "error", b"W": "warning", b"I": "info"}
+
+
+def alternatives(values):
+    return b"(" + b"|".join(re.escape(v.encode()) for v in values) + b")"
+
+
+def header(severity=None, codes=None, jobs=None):
+    # Regex of the record header that only matches records passing the
+    # filters, so that the others cost no Python code at all
+    if jobs is None and (severity is not None or codes is not None):
+        # a record without a job must not be tried again with its job
+        # taken as part of the message
+        job = b"(?:" + JOB + b": |(?!" + JOB_TEXT + b": ))"
+    elif jobs is None:
+        job = b"(?:" + JOB + b": )?"
+    else:
+        job = alternatives(jobs) + b": "
+    if codes is not None:
+        code = alternatives(codes) + b": "
+    elif severity is not None:
+        letters = b"".join(k for k, v in SEVERITY.items() if v in severity)
+        code = b"([" + letters + b"]_J[A-Z0-9]+): " if letters else b"()(?!)"
+        if "info" in severity:
+            code = b"(?:" + code + b"|(?!" + CODE_TEXT + b": ))"
+    else:
+        code = b"(?:" + CODE + b": )?"
+    return TSTAMP + job + code
+
+
+class LogRecord(
+    collections.namedtuple("LogRecord", "tstamp job severity code buf start end")
+):
+    """One record of an HVR log. The message is buf[start:end] of the buffer
+    that was parsed; ``raw`` is a memoryview of it, ``message`` decodes it.
+    Neither is made before it is used."""
+
+    __slots__ = ()
+
+    @property
+    def raw(self):
+        return self.buf[self.start : self.end]
+
+    @property
+    def message(self):
+        return str(self.raw, "utf-8", "replace").rstrip("\r\n")
+
+    def __repr__(self):
+        return "LogRecord(%r, %r, %r, %r, %r)" % (
+            self.tstamp,
+            self.job,
+            self.severity,
+            self.code,
+            self.message,
+        )
+
+
+# builds a LogRecord without the Python level namedtuple __new__
+new_record = tuple.__new__
+
+
+def next_record(buf, pos):
+    # offset and timestamp of the first record at or after pos
+    if pos == 0:
+        match = FIRST.match(buf)
+        if match is not None:
+            return 0, match.group(1).replace(b" ", b"T")
+    match = NEXT.search(buf, max(0, pos - 1))
+    if match is None:
+        return len(buf), None
+    return match.start() + 1, match.group(1).replace(b" ", b"T")
+
+
+def seek(buf, tstamp):
+    # offset of the first record at or after tstamp; log records are in
+    # time order, so this is a binary search
+    lo, hi = 0, len(buf)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        found = next_record(buf, mid)[1]
+        if found is None or found[: len(tstamp)] >= tstamp:
+            hi = mid
+        else:
+            lo = mid + 1
+    return next_record(buf, lo)[0]
+
+
+def parse_log(
+    data, severity=None, codes=None, jobs=None, tstamp_begin=None, tstamp_end=None
+):
+    """Yield the LogRecords of HVR log text, e.g. the body of get_hubs_logs
+    or get_hubs_events_log.
+
+    ``data`` is bytes, a memoryview or str; bytes are parsed in place and a
+    record's message is only decoded when it is used. The filters are
+    applied while scanning, before records are built: the time window is
+    found by binary search, the others are part of the regex the records
+    are scanned with.
+
+    :param severity: severities to keep ("error", "warning", "info")
+    :param codes: error codes to keep, e.g. {"F_JR071E"}
+    :param jobs: jobs to keep
+    :param tstamp_begin: keep records from this timestamp on
+    :param tstamp_end: keep records before this timestamp
+
+    Timestamps are compared as text up to the seconds
+    (YYYY-MM-DDTHH:MM:SS), so they have to be in the time zone of the log.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    buf = memoryview(data)
+    begin = 0
+    end = len(buf)
+    if tstamp_begin:
+        begin = seek(buf, tstamp_begin.replace(" ", "T")[:19].encode())
+    if tstamp_end:
+        end = seek(buf, tstamp_end.replace(" ", "T")[:19].encode())
+    if begin >= end:
+        return
+
+    filtered = severity is not None or codes is not None or jobs is not None
+    pattern = header(severity, codes, jobs)
+    matches = re.compile(b"\n" + pattern).finditer(buf, max(0, begin - 1), end)
+    # a record at the very start of the buffer has no newline before it
+    first = re.compile(pattern).match(buf, 0, end) if begin == 0 else None
+    if first is not None:
+        matches = itertools.chain([first], matches)
+
+    if filtered:
+        for match in matches:
+            # the message ends where the next record starts
+            following = NEXT.search(buf, match.end(), end)
+            yield record(buf, match, following.start() if following else end)
+        return
+
+    # without filters every match is a record and ends the one before it
+    previous = None
+    for match in matches:
+        if previous is not None:
+            tstamp, job, code = previous.groups()
+            yield new_record(
+                LogRecord,
+                (
+                    tstamp.decode(),
+                    job and job.decode(),
+                    SEVERITY.get(code[:1], "info") if code else "info",
+                    code and code.decode(),
+                    buf,
+                    previous.end(),
+                    match.start(),
+                ),
+            )
+        previous = match
+    if previous is not None:
+        yield record(buf, previous, end)
+
+
+def record(buf, match, end):
+    tstamp, job, code = match.groups()
+    return new_record(
+        LogRecord,
+        (
+            tstamp.decode(),
+            job and job.decode(),
+            SEVERITY.get(code[:1], "info") if code else "info",
+            code and code.decode(),
+            buf,
+            match.end(),
+            end,
+        ),
+    )
+
+
+def log_records(
+    client,
+    hub,
+    file,
+    severity=None,
+    codes=None,
+    jobs=None,
+    tstamp_begin=None,
+    tstamp_end=None,
+    **query
+):
+    """Fetch a hub log file (get_hubs_logs with ``query``, e.g. offset_begin)
+    and parse its bytes with parse_log()."""
+    rq = pyhvr.pyhvr_logs.get_log(client, hub, file, **query)
+    return parse_log(rq.content, severity, codes, jobs, tstamp_begin, tstamp_end)
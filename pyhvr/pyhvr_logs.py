@@ -0,0 +1,581 @@
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+import requests
+
+import pyhvr.pyhvr_exceptions
+import pyhvr.pyhvr_routes
+
+
+def get_log(client, hub, file, archive=None, stream=False, **query):
+    # get_hubs_logs(_archive), or get_logs(_archive) of the hub server for
+    # hub None, returning the requests.Response for its X-Hvr-Offset-End,
+    # X-Hvr-Head-Crc, ... headers
+    name = "get_logs" if hub is None else "get_hubs_logs"
+    if archive is not None:
+        name += "_archive"
+    path = pyhvr.pyhvr_routes.ROUTES[name].path.format(
+        hub=hub, file=file, archive=archive
+    )
+    query = {k: str(v) for k, v in query.items() if v is not None}
+    return client.send("GET", path, query, {}, None, stream=stream)
+
+
+class LogTail:
+    """Read position in a hub log file, see tail_log().
+
+    Only the bytes after the offset are fetched, at most ``chunk_lines``
+    lines per call. The file's head CRC (X-Hvr-Head-Crc) is sent along; when
+    it changes, or the file got shorter, the file was rotated or truncated:
+    the rest of the rotated file is read from its archive
+    (X-Hvr-Log-Previous) and reading continues at the start of the new file.
+    """
+
+    def __init__(
+        self, client, hub, file, lines=10, chunk_lines=1000, max_line=1024 * 1024
+    ):
+        self.client = client
+        self.hub = hub
+        self.file = file
+        self.lines = lines
+        self.chunk_lines = chunk_lines
+        self.max_line = max_line
+        self.offset = None
+        self.head_crc = None
+        # archive of a rotated file whose rest is still to be read
+        self.archive = None
+        # incomplete last line of the last answer
+        self.pending = ""
+        self.more = False
+        self.rotations = 0
+
+    def read(self):
+        """Fetch the next chunk and return the complete new lines."""
+        if self.offset is None:
+            if self.lines is None:
+                self.offset = 0
+            else:
+                rq = get_log(
+                    self.client,
+                    self.hub,
+                    self.file,
+                    max_lines=self.lines,
+                    search_eof="true",
+                )
+                self.offset = int(rq.headers.get("X-Hvr-Offset-Begin", 0))
+                return self.consume(rq)
+
+        if self.archive is not None:
+            rq = get_log(
+                self.client,
+                self.hub,
+                self.file,
+                archive=self.archive,
+                offset_begin=self.offset,
+                max_lines=self.chunk_lines,
+            )
+            lines = self.consume(rq)
+            if self.more:
+                return lines
+            return lines + self.restart()
+
+        try:
+            rq = get_log(
+                self.client,
+                self.hub,
+                self.file,
+                offset_begin=self.offset,
+                head_crc=self.head_crc,
+                max_lines=self.chunk_lines,
+            )
+        except pyhvr.pyhvr_exceptions.RestError as e:
+            # the hub rejects a head_crc that no longer matches the file
+            if e.status_code != 400 or self.head_crc is None:
+                raise
+            return self.rotated(None)
+        if self.is_rotated(rq):
+            return self.rotated(rq.headers.get("X-Hvr-Log-Previous"))
+        return self.consume(rq)
+
+    def is_rotated(self, rq):
+        crc = rq.headers.get("X-Hvr-Head-Crc")
+        if self.head_crc is not None and crc is not None and crc != self.head_crc:
+            return True
+        size = rq.headers.get("X-Hvr-File-Size")
+        return size is not None and int(size) < self.offset
+
+    def rotated(self, archive):
+        self.rotations += 1
+        self.head_crc = None
+        self.more = True
+        if archive:
+            self.archive = archive
+            return []
+        return self.restart()
+
+    def restart(self):
+        # continue at the start of the new file; the last line of the old
+        # one is complete now
+        self.archive = None
+        self.offset = 0
+        self.more = True
+        return self.flush()
+
+    def consume(self, rq):
+        text = rq.text
+        end = rq.headers.get("X-Hvr-Offset-End")
+        end = int(end) if end is not None else self.offset + len(text.encode())
+        if self.archive is None and rq.headers.get("X-Hvr-Head-Crc"):
+            self.head_crc = rq.headers["X-Hvr-Head-Crc"]
+        size = rq.headers.get("X-Hvr-File-Size")
+        if size is not None:
+            self.more = end < int(size)
+        else:
+            self.more = end > self.offset and text.count("\n") >= self.chunk_lines
+        self.offset = end
+
+        lines = (self.pending + text).split("\n")
+        self.pending = lines.pop()
+        if len(self.pending) > self.max_line:
+            lines.append(self.pending)
+            self.pending = ""
+        return [line.rstrip("\r") for line in lines]
+
+    def flush(self):
+        lines = [self.pending] if self.pending else []
+        self.pending = ""
+        return lines
+
+
+def tail_log(
+    client,
+    hub,
+    file,
+    follow=True,
+    lines=10,
+    chunk_lines=1000,
+    poll_min=0.5,
+    poll_max=10.0,
+):
+    """Yield the lines of a hub log file, e.g. hvr.out, as they are written.
+
+    :param lines: number of existing lines to start with, None for the
+        whole file
+    :param follow: keep waiting for new lines; otherwise stop at the end of
+        the file
+    :param chunk_lines: lines fetched per call, which bounds the memory used
+    :param poll_min: seconds between polls while lines are being written;
+        while the file is idle the interval doubles up to ``poll_max``
+    """
+    tail = LogTail(client, hub, file, lines, chunk_lines)
+    delay = poll_min
+    while True:
+        new = tail.read()
+        for line in new:
+            yield line
+        if tail.more:
+            continue
+        if not follow:
+            for line in tail.flush():
+                yield line
+            return
+        delay = poll_min if new else min(poll_max, delay * 2)
+        time.sleep(delay)
+
+
+LogLine = collections.namedtuple("LogLine", "file line")
+
+# Lines of hvr.out and job logs start with the time they were written
+TSTAMP = re.compile(r"\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d(\.\d+)?")
+
+
+def replication_job(job):
+    # capture and integrate jobs are named {channel}-cap-{loc} and
+    # {channel}-integ-{loc}
+    return "-cap-" in job or "-integ-" in job
+
+
+class LogFollower:
+    """Follows the logs of many jobs of a hub at once.
+
+    The log files ({job}.out) are discovered from get_hubs_jobs, by default
+    those of all capture and integrate jobs; the jobs are looked up again
+    every ``rediscover`` seconds. Each file is read through its own LogTail,
+    so only new bytes are fetched. Files are polled concurrently on a pool of
+    ``max_workers`` threads; a file without new lines is polled less often,
+    up to every ``poll_max`` seconds.
+
+    Iterating yields LogLine(file, line) tuples. The lines of one round of
+    polls are merged in the order of their timestamps. The next round is
+    only polled when the consumer has taken all lines of the current one, so
+    a slow consumer slows down polling instead of filling memory.
+    """
+
+    def __init__(
+        self,
+        client,
+        hub,
+        files=None,
+        jobs=replication_job,
+        max_workers=8,
+        lines=0,
+        chunk_lines=1000,
+        poll_min=0.5,
+        poll_max=10.0,
+        rediscover=60.0,
+    ):
+        self.client = client
+        self.hub = hub
+        self.files = files
+        self.jobs = jobs
+        self.max_workers = max_workers
+        self.lines = lines
+        self.chunk_lines = chunk_lines
+        self.poll_min = poll_min
+        self.poll_max = poll_max
+        self.rediscover = rediscover
+        self.tails = {}
+        # file: (time of its next poll, current poll interval)
+        self.schedule = {}
+        # timestamp of the last line read from each file
+        self.tstamps = {}
+        self.discovered = None
+        # the last error per file, None for the job lookup
+        self.errors = {}
+        self.closed = False
+
+    def discover(self):
+        """Start following new log files; returns the files followed."""
+        if self.files is not None:
+            files = list(self.files)
+        else:
+            jobs = self.client.get_hubs_jobs(hub=self.hub) or {}
+            files = [job + ".out" for job in sorted(jobs) if self.jobs(job)]
+        # the first files start at their end, files found later are read
+        # from the start as they belong to new jobs
+        lines = self.lines if self.discovered is None else None
+        for file in files:
+            if file not in self.tails:
+                self.tails[file] = LogTail(
+                    self.client, self.hub, file, lines, self.chunk_lines
+                )
+                self.schedule[file] = (0, self.poll_min)
+        self.discovered = time.monotonic()
+        return list(self.tails)
+
+    def read(self, file):
+        try:
+            return self.tails[file].read()
+        except pyhvr.pyhvr_exceptions.RestError as e:
+            self.errors[file] = e
+            if e.status_code == 404:
+                # no log (yet); look again when the jobs are rediscovered
+                del self.tails[file]
+                del self.schedule[file]
+            return []
+        except pyhvr.pyhvr_exceptions.PyhvrError as e:
+            self.errors[file] = e
+            return []
+
+    def poll(self, executor):
+        """One round: read all files that are due and return their new lines
+        in timestamp order."""
+        if self.discovered is None:
+            self.discover()
+        elif time.monotonic() - self.discovered >= self.rediscover:
+            try:
+                self.discover()
+            except pyhvr.pyhvr_exceptions.PyhvrError as e:
+                self.errors[None] = e
+                self.discovered = time.monotonic()
+        now = time.monotonic()
+        due = [file for file, (when, _) in self.schedule.items() if when <= now]
+        context = contextvars.copy_context()
+        futures = [executor.submit(context.copy().run, self.read, file) for file in due]
+
+        merged = []
+        for file, future in zip(due, futures):
+            lines = future.result()
+            if file in self.schedule:
+                interval = self.schedule[file][1]
+                if lines or self.tails[file].more:
+                    interval = self.poll_min
+                else:
+                    interval = min(self.poll_max, interval * 2)
+                self.schedule[file] = (now + interval, interval)
+            tstamp = self.tstamps.get(file, "")
+            for line in lines:
+                match = TSTAMP.match(line)
+                if match:
+                    tstamp = match.group(0).replace(" ", "T")
+                merged.append((tstamp, LogLine(file, line)))
+            self.tstamps[file] = tstamp
+        # continuation lines keep the timestamp of the line before them; the
+        # sort is stable, so they stay in place
+        merged.sort(key=lambda item: item[0])
+        return [item[1] for item in merged]
+
+    def __iter__(self):
+        with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+            while not self.closed:
+                lines = self.poll(executor)
+                for line in lines:
+                    yield line
+                    if self.closed:
+                        return
+                if not lines and self.schedule:
+                    wait = (
+                        min(when for when, _ in self.schedule.values())
+                        - time.monotonic()
+                    )
+                    time.sleep(min(max(0, wait), self.poll_max))
+                elif not self.schedule:
+                    time.sleep(self.poll_max)
+
+    def close(self):
+        self.closed = True
+
+
+def archive_name(file, path):
+    # get_hubs_logs_search returns the path of the file holding the offset:
+    # the log file itself or one of its archives
+    name = path.replace("\\", "/").rsplit("/", 1)[-1]
+    return None if name == file else name
+
+
+def read_log_range(client, hub, file, tstamp_begin, tstamp_end=None, chunk_lines=1000):
+    """Yield the lines of a hub log file written from tstamp_begin up to,
+    not including, tstamp_end (None for up to the end of the file).
+
+    Both timestamps are turned into byte offsets with get_hubs_logs_search,
+    then only that window is fetched, ``chunk_lines`` lines per call. A
+    window that starts in an archive of the file continues in the next
+    archive (X-Hvr-Log-Next) and finally in the file itself.
+    """
+    begin = client.get_hubs_logs_search(hub=hub, file=file, search_tstamp=tstamp_begin)
+    if int(begin["offset"]) < 0:
+        return
+    end = None
+    if tstamp_end is not None:
+        end = client.get_hubs_logs_search(hub=hub, file=file, search_tstamp=tstamp_end)
+        if int(end["offset"]) < 0:
+            end = None
+
+    archive = archive_name(file, begin["path"])
+    offset = int(begin["offset"])
+    pending = ""
+    while True:
+        stop = None
+        if end is not None and archive == archive_name(file, end["path"]):
+            stop = int(end["offset"])
+            if offset >= stop:
+                break
+        rq = get_log(
+            client,
+            hub,
+            file,
+            archive=archive,
+            offset_begin=offset,
+            offset_end=stop,
+            max_lines=chunk_lines,
+        )
+        next_offset = int(rq.headers.get("X-Hvr-Offset-End", offset + len(rq.content)))
+        lines = (pending + rq.text).split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line.rstrip("\r")
+
+        if next_offset > offset:
+            offset = next_offset
+        elif archive is not None:
+            # end of this archive, go on with the next one or the file
+            archive = archive_name(file, rq.headers.get("X-Hvr-Log-Next") or file)
+            offset = 0
+            if pending:
+                yield pending
+            pending = ""
+        else:
+            break
+    if pending:
+        yield pending
+
+
+def archive_size(client, hub, file, archive):
+    # the end offset of the last line is the size of the archive
+    rq = get_log(client, hub, file, archive=archive, max_lines=1, search_eof="true")
+    return int(rq.headers["X-Hvr-Offset-End"])
+
+
+class ArchiveDownload:
+    """Download of one log archive in chunks of ``chunk_size`` bytes.
+
+    The data is written to ``path + ".part"``; the chunks that are complete
+    are recorded in ``path + ".part.json"``, so a download that was
+    interrupted continues where it stopped. See download_log_archive().
+    """
+
+    def __init__(
+        self,
+        client,
+        hub,
+        file,
+        archive,
+        path,
+        chunk_size=8 * 1024 * 1024,
+        max_workers=4,
+    ):
+        self.client = client
+        self.hub = hub
+        self.file = file
+        self.archive = archive
+        self.path = path
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.part = path + ".part"
+        self.state_path = path + ".part.json"
+        self.lock = threading.Lock()
+        self.size = None
+        self.done = set()
+
+    def load_state(self):
+        # Chunks completed by an earlier attempt, if it was for the same
+        # archive size and chunk size
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (
+            state.get("size") == self.size
+            and state.get("chunk_size") == self.chunk_size
+            and os.path.exists(self.part)
+        ):
+            self.done = set(state["done"])
+
+    def save_state(self):
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(
+                {
+                    "size": self.size,
+                    "chunk_size": self.chunk_size,
+                    "done": sorted(self.done),
+                },
+                f,
+            )
+        os.replace(tmp, self.state_path)
+
+    def remove_state(self):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.state_path)
+
+    def fetch(self, chunk):
+        # Write bytes [begin, end) of the archive at the same offset of the
+        # part file; a broken connection continues after the bytes written
+        begin = chunk * self.chunk_size
+        end = min(self.size, begin + self.chunk_size)
+        offset = begin
+        attempt = 0
+        with open(self.part, "r+b") as f:
+            while offset < end:
+                f.seek(offset)
+                try:
+                    rq = get_log(
+                        self.client,
+                        self.hub,
+                        self.file,
+                        archive=self.archive,
+                        stream=True,
+                        offset_begin=offset,
+                        offset_end=end,
+                    )
+                    with contextlib.closing(rq):
+                        if int(rq.headers.get("X-Hvr-Offset-Begin", offset)) != offset:
+                            raise pyhvr.pyhvr_exceptions.DownloadError(
+                                message="Archive %s returned data at offset %s instead of %d"
+                                % (
+                                    self.archive,
+                                    rq.headers["X-Hvr-Offset-Begin"],
+                                    offset,
+                                )
+                            )
+                        start = offset
+                        for data in rq.iter_content(64 * 1024):
+                            f.write(data[: max(0, end - offset)])
+                            offset += len(data)
+                        if offset == start:
+                            raise pyhvr.pyhvr_exceptions.DownloadError(
+                                message="Archive %s ends at %d, expected %d bytes"
+                                % (self.archive, offset, self.size)
+                            )
+                        offset = min(offset, end)
+                except requests.RequestException as e:
+                    delay = self.client.retry.delay(attempt)
+                    if delay is None:
+                        raise pyhvr.pyhvr_exceptions.ConnectionError(message=str(e))
+                    time.sleep(delay)
+                    attempt += 1
+        with self.lock:
+            self.done.add(chunk)
+            self.save_state()
+
+    def run(self):
+        self.size = archive_size(self.client, self.hub, self.file, self.archive)
+        self.load_state()
+        if not self.done:
+            with open(self.part, "wb") as f:
+                f.truncate(self.size)
+        chunks = [
+            c
+            for c in range((self.size + self.chunk_size - 1) // self.chunk_size)
+            if c not in self.done
+        ]
+
+        context = contextvars.copy_context()
+        with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+            futures = [
+                executor.submit(context.copy().run, self.fetch, chunk)
+                for chunk in chunks
+            ]
+            for future in futures:
+                future.result()
+
+        # the archive must not have changed while it was downloaded
+        size = archive_size(self.client, self.hub, self.file, self.archive)
+        if size != self.size or os.path.getsize(self.part) != self.size:
+            self.remove_state()
+            raise pyhvr.pyhvr_exceptions.DownloadError(
+                message="Archive %s changed during download: %d bytes, now %d"
+                % (self.archive, self.size, size)
+            )
+        sha256 = hashlib.sha256()
+        with open(self.part, "rb") as f:
+            for data in iter(lambda: f.read(1024 * 1024), b""):
+                sha256.update(data)
+        os.replace(self.part, self.path)
+        self.remove_state()
+        return sha256.hexdigest()
+
+
+def download_log_archive(
+    client, hub, file, archive, path, chunk_size=8 * 1024 * 1024, max_workers=4
+):
+    """Download a log archive of a hub (or of the hub server for hub None)
+    straight to the file ``path``, without holding it in memory.
+
+    The archive is fetched in byte ranges of ``chunk_size`` on ``max_workers``
+    threads. Calling it again after a failure continues with the chunks that
+    are missing. At the end the size is checked against the archive on the
+    hub; returns the SHA-256 hex digest of the downloaded file.
+    """
+    return ArchiveDownload(
+        client, hub, file, archive, path, chunk_size, max_workers
+    ).run()
@@ -0,0 +1,296 @@
+import collections
+import concurrent.futures
+import contextvars
+import csv
+import datetime
+import heapq
+import operator
+import os
+import threading
+
+import pyhvr.pyhvr_deadline
+import pyhvr.pyhvr_exceptions
+import pyhvr.pyhvr_routes
+
+MetricRow = collections.namedtuple(
+    "MetricRow", ["tstamp", "channel", "loc", "table", "metric", "time_gran", "value"]
+)
+
+
+def epoch(tstamp):
+    """Seconds since 1970 of an HVR timestamp; without a zone it is UTC."""
+    text = tstamp.replace(" ", "T")
+    if text.endswith("Z"):
+        text = text[:-1] + "+0000"
+    elif len(text) > 19 and text[-3] == ":" and text[-6] in "+-":
+        text = text[:-3] + text[-2:]
+    if len(text) == 19:
+        text += "+0000"
+    fmt = "%Y-%m-%dT%H:%M:%S.%f%z" if "." in text else "%Y-%m-%dT%H:%M:%S%z"
+    return int(datetime.datetime.strptime(text, fmt).timestamp())
+
+
+def utc_tstamp(seconds):
+    return datetime.datetime.utcfromtimestamp(seconds).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def metric_values(answer):
+    """Yield (channel, loc, table, metric, time_gran, tstamp, value) for each
+    value of a get_hubs_stats_metrics answer, which nests them as
+    metric -> time_gran -> scope -> channel -> loc -> table -> tstamp."""
+    for metric, grans in (answer or {}).items():
+        for time_gran, scopes in grans.items():
+            for channels in scopes.values():
+                for channel, locs in channels.items():
+                    for loc, tables in locs.items():
+                        for table, values in tables.items():
+                            for tstamp, value in values.items():
+                                yield channel, loc, table, metric, time_gran, tstamp, value
+
+
+class MetricsPoller:
+    """Copy of hub statistics that is kept up to date incrementally.
+
+    Each poll() calls get_hubs_stats_metrics with fetch_values and only asks
+    for the metrics updated since the previous answer: updated_logs_since
+    and updated_glob_since are set to the X-Hvr-Logs-Last-Updated and
+    X-Hvr-Glob-Last-Updated headers that answer returned. The values are
+    merged into ``store``, keyed by (channel, loc, table, metric, time_gran),
+    each holding a {tstamp: value} dict. Aggregated scopes use "*" for the
+    channel, loc or table.
+
+    :param client: the Client used for all calls
+    :param hub: name of the hub
+    :param tstamp_begin: oldest values fetched by the first poll
+    :param filters: channel, loc, table, metric, time_gran or scope lists
+        passed on to get_hubs_stats_metrics
+    """
+
+    def __init__(self, client, hub, tstamp_begin=None, **filters):
+        self.client = client
+        self.hub = hub
+        self.tstamp_begin = tstamp_begin
+        self.filters = filters
+        self.store = {}
+        self.logs_since = None
+        self.glob_since = None
+        self.polls = 0
+        self.lock = threading.Lock()
+
+    def query(self):
+        query = {"fetch_values": "true"}
+        query.update((k, v) for k, v in self.filters.items() if v)
+        if self.tstamp_begin:
+            query["tstamp_begin"] = self.tstamp_begin
+        if self.logs_since:
+            query["updated_logs_since"] = self.logs_since
+        if self.glob_since:
+            query["updated_glob_since"] = self.glob_since
+        return query
+
+    def poll(self):
+        """Fetch the values updated since the last poll and merge them into
+        the store; returns the keys that changed."""
+        with self.lock:
+            path = pyhvr.pyhvr_routes.ROUTES["get_hubs_stats_metrics"].path.format(
+                hub=self.hub
+            )
+            rq = self.client.send("GET", path, self.query(), {}, None)
+            changed = set()
+            answer = rq.json() if rq.content else None
+            for (*key, tstamp, value) in metric_values(answer):
+                key = tuple(key)
+                self.store.setdefault(key, {})[tstamp] = value
+                changed.add(key)
+            self.logs_since = rq.headers.get("X-Hvr-Logs-Last-Updated", self.logs_since)
+            self.glob_since = rq.headers.get("X-Hvr-Glob-Last-Updated", self.glob_since)
+            self.polls += 1
+            return changed
+
+    def get(self, channel, loc, table, metric, time_gran):
+        """The {tstamp: value} dict of one metric, empty if not fetched."""
+        return self.store.get((channel, loc, table, metric, str(time_gran)), {})
+
+    def prune(self, tstamp):
+        """Drop the values older than tstamp, so that a long running poller
+        keeps a window of the statistics instead of all of them."""
+        with self.lock:
+            for key in list(self.store):
+                values = self.store[key]
+                for old in [t for t in values if t < tstamp]:
+                    del values[old]
+                if not values:
+                    del self.store[key]
+
+
+def chunks(names, size):
+    if not names or not size:
+        return [names]
+    return [names[i : i + size] for i in range(0, len(names), size)]
+
+
+def retryable(error):
+    if isinstance(error, pyhvr.pyhvr_exceptions.ConnectionError):
+        return True
+    return getattr(error, "status_code", 0) >= 500
+
+
+class MetricsExport:
+    """Statistics of a long period, fetched in shards and merged in time order.
+
+    tstamp_begin..tstamp_end is split into windows of ``window`` seconds
+    and, if given, the channel and table lists into chunks of
+    ``channels_per_shard`` and ``tables_per_shard`` names. Each shard is one
+    get_hubs_stats_metrics(fetch_values=True) call; at most ``max_workers``
+    run at once. A shard that fails is retried on its own up to ``retries``
+    times, one that times out is split in two halves down to ``min_window``
+    seconds. Iterating yields MetricRows in timestamp order while later
+    shards are still being fetched.
+
+    :param filters: loc, metric, time_gran or scope lists passed on to
+        get_hubs_stats_metrics
+    """
+
+    def __init__(
+        self,
+        client,
+        hub,
+        tstamp_begin,
+        tstamp_end,
+        window=86400,
+        channel=None,
+        table=None,
+        channels_per_shard=None,
+        tables_per_shard=None,
+        max_workers=4,
+        retries=2,
+        min_window=3600,
+        **filters
+    ):
+        self.client = client
+        self.hub = hub
+        self.begin = epoch(tstamp_begin)
+        self.end = epoch(tstamp_end)
+        self.window = window
+        self.channel = channel
+        self.table = table
+        self.channels_per_shard = channels_per_shard
+        self.tables_per_shard = tables_per_shard
+        self.max_workers = max_workers
+        self.retries = retries
+        self.min_window = min_window
+        self.filters = {k: v for k, v in filters.items() if v}
+        self.path = pyhvr.pyhvr_routes.ROUTES["get_hubs_stats_metrics"].path.format(
+            hub=hub
+        )
+        self.retried = 0
+        self.splits = 0
+        self.lock = threading.Lock()
+
+    def shards(self):
+        """(begin, end, channels, tables) of each shard, in time order."""
+        return [
+            (start, min(start + self.window, self.end), channels, tables)
+            for start in range(self.begin, self.end, self.window)
+            for channels in chunks(self.channel, self.channels_per_shard)
+            for tables in chunks(self.table, self.tables_per_shard)
+        ]
+
+    def fetch(self, shard):
+        """The values of a shard as (seconds, MetricRow) sorted by time."""
+        begin, end, channels, tables = shard
+        query = dict(self.filters, fetch_values="true")
+        query["tstamp_begin"] = utc_tstamp(begin)
+        query["tstamp_end"] = utc_tstamp(end)
+        if channels:
+            query["channel"] = channels
+        if tables:
+            query["table"] = tables
+        attempt = 0
+        while True:
+            try:
+                rq = self.client.send("GET", self.path, query, {}, None)
+                answer = rq.json() if rq.content else None
+                break
+            except pyhvr.pyhvr_exceptions.TimeoutError:
+                # a deadline that ran out is not helped by smaller calls
+                if end - begin <= self.min_window or not pyhvr.pyhvr_deadline.allows(0):
+                    raise
+                # too much for one call, fetch both halves instead
+                with self.lock:
+                    self.splits += 1
+                middle = (begin + end) // 2
+                return self.fetch((begin, middle, channels, tables)) + self.fetch(
+                    (middle, end, channels, tables)
+                )
+            except pyhvr.pyhvr_exceptions.PyhvrError as e:
+                if attempt >= self.retries or not retryable(e):
+                    raise
+                attempt += 1
+                with self.lock:
+                    self.retried += 1
+
+        rows = []
+        seconds = {}
+        for value in metric_values(answer):
+            tstamp = value[5]
+            if tstamp not in seconds:
+                seconds[tstamp] = epoch(tstamp)
+            # the windows of the shards must not overlap at their bounds
+            if begin <= seconds[tstamp] < end:
+                rows.append((seconds[tstamp], MetricRow(tstamp, *value[:5], value[6])))
+        rows.sort(key=operator.itemgetter(0))
+        return rows
+
+    def __iter__(self):
+        shards = iter(self.shards())
+        pending = collections.deque()
+        context = contextvars.copy_context()
+        with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+
+            def submit():
+                shard = next(shards, None)
+                if shard is not None:
+                    future = executor.submit(context.copy().run, self.fetch, shard)
+                    pending.append((shard[0], future))
+
+            # a few shards ahead, so that memory stays bounded
+            for _ in range(2 * self.max_workers):
+                submit()
+            try:
+                while pending:
+                    # the shards of one window are merged, windows follow each other
+                    window = pending[0][0]
+                    results = []
+                    while pending and pending[0][0] == window:
+                        results.append(pending.popleft()[1].result())
+                        submit()
+                    for _, row in heapq.merge(*results, key=operator.itemgetter(0)):
+                        yield row
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def write(self, path):
+        """Write all rows as CSV with a header line to ``path``; returns the
+        number of rows. The file only appears once the export is complete."""
+        part = path + ".part"
+        rows = 0
+        with open(part, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(MetricRow._fields)
+            for row in self:
+                writer.writerow(row)
+                rows += 1
+        os.replace(part, path)
+        return rows
+
+
+def export_metrics(client, hub, tstamp_begin, tstamp_end, path=None, **kwargs):
+    """Fetch the statistics between two timestamps in parallel shards, see
+    MetricsExport. With ``path`` they are written there as CSV and the
+    number of rows is returned, otherwise an iterator of MetricRows."""
+    export = MetricsExport(client, hub, tstamp_begin, tstamp_end, **kwargs)
+    if path is not None:
+        return export.write(path)
+    return iter(export)
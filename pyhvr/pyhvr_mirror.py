@@ -0,0 +1,402 @@
+import threading
+
+import pyhvr.pyhvr_routes
+
+
+def loc_entry(body):
+    return {
+        "props": dict(body.get("props") or {}),
+        "actions": list(body.get("actions") or []),
+    }
+
+
+def channel_entry(body):
+    return {
+        "description": body.get("description", ""),
+        "loc_groups": dict(body.get("loc_groups") or {}),
+        "tables": dict(body.get("tables") or {}),
+        "actions": list(body.get("actions") or []),
+    }
+
+
+def table_entry(body):
+    entry = {k: body[k] for k in ("base_name", "table_group") if k in body}
+    entry["cols"] = dict(body.get("cols") or {})
+    return entry
+
+
+def remove_all(items, removed):
+    items[:] = [item for item in items if item not in removed]
+
+
+def update_each(objects, updates):
+    # objects not known yet are added, known ones updated
+    for name, update in updates.items():
+        objects.setdefault(name, {}).update(update)
+
+
+def rename(objects, name, new_name):
+    objects[new_name] = objects.pop(name)
+
+
+# The functions below apply one kind of change returned by
+# get_hubs_definition_change_events (see APPLY) to a definition d as returned
+# by get_hubs_definition; b is the body of the change.
+
+
+def loc_of(d, b):
+    return d["locs"][b["loc"]]
+
+
+def channel_of(d, b):
+    return d["channels"][b["channel"]]
+
+
+def members_of(d, b):
+    return channel_of(d, b)["loc_groups"][b["loc_group"]].setdefault("members", [])
+
+
+def table_of(d, b):
+    return channel_of(d, b)["tables"][b["table"]]
+
+
+def add_loc(d, b):
+    d["locs"][b["loc"]] = loc_entry(b)
+
+
+def delete_loc(d, b):
+    del d["locs"][b["loc"]]
+
+
+def rename_loc(d, b):
+    rename(d["locs"], b["loc"], b["new_name"])
+    for channel in d["channels"].values():
+        for group in channel["loc_groups"].values():
+            members = group.get("members", [])
+            group["members"] = [b["new_name"] if m == b["loc"] else m for m in members]
+
+
+def add_loc_props(d, b):
+    loc_of(d, b)["props"].update(b["props"])
+
+
+def replace_loc_props(d, b):
+    loc_of(d, b)["props"] = dict(b["props"])
+
+
+def delete_loc_props(d, b):
+    for prop in b["props"]:
+        loc_of(d, b)["props"].pop(prop, None)
+
+
+def add_loc_actions(d, b):
+    loc_of(d, b)["actions"].extend(b["actions"])
+
+
+def replace_loc_action_list(d, b):
+    loc_of(d, b)["actions"] = list(b["actions"])
+
+
+def delete_loc_actions(d, b):
+    remove_all(loc_of(d, b)["actions"], b["actions"])
+
+
+def add_channel(d, b):
+    d["channels"][b["channel"]] = channel_entry(b)
+
+
+def modify_channel(d, b):
+    channel_of(d, b)["description"] = b["description"]
+
+
+def delete_channel(d, b):
+    del d["channels"][b["channel"]]
+
+
+def rename_channel(d, b):
+    rename(d["channels"], b["channel"], b["new_name"])
+
+
+def add_loc_group(d, b):
+    channel_of(d, b)["loc_groups"][b["loc_group"]] = {
+        "members": list(b.get("members") or [])
+    }
+
+
+def delete_loc_group(d, b):
+    del channel_of(d, b)["loc_groups"][b["loc_group"]]
+
+
+def rename_loc_group(d, b):
+    rename(channel_of(d, b)["loc_groups"], b["loc_group"], b["new_name"])
+
+
+def add_loc_group_members(d, b):
+    members = members_of(d, b)
+    members.extend(m for m in b["members"] if m not in members)
+
+
+def replace_loc_group_member_list(d, b):
+    members_of(d, b)[:] = b["members"]
+
+
+def delete_loc_group_members(d, b):
+    remove_all(members_of(d, b), b["members"])
+
+
+def add_tables(d, b):
+    channel_of(d, b)["tables"].update(b["tables"])
+
+
+def modify_table_list(d, b):
+    update_each(channel_of(d, b)["tables"], b["tables"])
+
+
+def replace_table_list(d, b):
+    channel_of(d, b)["tables"] = dict(b["tables"])
+
+
+def delete_tables(d, b):
+    for table in b["tables"]:
+        del channel_of(d, b)["tables"][table]
+
+
+def add_table(d, b):
+    channel_of(d, b)["tables"][b["table"]] = table_entry(b)
+
+
+def modify_table(d, b):
+    table_of(d, b).update({k: b[k] for k in ("base_name", "table_group") if k in b})
+
+
+def rename_table(d, b):
+    rename(channel_of(d, b)["tables"], b["table"], b["new_name"])
+
+
+def add_cols(d, b):
+    table_of(d, b).setdefault("cols", {}).update(b["cols"])
+
+
+def modify_col_list(d, b):
+    update_each(table_of(d, b).setdefault("cols", {}), b["cols"])
+
+
+def replace_col_list(d, b):
+    table_of(d, b)["cols"] = dict(b["cols"])
+
+
+def delete_cols(d, b):
+    for col in b["cols"]:
+        del table_of(d, b)["cols"][col]
+
+
+def add_channel_actions(d, b):
+    channel_of(d, b)["actions"].extend(b["actions"])
+
+
+def replace_channel_action_list(d, b):
+    channel_of(d, b)["actions"] = list(b["actions"])
+
+
+def delete_channel_actions(d, b):
+    remove_all(channel_of(d, b)["actions"], b["actions"])
+
+
+def add_hub_actions(d, b):
+    d["hub_actions"].extend(b.get("actions") or [])
+
+
+def replace_hub_action_list(d, b):
+    d["hub_actions"] = list(b["actions"])
+
+
+def delete_hub_actions(d, b):
+    remove_all(d["hub_actions"], b["actions"])
+
+
+def find_action(d, spec):
+    # the action list and index of the action matching type, loc_scope,
+    # table_scope and params of spec, in the channel's or the hub's actions
+    if spec.get("channel"):
+        actions = d["channels"][spec["channel"]]["actions"]
+    else:
+        actions = d["hub_actions"]
+    for i, action in enumerate(actions):
+        if all(action.get(k) == v for k, v in spec.items() if k != "channel"):
+            return actions, i
+    raise KeyError(spec)
+
+
+def modify_action(d, b):
+    actions, i = find_action(d, dict(b["old"], type=b["type"]))
+    new = {k: v for k, v in b["new"].items() if k != "channel"}
+    params = dict(actions[i].get("params") or {}, **new.pop("params", {}))
+    actions[i].update(new, params=params)
+
+
+def replace_action(d, b):
+    actions, i = find_action(d, dict(b["old"], type=b["type"]))
+    new = {k: v for k, v in b["new"].items() if k != "channel"}
+    actions[i] = dict(new, type=b["type"])
+
+
+APPLY = {
+    "add_loc": add_loc,
+    "replace_loc": add_loc,
+    "delete_loc": delete_loc,
+    "rename_loc": rename_loc,
+    "add_loc_props": add_loc_props,
+    "replace_loc_props": replace_loc_props,
+    "modify_loc_props": add_loc_props,
+    "delete_loc_props": delete_loc_props,
+    "add_loc_actions": add_loc_actions,
+    "replace_loc_action_list": replace_loc_action_list,
+    "delete_loc_actions": delete_loc_actions,
+    "add_channel": add_channel,
+    "replace_channel": add_channel,
+    "modify_channel": modify_channel,
+    "delete_channel": delete_channel,
+    "rename_channel": rename_channel,
+    "add_loc_group": add_loc_group,
+    "replace_loc_group": add_loc_group,
+    "delete_loc_group": delete_loc_group,
+    "rename_loc_group": rename_loc_group,
+    "add_loc_group_members": add_loc_group_members,
+    "replace_loc_group_member_list": replace_loc_group_member_list,
+    "delete_loc_group_members": delete_loc_group_members,
+    "add_tables": add_tables,
+    "modify_table_list": modify_table_list,
+    "replace_table_list": replace_table_list,
+    "delete_tables": delete_tables,
+    "add_table": add_table,
+    "replace_table": add_table,
+    "modify_table": modify_table,
+    "rename_table": rename_table,
+    "add_cols": add_cols,
+    "modify_col_list": modify_col_list,
+    "replace_col_list": replace_col_list,
+    "delete_cols": delete_cols,
+    "add_channel_actions": add_channel_actions,
+    "replace_channel_action_list": replace_channel_action_list,
+    "delete_channel_actions": delete_channel_actions,
+    "add_hub_actions": add_hub_actions,
+    "replace_hub_action_list": replace_hub_action_list,
+    "delete_hub_actions": delete_hub_actions,
+    "modify_action": modify_action,
+    "replace_action": replace_action,
+}
+
+
+def apply_change(definition, change):
+    """Apply one change of get_hubs_definition_change_events to a definition.
+    Raises KeyError for changes that do not fit the definition."""
+    ((kind, body),) = change.items()
+    APPLY[kind](definition, body)
+
+
+class DefinitionMirror:
+    """Local copy of a hub definition that is kept up to date incrementally.
+
+    load() fetches the whole definition once, refresh() then applies only
+    the changes made since: it lists the events since the last one seen
+    (get_hubs_events with ev_tstamp_begin) and fetches their changes with
+    get_hubs_definition_change_events(ev_id=...). The watermark starts at
+    the view timestamp the hub returns with the definition
+    (X-Hvr-View-Tstamp, the cache_view_tstamp of this copy).
+
+    A change that cannot be applied, e.g. because the hub purged old events,
+    makes refresh() load the whole definition again. Lookups return the
+    objects of the copy itself, they must not be modified.
+
+    :param client: the Client used for all calls
+    :param hub: name of the hub
+    :param ids_per_call: event ids fetched per get_hubs_definition_change_events call
+    """
+
+    def __init__(self, client, hub, ids_per_call=50):
+        self.client = client
+        self.hub = hub
+        self.ids_per_call = ids_per_call
+        self.definition = None
+        self.view_tstamp = None
+        # the applied event at the watermark, ev_tstamp_begin returns it again
+        self.seen = set()
+        self.loads = 0
+        self.changes = 0
+        self.lock = threading.RLock()
+
+    def load(self):
+        with self.lock:
+            clock = self.client.get_hubserver_clock()["clock"]
+            path = pyhvr.pyhvr_routes.ROUTES["get_hubs_definition"].path.format(
+                hub=self.hub
+            )
+            rq = self.client.send("GET", path, {}, {}, None)
+            definition = (rq.json() if rq.content else None) or {}
+            for key in ("locs", "channels"):
+                definition.setdefault(key, {})
+            definition.setdefault("hub_actions", [])
+            self.definition = definition
+            self.view_tstamp = rq.headers.get("X-Hvr-View-Tstamp", clock)
+            self.seen = set()
+            self.loads += 1
+
+    def refresh(self):
+        """Bring the copy up to date; returns the number of changes applied."""
+        with self.lock:
+            if self.definition is None:
+                self.load()
+                return 0
+            events = (
+                self.client.get_hubs_events(
+                    hub=self.hub, ev_tstamp_begin=self.view_tstamp
+                )
+                or {}
+            )
+            ev_ids = sorted(ev_id for ev_id in events if ev_id not in self.seen)
+            if not ev_ids:
+                return 0
+
+            changes = []
+            for i in range(0, len(ev_ids), self.ids_per_call):
+                chunk = ev_ids[i : i + self.ids_per_call]
+                answer = self.client.get_hubs_definition_change_events(
+                    hub=self.hub, ev_id=chunk
+                )
+                changes.extend((answer or {}).get("changes", []))
+            try:
+                for change in changes:
+                    apply_change(self.definition, change)
+            except (KeyError, ValueError, IndexError):
+                # half applied changes leave the copy inconsistent
+                self.load()
+                return len(changes)
+
+            self.view_tstamp = ev_ids[-1]
+            self.seen = {ev_ids[-1]}
+            self.changes += len(changes)
+            return len(changes)
+
+    def channels(self):
+        with self.lock:
+            return list(self.definition["channels"])
+
+    def locs(self):
+        with self.lock:
+            return list(self.definition["locs"])
+
+    def channel(self, channel):
+        with self.lock:
+            return self.definition["channels"][channel]
+
+    def loc(self, loc):
+        with self.lock:
+            return self.definition["locs"][loc]
+
+    def tables(self, channel):
+        with self.lock:
+            return self.definition["channels"][channel]["tables"]
+
+    def table(self, channel, table):
+        with self.lock:
+            return self.definition["channels"][channel]["tables"][table]
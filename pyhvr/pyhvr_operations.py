@@ -0,0 +1,218 @@
+import concurrent.futures
+import threading
+import time
+import weakref
+
+import pyhvr.pyhvr_events
+import pyhvr.pyhvr_exceptions
+
+# Operations that start an event, whose handles finish with it
+OPERATIONS = (
+    "post_hubs_channels_refresh",
+    "post_hubs_channels_compare",
+    "post_hubs_channels_activate",
+    "post_hubs_channels_deactivate",
+    "post_hubs_snapshot",
+)
+
+# HvrOperations are futures, so these work on them as they are
+wait = concurrent.futures.wait
+as_completed = concurrent.futures.as_completed
+FIRST_COMPLETED = concurrent.futures.FIRST_COMPLETED
+ALL_COMPLETED = concurrent.futures.ALL_COMPLETED
+
+
+class HvrOperation(concurrent.futures.Future):
+    """Handle of a hub operation that runs as an event, e.g. a refresh.
+
+    A concurrent.futures.Future: result() returns the finished event (with
+    its results) once it is DONE, raises EventFailed when it FAILED and
+    CancelledError when it was canceled. An operation that does not start
+    an event, like post_hubs_snapshot, is finished right away with the
+    answer of the call.
+
+    :ivar answer: what the call returned, e.g. job and posted_ev_id
+    :ivar ev_id: the event, None if there is none
+    """
+
+    def __init__(self, client, hub, answer):
+        concurrent.futures.Future.__init__(self)
+        self.client = client
+        self.hub = hub
+        self.answer = answer
+        self.ev_id = (answer or {}).get("posted_ev_id")
+        self.job = (answer or {}).get("job")
+        self.lock = threading.Lock()
+
+    def finish(self, event):
+        with self.lock:
+            if self.done():
+                return
+            state = event.get("state")
+            if state == "DONE":
+                self.set_result(event)
+            elif state == "CANCELED":
+                concurrent.futures.Future.cancel(self)
+                # so that wait() and as_completed() see it finished
+                self.set_running_or_notify_cancel()
+            else:
+                self.set_exception(
+                    pyhvr.pyhvr_exceptions.EventFailed(
+                        message="Event %s %s: %s"
+                        % (self.ev_id, state, event.get("response", "")),
+                        event=event,
+                    )
+                )
+
+    def fail(self, error):
+        with self.lock:
+            if not self.done():
+                self.set_exception(error)
+
+    def cancel(self):
+        """Cancel the event on the hub (post_hubs_events_cancel); returns
+        False if it had already finished."""
+        with self.lock:
+            if self.done():
+                return False
+            if self.ev_id is not None:
+                try:
+                    self.client.post_hubs_events_cancel(
+                        hub=self.hub, ev_ids=[self.ev_id]
+                    )
+                except pyhvr.pyhvr_exceptions.RestError as e:
+                    # only ACTIVE events can be canceled, the poller
+                    # reports how it ended
+                    if e.status_code == 400:
+                        return False
+                    raise
+            canceled = concurrent.futures.Future.cancel(self)
+            self.set_running_or_notify_cancel()
+            return canceled
+
+
+class EventPoller:
+    """One background thread that finishes the HvrOperations of a client.
+
+    Each cycle fetches all unfinished events of a hub with one
+    get_hubs_events call (ids_per_call at most). The interval grows from
+    ``poll_min`` to ``poll_max`` while nothing finishes. A PyhvrError is
+    tried again the next cycle; any other error fails the unfinished
+    operations. The thread only runs while there are unfinished operations.
+    """
+
+    def __init__(self, client, poll_min=0.5, poll_max=10.0, ids_per_call=100):
+        self.client = client
+        self.poll_min = poll_min
+        self.poll_max = poll_max
+        self.ids_per_call = ids_per_call
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.thread = None
+        self.polls = 0
+        self.errors = 0
+
+    def add(self, operation):
+        with self.lock:
+            key = (operation.hub, operation.ev_id)
+            self.pending.setdefault(key, []).append(operation)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+        self.wakeup.set()
+
+    def run(self):
+        try:
+            self.loop()
+        except Exception as e:
+            # e.g. the hub is unreachable or answers no JSON: the operations
+            # fail with it, and the next one starts a new thread
+            with self.lock:
+                operations = [op for ops in self.pending.values() for op in ops]
+                self.pending.clear()
+                self.thread = None
+            for operation in operations:
+                operation.fail(e)
+
+    def loop(self):
+        delay = self.poll_min
+        next_poll = time.monotonic() + delay
+        while True:
+            if self.wakeup.wait(max(0, next_poll - time.monotonic())):
+                # new operations are polled soon, not at the longest interval
+                self.wakeup.clear()
+                delay = self.poll_min
+                next_poll = min(next_poll, time.monotonic() + delay)
+                continue
+            with self.lock:
+                for key, operations in list(self.pending.items()):
+                    operations[:] = [op for op in operations if not op.done()]
+                    if not operations:
+                        del self.pending[key]
+                if not self.pending:
+                    self.thread = None
+                    return
+                hubs = {}
+                for hub, ev_id in self.pending:
+                    hubs.setdefault(hub, []).append(ev_id)
+            finished = sum(self.poll(hub, ev_ids) for hub, ev_ids in hubs.items())
+            delay = self.poll_min if finished else min(self.poll_max, delay * 2)
+            next_poll = time.monotonic() + delay
+
+    def poll(self, hub, ev_ids):
+        # returns the number of events that finished
+        self.polls += 1
+        events = {}
+        try:
+            for i in range(0, len(ev_ids), self.ids_per_call):
+                answer = self.client.get_hubs_events(
+                    hub=hub, ev_id=ev_ids[i : i + self.ids_per_call], fetch_results=True
+                )
+                events.update(answer or {})
+        except pyhvr.pyhvr_exceptions.PyhvrError:
+            # tried again next cycle
+            self.errors += 1
+            return 0
+        finished = 0
+        for ev_id in ev_ids:
+            event = events.get(ev_id)
+            if event is not None and not pyhvr.pyhvr_events.is_final(event):
+                continue
+            with self.lock:
+                operations = self.pending.pop((hub, ev_id), [])
+            for operation in operations:
+                if event is None:
+                    operation.fail(
+                        pyhvr.pyhvr_exceptions.RestError(
+                            status_code=404, message="Event not found: %s" % ev_id
+                        )
+                    )
+                else:
+                    operation.finish(event)
+            finished += 1
+        return finished
+
+
+pollers = weakref.WeakKeyDictionary()
+pollers_lock = threading.Lock()
+
+
+def event_poller(client):
+    """The EventPoller shared by all operations of a client."""
+    with pollers_lock:
+        if client not in pollers:
+            pollers[client] = EventPoller(client)
+        return pollers[client]
+
+
+def submit(client, name, **kwargs):
+    """Call the operation ``name`` (one of OPERATIONS, or any other call that
+    returns a posted_ev_id) with ``kwargs`` and return its HvrOperation."""
+    answer = getattr(client, name)(**kwargs)
+    operation = HvrOperation(client, kwargs["hub"], answer)
+    if operation.ev_id is None:
+        operation.set_result(answer)
+    else:
+        event_poller(client).add(operation)
+    return operation
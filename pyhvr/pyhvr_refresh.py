@@ -0,0 +1,260 @@
+import collections
+import concurrent.futures
+import time
+
+import pyhvr.pyhvr_exceptions
+import pyhvr.pyhvr_operations
+
+
+class RefreshBatch:
+    """Tables of one channel refreshed from source_loc to target_loc by one
+    refresh event; ``kwargs`` are further post_hubs_channels_refresh
+    arguments of this batch."""
+
+    def __init__(self, channel, source_loc, target_loc, tables, kwargs=None):
+        self.channel = channel
+        self.source_loc = source_loc
+        self.target_loc = target_loc
+        self.tables = list(tables)
+        self.kwargs = dict(kwargs or {})
+        self.attempts = 0
+        self.operation = None
+        self.error = None
+        self.started = None
+        self.finished = None
+
+    @property
+    def locs(self):
+        return {self.source_loc, self.target_loc}
+
+    def __repr__(self):
+        return "RefreshBatch(%r, %r, %r, %d tables)" % (
+            self.channel,
+            self.source_loc,
+            self.target_loc,
+            len(self.tables),
+        )
+
+
+def plan_batches(plan, tables_per_batch=50):
+    """RefreshBatches of a plan of (channel, source_loc, target_loc, tables)
+    entries, at most ``tables_per_batch`` tables each. An entry may have a
+    fifth element, a dict of post_hubs_channels_refresh arguments."""
+    batches = []
+    for entry in plan:
+        channel, source_loc, target_loc, tables = entry[:4]
+        kwargs = entry[4] if len(entry) > 4 else None
+        tables = list(tables)
+        for i in range(0, len(tables), tables_per_batch):
+            batches.append(
+                RefreshBatch(
+                    channel,
+                    source_loc,
+                    target_loc,
+                    tables[i : i + tables_per_batch],
+                    kwargs,
+                )
+            )
+    return batches
+
+
+class RefreshScheduler:
+    """Runs refresh batches of a hub within concurrency limits.
+
+    A batch is started (post_hubs_channels_refresh with its tables) when
+    fewer than ``max_per_loc`` refreshes run on its source and on its
+    target location, and fewer than ``max_per_hub`` on the hub; otherwise
+    the next batch in the queue that fits is started. Batches of the same
+    channel, source and target run one at a time, as they would be the
+    same refresh job, unless each has a ``task`` of its own. Completions are
+    tracked through the events of the refreshes (see pyhvr_operations). A
+    batch that fails, or that cannot be started because the call fails, is
+    put at the end of the queue again, at most ``retries`` times. When no
+    batch could be started, the next try waits ``retry_delay`` seconds,
+    doubled after each failed round. A canceled batch is not run again.
+
+    :param batches: RefreshBatches, e.g. from plan_batches()
+    :param operation: the call that starts a batch, post_hubs_channels_compare
+        runs compares the same way
+    :param refresh_kwargs: post_hubs_channels_refresh arguments of all
+        batches, e.g. parallel_sessions=4, quota_run=8
+    """
+
+    def __init__(
+        self,
+        client,
+        hub,
+        batches,
+        max_per_loc=2,
+        max_per_hub=8,
+        retries=2,
+        operation="post_hubs_channels_refresh",
+        retry_delay=1.0,
+        **refresh_kwargs
+    ):
+        self.client = client
+        self.hub = hub
+        self.queue = collections.deque(batches)
+        self.max_per_loc = max_per_loc
+        self.max_per_hub = max_per_hub
+        self.retries = retries
+        self.operation = operation
+        self.retry_delay = retry_delay
+        self.refresh_kwargs = refresh_kwargs
+        self.running = {}
+        self.done = []
+        self.failed = []
+        self.retried = 0
+        self.began = None
+        self.ended = None
+
+    def loc_load(self):
+        load = collections.Counter()
+        for batch in self.running.values():
+            load.update(batch.locs)
+        return load
+
+    def job(self, batch):
+        # the refresh job a batch runs as: {channel}-{task}-{source}-{target}
+        task = batch.kwargs.get("task", self.refresh_kwargs.get("task"))
+        return (batch.channel, batch.source_loc, batch.target_loc, task)
+
+    def fits(self, batch, load, jobs):
+        return (
+            len(self.running) < self.max_per_hub
+            and self.job(batch) not in jobs
+            and all(load[loc] < self.max_per_loc for loc in batch.locs)
+        )
+
+    def start(self, batch):
+        batch.attempts += 1
+        batch.started = time.monotonic()
+        kwargs = dict(self.refresh_kwargs, **batch.kwargs)
+        try:
+            batch.operation = pyhvr.pyhvr_operations.submit(
+                self.client,
+                self.operation,
+                hub=self.hub,
+                channel=batch.channel,
+                source_loc=batch.source_loc,
+                target_loc=batch.target_loc,
+                tables=batch.tables,
+                **kwargs
+            )
+        except pyhvr.pyhvr_exceptions.PyhvrError as e:
+            self.finish(batch, e)
+            return
+        self.running[batch.operation] = batch
+
+    def start_ready(self):
+        # in queue order, skipping batches whose locations or job are busy
+        load = self.loc_load()
+        jobs = {self.job(batch) for batch in self.running.values()}
+        for batch in list(self.queue):
+            if len(self.running) >= self.max_per_hub:
+                return
+            if self.fits(batch, load, jobs):
+                self.queue.remove(batch)
+                self.start(batch)
+                load.update(batch.locs)
+                jobs.add(self.job(batch))
+
+    def finish(self, batch, error):
+        batch.finished = time.monotonic()
+        batch.error = error
+        if error is None:
+            self.done.append(batch)
+        elif batch.attempts <= self.retries and not isinstance(
+            error, concurrent.futures.CancelledError
+        ):
+            self.retried += 1
+            self.queue.append(batch)
+        else:
+            self.failed.append(batch)
+
+    def run(self, timeout=None):
+        """Run all batches; returns report(). With ``timeout`` it returns
+        after that many seconds at the latest, running refreshes go on and
+        run() can be called again."""
+        if self.began is None:
+            self.began = time.monotonic()
+        end = None if timeout is None else time.monotonic() + timeout
+        delay = self.retry_delay
+        while True:
+            self.start_ready()
+            left = None if end is None else end - time.monotonic()
+            if not self.running:
+                if not self.queue:
+                    break
+                if not any(
+                    self.fits(batch, collections.Counter(), set())
+                    for batch in self.queue
+                ):
+                    # nothing can start, e.g. max_per_loc is 0
+                    raise ValueError("Batches cannot start within the limits")
+                # the batches failed to start, e.g. the hub answered 503
+                if left is not None and left <= 0:
+                    return self.report()
+                time.sleep(delay if left is None else min(delay, left))
+                delay *= 2
+                continue
+            delay = self.retry_delay
+            if left is not None and left <= 0:
+                return self.report()
+            finished, _ = pyhvr.pyhvr_operations.wait(
+                list(self.running),
+                timeout=left,
+                return_when=pyhvr.pyhvr_operations.FIRST_COMPLETED,
+            )
+            for operation in finished:
+                batch = self.running.pop(operation)
+                try:
+                    operation.result()
+                    error = None
+                except Exception as e:
+                    error = e
+                self.finish(batch, error)
+        self.ended = time.monotonic()
+        return self.report()
+
+    def report(self):
+        """Progress and throughput: batches and tables done, failed, running
+        and queued, retries, elapsed seconds and tables per minute."""
+        elapsed = ((self.ended or time.monotonic()) - self.began) if self.began else 0
+        tables_done = sum(len(batch.tables) for batch in self.done)
+        return {
+            "done": len(self.done),
+            "failed": len(self.failed),
+            "running": len(self.running),
+            "queued": len(self.queue),
+            "retried": self.retried,
+            "tables_done": tables_done,
+            "tables_failed": sum(len(batch.tables) for batch in self.failed),
+            "elapsed": elapsed,
+            "tables_per_minute": tables_done * 60 / elapsed if elapsed else 0.0,
+        }
+
+
+def refresh_plan(
+    client,
+    hub,
+    plan,
+    tables_per_batch=50,
+    max_per_loc=2,
+    max_per_hub=8,
+    retries=2,
+    **refresh_kwargs
+):
+    """Refresh the tables of a plan of (channel, source_loc, target_loc,
+    tables) entries in batches within concurrency limits and return the
+    report, see RefreshScheduler."""
+    scheduler = RefreshScheduler(
+        client,
+        hub,
+        plan_batches(plan, tables_per_batch),
+        max_per_loc,
+        max_per_hub,
+        retries,
+        **refresh_kwargs
+    )
+    return scheduler.run()
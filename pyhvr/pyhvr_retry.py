@@ -0,0 +1,106 @@
+import email.utils
+import random
+import threading
+import time
+
+
+class RetryBudget:
+    """Caps retries to a fraction of the requests sent.
+
+    Every request deposits ``ratio`` tokens (up to ``max_tokens``), every
+    retry takes one. When a hub is down for good the budget runs dry and
+    calls fail fast instead of multiplying the load on it.
+    """
+
+    def __init__(self, ratio=0.2, min_tokens=10, max_tokens=100):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = min_tokens
+        self.lock = threading.Lock()
+
+    def deposit(self):
+        with self.lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self):
+        with self.lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    :param retries: maximum number of retries per call
+    :param backoff: delay before the first retry; it doubles on every retry
+    :param backoff_max: upper bound of a single delay, also the longest
+        ``Retry-After`` that is honored (a longer one fails the call)
+    :param jitter: randomize the delay between 0 and the backoff ("full
+        jitter"), so that many clients do not retry in lockstep
+    :param statuses: HTTP statuses that are retried
+    :param verbs: verbs that are always retried; other operations are only
+        retried when the route is flagged retry_safe
+    :param budget: RetryBudget shared by all calls using this policy
+    """
+
+    def __init__(
+        self,
+        retries=3,
+        backoff=0.5,
+        backoff_max=30.0,
+        jitter=True,
+        statuses=(429, 502, 503, 504),
+        verbs=("GET", "PUT", "DELETE"),
+        budget=None,
+    ):
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.statuses = statuses
+        self.verbs = verbs
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def retryable(self, verb, retry_safe):
+        return retry_safe or verb in self.verbs
+
+    def delay(self, attempt, status_code=None, retry_after=None):
+        """Seconds to wait before retry number ``attempt`` (0-based), or None
+        if the call should fail now. status_code is None for connection
+        errors."""
+        if attempt >= self.retries:
+            return None
+        if status_code is not None and status_code not in self.statuses:
+            return None
+
+        backoff = min(self.backoff_max, self.backoff * (2**attempt))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+
+        wait = parse_retry_after(retry_after)
+        if wait is not None:
+            if wait > self.backoff_max:
+                return None
+            backoff = max(backoff, wait)
+
+        if not self.budget.withdraw():
+            return None
+        return backoff
+
+
+def parse_retry_after(value):
+    # Retry-After is either delta-seconds or an HTTP date
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(
+            0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        )
+    except (TypeError, ValueError):
+        return None
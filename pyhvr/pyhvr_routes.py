@@ -0,0 +1,3369 @@
+import collections
+
+# Generated by generate.py from the OpenAPI spec, one Route per operation.
+# signature is the method's parameter list, query is (param, is_bool) pairs,
+# headers is (param, header) pairs and body is None (no request body), "**"
+# (the keyword arguments are the body) or (property, required, is_bool)
+# triples. retry_safe marks POST/PATCH operations that may be retried.
+# Client and AsyncClient methods are compiled from it on first use.
+Route = collections.namedtuple(
+    "Route",
+    ["verb", "path", "signature", "query", "headers", "body", "is_json", "retry_safe"],
+)
+
+
+def method_source(name, route, is_async):
+    # The same code the generator used to emit for every method
+    lines = []
+    if route.query:
+        lines.append("    query = {}")
+        for param, is_bool in route.query:
+            value = f"from_bool({param})" if is_bool else param
+            lines.append(f"    if {param}:\n        query[{param!r}] = {value}")
+        query = "query"
+    else:
+        query = "None"
+
+    lines.append("    headers = {}")
+    for param, header in route.headers:
+        lines.append(f"    if {param}:\n        headers[{header!r}] = {param}")
+
+    if route.body is None:
+        payload = "None"
+    elif route.body == "**":
+        payload = "payload"
+    elif not route.body:
+        payload = "''"
+    else:
+        lines.append("    payload = {}")
+        for prop, required, is_bool in route.body:
+            value = f"from_bool({prop})" if is_bool else prop
+            if required:
+                lines.append(f"    payload[{prop!r}] = {value}")
+            else:
+                lines.append(
+                    f"    if {prop} is not None:\n        payload[{prop!r}] = {value}"
+                )
+        payload = "payload"
+
+    # every method takes a keyword-only timeout, before **payload if any
+    params = [p for p in route.signature if not p.startswith("**")]
+    params += ["*", "timeout=None"] + [p for p in route.signature if p.startswith("**")]
+    signature = ", ".join(["self"] + params)
+    retry_safe = ", retry_safe=True" if route.retry_safe else ""
+    lines.append(
+        f"    return {'await ' if is_async else ''}self.request("
+        f"{route.verb!r}, f{route.path!r}, {query}, headers, {payload}, {route.is_json}{retry_safe}, timeout=timeout)"
+    )
+    return (
+        f"{'async ' if is_async else ''}def {name}({signature}):\n"
+        + "\n".join(lines)
+        + "\n"
+    )
+
+
+class LazyMethod:
+    # Compiles the method on first access and replaces itself on the class,
+    # so that importing pyhvr does not build ~250 functions up front
+    def __init__(self, cls, name, is_async):
+        self.cls = cls
+        self.name = name
+        self.is_async = is_async
+
+    def __get__(self, obj, cls=None):
+        namespace = {"from_bool": from_bool}
+        exec(method_source(self.name, ROUTES[self.name], self.is_async), namespace)
+        method = namespace[self.name]
+        method.__module__ = self.cls.__module__
+        method.__qualname__ = self.cls.__qualname__ + "." + self.name
+        setattr(self.cls, self.name, method)
+        return method.__get__(obj, cls)
+
+
+def bind_routes(cls, is_async=False):
+    for name in ROUTES:
+        setattr(cls, name, LazyMethod(cls, name, is_async))
+
+
+def from_bool(b):
+    if b:
+        return "true"
+    else:
+        return "false"
+
+
+ROUTES = {
+    "delete_hubs": Route(
+        "DELETE", "/api/v6.1.0.3/hubs/{hub}", ("hub",), (), (), None, True, False
+    ),
+    "delete_hubs_alerts": Route(
+        "DELETE",
+        "/api/v6.1.0.3/hubs/{hub}/alerts/{alert}",
+        ("hub", "alert"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "delete_hubs_definition_channels": Route(
+        "DELETE",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}",
+        ("hub", "channel"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "delete_hubs_definition_channels_loc_groups": Route(
+        "DELETE",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/loc_groups/{loc_group}",
+        ("hub", "channel", "loc_group"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "delete_hubs_definition_channels_loc_groups_members": Route(
+        "DELETE",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/loc_groups/{loc_group}/members/{member}",
+        ("hub", "channel", "loc_group", "member"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "delete_hubs_definition_channels_tables": Route(
+        "DELETE",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables/{table}",
+        ("hub", "channel", "table"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "delete_hubs_definition_locs": Route(
+        "DELETE",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs/{loc}",
+        ("hub", "loc"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "delete_hubs_definition_locs_props": Route(
+        "DELETE",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs/{loc}/props/{prop}",
+        ("hub", "loc", "prop"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "delete_hubs_job_system_attributes": Route(
+        "DELETE",
+        "/api/v6.1.0.3/hubs/{hub}/job_system/attributes/{attr}",
+        ("hub", "attr"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "delete_hubs_job_system_env_vars": Route(
+        "DELETE",
+        "/api/v6.1.0.3/hubs/{hub}/job_system/env_vars/{var}",
+        ("hub", "var"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "delete_hubs_jobs": Route(
+        "DELETE",
+        "/api/v6.1.0.3/hubs/{hub}/jobs/{job}",
+        ("hub", "job"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "delete_hubs_jobs_attributes": Route(
+        "DELETE",
+        "/api/v6.1.0.3/hubs/{hub}/jobs/{job}/attributes/{attr}",
+        ("hub", "job", "attr"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "delete_hubs_jobs_env_vars": Route(
+        "DELETE",
+        "/api/v6.1.0.3/hubs/{hub}/jobs/{job}/env_vars/{var}",
+        ("hub", "job", "var"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "delete_licenses": Route(
+        "DELETE",
+        "/api/v6.1.0.3/licenses/{license}",
+        ("license",),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "delete_repos": Route(
+        "DELETE", "/api/v6.1.0.3/repos", (), (), (), None, True, False
+    ),
+    "delete_users": Route(
+        "DELETE", "/api/v6.1.0.3/users/{user}", ("user",), (), (), None, True, False
+    ),
+    "get_api": Route("GET", "/api", (), (), (), None, True, False),
+    "get_hubs": Route("GET", "/api/v6.1.0.3/hubs", (), (), (), None, True, False),
+    "get_hubs_activate": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/activate",
+        ("hub", "channels=None", "locs=None"),
+        (("channels", False), ("locs", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_alerts": Route(
+        "GET", "/api/v6.1.0.3/hubs/{hub}/alerts", ("hub",), (), (), None, True, False
+    ),
+    "get_hubs_alerts_props": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/alerts/{alert}/props",
+        ("hub", "alert", "fetch=None", "x_hvr_classified_access=None"),
+        (("fetch", False),),
+        (("x_hvr_classified_access", "X-Hvr-Classified-Access"),),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_channels_activate": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/activate",
+        ("hub", "channel", "locs=None"),
+        (("locs", False),),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_channels_compare_tables_results_ids": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/compare/tables_results_ids",
+        (
+            "hub",
+            "channel",
+            "result_pattern=None",
+            "source_loc=None",
+            "target_loc=None",
+            "table=None",
+            "ev_tstamp_begin=None",
+            "ev_tstamp_end=None",
+        ),
+        (
+            ("result_pattern", False),
+            ("source_loc", False),
+            ("target_loc", False),
+            ("table", False),
+            ("ev_tstamp_begin", False),
+            ("ev_tstamp_end", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_channels_contexts": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/contexts",
+        ("hub", "channel"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_channels_controls": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/controls",
+        (
+            "hub",
+            "channel",
+            "task_name=None",
+            "loc_name=None",
+            "ctrl_name=None",
+            "ctrl_id=None",
+        ),
+        (
+            ("task_name", False),
+            ("loc_name", False),
+            ("ctrl_name", False),
+            ("ctrl_id", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_channels_controls_ctrl_id": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/controls/{ctrl_id}",
+        ("hub", "channel", "ctrl_id"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_channels_locs_capture_open_tx": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/locs/{loc}/capture_open_tx",
+        ("hub", "channel", "loc"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_channels_locs_integrate_point": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/locs/{loc}/integrate_point",
+        ("hub", "channel", "loc", "orig_channel=None", "orig_integ_loc=None"),
+        (("orig_channel", False), ("orig_integ_loc", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_channels_refresh_tables_results_ids": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/refresh/tables_results_ids",
+        (
+            "hub",
+            "channel",
+            "result_pattern=None",
+            "source_loc=None",
+            "target_loc=None",
+            "table=None",
+            "ev_tstamp_begin=None",
+            "ev_tstamp_end=None",
+        ),
+        (
+            ("result_pattern", False),
+            ("source_loc", False),
+            ("target_loc", False),
+            ("table", False),
+            ("ev_tstamp_begin", False),
+            ("ev_tstamp_end", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_compare_tables_results_ids": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/compare/tables_results_ids",
+        (
+            "hub",
+            "channel=None",
+            "result_pattern=None",
+            "source_loc=None",
+            "target_loc=None",
+            "table=None",
+            "ev_tstamp_begin=None",
+            "ev_tstamp_end=None",
+        ),
+        (
+            ("channel", False),
+            ("result_pattern", False),
+            ("source_loc", False),
+            ("target_loc", False),
+            ("table", False),
+            ("ev_tstamp_begin", False),
+            ("ev_tstamp_end", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition",
+        (
+            "hub",
+            "fetch=None",
+            "channel=None",
+            "loc=None",
+            "table=None",
+            "action_type=None",
+            "cache_view_tstamp=None",
+            "x_hvr_classified_access=None",
+        ),
+        (
+            ("fetch", False),
+            ("channel", False),
+            ("loc", False),
+            ("table", False),
+            ("action_type", False),
+            ("cache_view_tstamp", False),
+        ),
+        (("x_hvr_classified_access", "X-Hvr-Classified-Access"),),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_change_events": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/change/events",
+        (
+            "hub",
+            "direction=None",
+            "channel=None",
+            "loc=None",
+            "ev_tstamp_begin=None",
+            "ev_tstamp_end=None",
+            "ev_id=None",
+            "x_hvr_classified_access=None",
+        ),
+        (
+            ("direction", False),
+            ("channel", False),
+            ("loc", False),
+            ("ev_tstamp_begin", False),
+            ("ev_tstamp_end", False),
+            ("ev_id", False),
+        ),
+        (("x_hvr_classified_access", "X-Hvr-Classified-Access"),),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_channels": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels",
+        (
+            "hub",
+            "fetch=None",
+            "channel=None",
+            "table=None",
+            "action_type=None",
+            "cache_view_tstamp=None",
+        ),
+        (
+            ("fetch", False),
+            ("channel", False),
+            ("table", False),
+            ("action_type", False),
+            ("cache_view_tstamp", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_channels_actions": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/actions",
+        ("hub", "channel", "action_type=None", "cache_view_tstamp=None"),
+        (("action_type", False), ("cache_view_tstamp", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_channels_channel": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}",
+        (
+            "hub",
+            "channel",
+            "fetch=None",
+            "table=None",
+            "action_type=None",
+            "cache_view_tstamp=None",
+        ),
+        (
+            ("fetch", False),
+            ("table", False),
+            ("action_type", False),
+            ("cache_view_tstamp", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_channels_loc_groups": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/loc_groups",
+        ("hub", "channel", "fetch=None", "cache_view_tstamp=None"),
+        (("fetch", False), ("cache_view_tstamp", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_channels_loc_groups_group": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/loc_groups/{loc_group}",
+        ("hub", "channel", "loc_group", "fetch=None", "cache_view_tstamp=None"),
+        (("fetch", False), ("cache_view_tstamp", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_channels_loc_groups_members": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/loc_groups/{loc_group}/members",
+        ("hub", "channel", "loc_group"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_channels_tables": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables",
+        ("hub", "channel", "fetch=None", "table=None", "cache_view_tstamp=None"),
+        (("fetch", False), ("table", False), ("cache_view_tstamp", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_channels_tables_cols": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables/{table}/cols",
+        ("hub", "channel", "table"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_channels_tables_table": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables/{table}",
+        ("hub", "channel", "table", "fetch=None", "cache_view_tstamp=None"),
+        (("fetch", False), ("cache_view_tstamp", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_hub_actions": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/hub_actions",
+        ("hub", "action_type=None", "cache_view_tstamp=None"),
+        (("action_type", False), ("cache_view_tstamp", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_locs": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs",
+        (
+            "hub",
+            "fetch=None",
+            "loc=None",
+            "action_type=None",
+            "cache_view_tstamp=None",
+            "x_hvr_classified_access=None",
+        ),
+        (
+            ("fetch", False),
+            ("loc", False),
+            ("action_type", False),
+            ("cache_view_tstamp", False),
+        ),
+        (("x_hvr_classified_access", "X-Hvr-Classified-Access"),),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_locs_actions": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs/{loc}/actions",
+        ("hub", "loc", "action_type=None", "cache_view_tstamp=None"),
+        (("action_type", False), ("cache_view_tstamp", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_locs_loc": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs/{loc}",
+        (
+            "hub",
+            "loc",
+            "fetch=None",
+            "action_type=None",
+            "cache_view_tstamp=None",
+            "x_hvr_classified_access=None",
+        ),
+        (("fetch", False), ("action_type", False), ("cache_view_tstamp", False)),
+        (("x_hvr_classified_access", "X-Hvr-Classified-Access"),),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_definition_locs_props": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs/{loc}/props",
+        ("hub", "loc", "x_hvr_classified_access=None"),
+        (),
+        (("x_hvr_classified_access", "X-Hvr-Classified-Access"),),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_dirs": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/dirs",
+        ("hub", "path=None", "pattern=None"),
+        (("path", False), ("pattern", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_event_channels": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/event_channels",
+        (
+            "hub",
+            "type=None",
+            "state=None",
+            "loc=None",
+            "fetch_repos_events=None",
+            "ev_tstamp_begin=None",
+            "ev_tstamp_end=None",
+        ),
+        (
+            ("type", False),
+            ("state", False),
+            ("loc", False),
+            ("fetch_repos_events", True),
+            ("ev_tstamp_begin", False),
+            ("ev_tstamp_end", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_event_locs": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/event_locs",
+        (
+            "hub",
+            "channel=None",
+            "type=None",
+            "state=None",
+            "fetch_repos_events=None",
+            "ev_tstamp_begin=None",
+            "ev_tstamp_end=None",
+        ),
+        (
+            ("channel", False),
+            ("type", False),
+            ("state", False),
+            ("fetch_repos_events", True),
+            ("ev_tstamp_begin", False),
+            ("ev_tstamp_end", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_event_types": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/event_types",
+        (
+            "hub",
+            "channel=None",
+            "state=None",
+            "loc=None",
+            "fetch_repos_events=None",
+            "ev_tstamp_begin=None",
+            "ev_tstamp_end=None",
+        ),
+        (
+            ("channel", False),
+            ("state", False),
+            ("loc", False),
+            ("fetch_repos_events", True),
+            ("ev_tstamp_begin", False),
+            ("ev_tstamp_end", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_events": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/events",
+        (
+            "hub",
+            "channel=None",
+            "ev_id=None",
+            "type=None",
+            "state=None",
+            "current_only=None",
+            "loc=None",
+            "job=None",
+            "body_pattern=None",
+            "fetch_results=None",
+            "fetch_repos_events=None",
+            "result_pattern=None",
+            "result_table=None",
+            "ev_tstamp_begin=None",
+            "ev_tstamp_end=None",
+            "updated_begin=None",
+            "updated_end=None",
+            "max_events=None",
+        ),
+        (
+            ("channel", False),
+            ("ev_id", False),
+            ("type", False),
+            ("state", False),
+            ("current_only", True),
+            ("loc", False),
+            ("job", False),
+            ("body_pattern", False),
+            ("fetch_results", True),
+            ("fetch_repos_events", True),
+            ("result_pattern", False),
+            ("result_table", False),
+            ("ev_tstamp_begin", False),
+            ("ev_tstamp_end", False),
+            ("updated_begin", False),
+            ("updated_end", False),
+            ("max_events", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_events_log": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/events/{ev_id}/log",
+        (
+            "hub",
+            "ev_id",
+            "max_lines=None",
+            "head_crc=None",
+            "offset_begin=None",
+            "archive=None",
+        ),
+        (
+            ("max_lines", False),
+            ("head_crc", False),
+            ("offset_begin", False),
+            ("archive", False),
+        ),
+        (),
+        None,
+        False,
+        False,
+    ),
+    "get_hubs_hub": Route(
+        "GET", "/api/v6.1.0.3/hubs/{hub}", ("hub",), (), (), None, True, False
+    ),
+    "get_hubs_job_system_attributes": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/job_system/attributes",
+        ("hub",),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_job_system_env_vars": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/job_system/env_vars",
+        ("hub",),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_jobs": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/jobs",
+        (
+            "hub",
+            "channel=None",
+            "job=None",
+            "updated_jobs_since=None",
+            "updated_err_since=None",
+            "fetch=None",
+        ),
+        (
+            ("channel", False),
+            ("job", False),
+            ("updated_jobs_since", False),
+            ("updated_err_since", False),
+            ("fetch", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_jobs_attributes": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/jobs/{job}/attributes",
+        ("hub", "job"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_jobs_controls_log": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/jobs/{job}/controls/{ctrl_id}/log",
+        (
+            "hub",
+            "job",
+            "ctrl_id",
+            "max_lines=None",
+            "head_crc=None",
+            "offset_begin=None",
+            "archive=None",
+        ),
+        (
+            ("max_lines", False),
+            ("head_crc", False),
+            ("offset_begin", False),
+            ("archive", False),
+        ),
+        (),
+        None,
+        False,
+        False,
+    ),
+    "get_hubs_jobs_env_vars": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/jobs/{job}/env_vars",
+        ("hub", "job"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_locs_activate": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/activate",
+        ("hub", "loc"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_locs_agent": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/agent",
+        ("hub", "loc"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_locs_db_schemas": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/db/schemas",
+        ("hub", "loc", "channel=None"),
+        (("channel", False),),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_locs_dirs": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/dirs",
+        ("hub", "loc", "path=None", "pattern=None", "local=None", "channel=None"),
+        (("path", False), ("pattern", False), ("local", True), ("channel", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_locs_env_odbc_drivers": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/env/odbc_drivers",
+        ("hub", "loc", "odbcinst=None", "odbcsysini=None", "channel=None"),
+        (("odbcinst", False), ("odbcsysini", False), ("channel", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_locs_env_oratab": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/env/oratab",
+        ("hub", "loc", "channel=None"),
+        (("channel", False),),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_locs_env_vars": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/env/vars",
+        ("hub", "loc", "vars=None", "channel=None"),
+        (("vars", False), ("channel", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_logs": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/logs/{file}",
+        (
+            "hub",
+            "file",
+            "max_lines=None",
+            "head_crc=None",
+            "offset_begin=None",
+            "offset_begin_limit=None",
+            "offset_end=None",
+            "search_eof=None",
+        ),
+        (
+            ("max_lines", False),
+            ("head_crc", False),
+            ("offset_begin", False),
+            ("offset_begin_limit", False),
+            ("offset_end", False),
+            ("search_eof", True),
+        ),
+        (),
+        None,
+        False,
+        False,
+    ),
+    "get_hubs_logs_archive": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/logs/{file}/archive/{archive}",
+        (
+            "hub",
+            "file",
+            "archive",
+            "max_lines=None",
+            "offset_begin=None",
+            "offset_end=None",
+            "search_eof=None",
+        ),
+        (
+            ("max_lines", False),
+            ("offset_begin", False),
+            ("offset_end", False),
+            ("search_eof", True),
+        ),
+        (),
+        None,
+        False,
+        False,
+    ),
+    "get_hubs_logs_search": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/logs/{file}/search",
+        ("hub", "file", "search_tstamp=None"),
+        (("search_tstamp", False),),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_props": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/props",
+        ("hub", "fetch=None"),
+        (("fetch", False),),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_query_channels": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/query/channels",
+        ("hub", "channel=None", "loc=None", "fetch=None", "table=None"),
+        (("channel", False), ("loc", False), ("fetch", False), ("table", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_query_channels_locs": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/query/channels/{channel}/locs",
+        ("hub", "channel", "loc=None", "fetch=None", "table=None"),
+        (("loc", False), ("fetch", False), ("table", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_query_channels_locs_tables": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/query/channels/{channel}/locs/{loc}/tables/{table}",
+        ("hub", "channel", "loc", "table", "context=None"),
+        (("context", False),),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_query_channels_tables": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/query/channels/{channel}/tables",
+        ("hub", "channel", "table=None"),
+        (("table", False),),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_query_status": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/query/status",
+        ("hub",),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_refresh_tables_results_ids": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/refresh/tables_results_ids",
+        (
+            "hub",
+            "channel=None",
+            "result_pattern=None",
+            "source_loc=None",
+            "target_loc=None",
+            "table=None",
+            "ev_tstamp_begin=None",
+            "ev_tstamp_end=None",
+        ),
+        (
+            ("channel", False),
+            ("result_pattern", False),
+            ("source_loc", False),
+            ("target_loc", False),
+            ("table", False),
+            ("ev_tstamp_begin", False),
+            ("ev_tstamp_end", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_stats_metrics": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/stats/metrics",
+        (
+            "hub",
+            "fetch_values=None",
+            "channel=None",
+            "loc=None",
+            "table=None",
+            "metric=None",
+            "time_gran=None",
+            "scope=None",
+            "tstamp_begin=None",
+            "tstamp_end=None",
+            "updated_logs_since=None",
+            "updated_glob_since=None",
+        ),
+        (
+            ("fetch_values", True),
+            ("channel", False),
+            ("loc", False),
+            ("table", False),
+            ("metric", False),
+            ("time_gran", False),
+            ("scope", False),
+            ("tstamp_begin", False),
+            ("tstamp_end", False),
+            ("updated_logs_since", False),
+            ("updated_glob_since", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_stats_oldest": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/stats/oldest",
+        ("hub", "time_gran=None", "scope=None"),
+        (("time_gran", False), ("scope", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubs_users_props": Route(
+        "GET",
+        "/api/v6.1.0.3/hubs/{hub}/users/{user}/props",
+        ("hub", "user", "fetch=None"),
+        (("fetch", False),),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubserver_clock": Route(
+        "GET", "/api/v6.1.0.3/hubserver/clock", (), (), (), None, True, False
+    ),
+    "get_hubserver_dirs": Route(
+        "GET",
+        "/api/v6.1.0.3/hubserver/dirs",
+        ("path=None", "pattern=None"),
+        (("path", False), ("pattern", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubserver_env_odbc_drivers": Route(
+        "GET",
+        "/api/v6.1.0.3/hubserver/env/odbc_drivers",
+        ("odbcinst=None", "odbcsysini=None"),
+        (("odbcinst", False), ("odbcsysini", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubserver_env_oratab": Route(
+        "GET", "/api/v6.1.0.3/hubserver/env/oratab", (), (), (), None, True, False
+    ),
+    "get_hubserver_env_vars": Route(
+        "GET",
+        "/api/v6.1.0.3/hubserver/env/vars",
+        ("vars=None",),
+        (("vars", False),),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_hubserver_props": Route(
+        "GET",
+        "/api/v6.1.0.3/hubserver/props",
+        ("fetch=None", "x_hvr_classified_access=None"),
+        (("fetch", False),),
+        (("x_hvr_classified_access", "X-Hvr-Classified-Access"),),
+        None,
+        True,
+        False,
+    ),
+    "get_licenses": Route(
+        "GET",
+        "/api/v6.1.0.3/licenses",
+        ("license=None",),
+        (("license", False),),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_licenses_license": Route(
+        "GET",
+        "/api/v6.1.0.3/licenses/{license}",
+        ("license",),
+        (),
+        (),
+        None,
+        False,
+        False,
+    ),
+    "get_licensing": Route(
+        "GET", "/api/v6.1.0.3/licensing", (), (), (), None, True, False
+    ),
+    "get_logs": Route(
+        "GET",
+        "/api/v6.1.0.3/logs/{file}",
+        (
+            "file",
+            "max_lines=None",
+            "head_crc=None",
+            "offset_begin=None",
+            "offset_begin_limit=None",
+            "offset_end=None",
+            "search_eof=None",
+        ),
+        (
+            ("max_lines", False),
+            ("head_crc", False),
+            ("offset_begin", False),
+            ("offset_begin_limit", False),
+            ("offset_end", False),
+            ("search_eof", True),
+        ),
+        (),
+        None,
+        False,
+        False,
+    ),
+    "get_logs_archive": Route(
+        "GET",
+        "/api/v6.1.0.3/logs/{file}/archive/{archive}",
+        (
+            "file",
+            "archive",
+            "max_lines=None",
+            "offset_begin=None",
+            "offset_end=None",
+            "search_eof=None",
+        ),
+        (
+            ("max_lines", False),
+            ("offset_begin", False),
+            ("offset_end", False),
+            ("search_eof", True),
+        ),
+        (),
+        None,
+        False,
+        False,
+    ),
+    "get_metering_download": Route(
+        "GET",
+        "/api/v6.1.0.3/metering/download",
+        ("period_begin=None", "period_end=None"),
+        (("period_begin", False), ("period_end", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_repos": Route("GET", "/api/v6.1.0.3/repos", (), (), (), None, True, False),
+    "get_repos_event_types": Route(
+        "GET",
+        "/api/v6.1.0.3/repos/event_types",
+        ("state=None", "ev_tstamp_begin=None", "ev_tstamp_end=None"),
+        (("state", False), ("ev_tstamp_begin", False), ("ev_tstamp_end", False)),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_repos_events": Route(
+        "GET",
+        "/api/v6.1.0.3/repos/events",
+        (
+            "ev_id=None",
+            "type=None",
+            "state=None",
+            "body_pattern=None",
+            "ev_tstamp_begin=None",
+            "ev_tstamp_end=None",
+            "updated_begin=None",
+            "updated_end=None",
+            "max_events=None",
+        ),
+        (
+            ("ev_id", False),
+            ("type", False),
+            ("state", False),
+            ("body_pattern", False),
+            ("ev_tstamp_begin", False),
+            ("ev_tstamp_end", False),
+            ("updated_begin", False),
+            ("updated_end", False),
+            ("max_events", False),
+        ),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_repos_props": Route(
+        "GET",
+        "/api/v6.1.0.3/repos/props",
+        ("fetch=None", "x_hvr_classified_access=None"),
+        (("fetch", False),),
+        (("x_hvr_classified_access", "X-Hvr-Classified-Access"),),
+        None,
+        True,
+        False,
+    ),
+    "get_users": Route(
+        "GET",
+        "/api/v6.1.0.3/users",
+        ("fetch=None",),
+        (("fetch", False),),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_users_props": Route(
+        "GET",
+        "/api/v6.1.0.3/users/{user}/props",
+        ("user", "fetch=None"),
+        (("fetch", False),),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_users_user": Route(
+        "GET",
+        "/api/v6.1.0.3/users/{user}",
+        ("user", "fetch=None"),
+        (("fetch", False),),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "get_wallet_props": Route(
+        "GET",
+        "/api/v6.1.0.3/wallet/props",
+        ("fetch=None", "x_hvr_classified_access=None"),
+        (("fetch", False),),
+        (("x_hvr_classified_access", "X-Hvr-Classified-Access"),),
+        None,
+        True,
+        False,
+    ),
+    "patch_hubs_alerts_props": Route(
+        "PATCH",
+        "/api/v6.1.0.3/hubs/{hub}/alerts/{alert}/props",
+        ("hub", "alert", "x_hvr_classified_transport_key=None", "**payload"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        "**",
+        True,
+        True,
+    ),
+    "patch_hubs_definition_channels": Route(
+        "PATCH",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}",
+        ("hub", "channel", "description"),
+        (),
+        (),
+        (("description", True, False),),
+        True,
+        False,
+    ),
+    "patch_hubs_definition_channels_actions": Route(
+        "PATCH",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/actions",
+        ("hub", "channel", "actions"),
+        (),
+        (),
+        (("actions", True, False),),
+        True,
+        False,
+    ),
+    "patch_hubs_definition_channels_loc_groups_members": Route(
+        "PATCH",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/loc_groups/{loc_group}/members",
+        ("hub", "channel", "loc_group", "members"),
+        (),
+        (),
+        (("members", True, False),),
+        True,
+        False,
+    ),
+    "patch_hubs_definition_channels_tables": Route(
+        "PATCH",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables",
+        ("hub", "channel", "**payload"),
+        (),
+        (),
+        "**",
+        True,
+        False,
+    ),
+    "patch_hubs_definition_channels_tables_cols": Route(
+        "PATCH",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables/{table}/cols",
+        ("hub", "channel", "table", "**payload"),
+        (),
+        (),
+        "**",
+        True,
+        False,
+    ),
+    "patch_hubs_definition_channels_tables_table": Route(
+        "PATCH",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables/{table}",
+        ("hub", "channel", "table", "base_name=None", "table_group=None"),
+        (),
+        (),
+        (("base_name", False, False), ("table_group", False, False)),
+        True,
+        False,
+    ),
+    "patch_hubs_definition_hub_actions": Route(
+        "PATCH",
+        "/api/v6.1.0.3/hubs/{hub}/definition/hub_actions",
+        ("hub", "actions"),
+        (),
+        (),
+        (("actions", True, False),),
+        True,
+        False,
+    ),
+    "patch_hubs_definition_locs_actions": Route(
+        "PATCH",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs/{loc}/actions",
+        ("hub", "loc", "actions"),
+        (),
+        (),
+        (("actions", True, False),),
+        True,
+        False,
+    ),
+    "patch_hubs_definition_locs_props": Route(
+        "PATCH",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs/{loc}/props",
+        ("hub", "loc", "x_hvr_classified_transport_key=None", "**payload"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        "**",
+        True,
+        True,
+    ),
+    "patch_hubs_props": Route(
+        "PATCH",
+        "/api/v6.1.0.3/hubs/{hub}/props",
+        ("hub", "**payload"),
+        (),
+        (),
+        "**",
+        True,
+        True,
+    ),
+    "patch_hubs_users_props": Route(
+        "PATCH",
+        "/api/v6.1.0.3/hubs/{hub}/users/{user}/props",
+        ("hub", "user", "**payload"),
+        (),
+        (),
+        "**",
+        True,
+        True,
+    ),
+    "patch_hubserver_props": Route(
+        "PATCH",
+        "/api/v6.1.0.3/hubserver/props",
+        ("x_hvr_classified_transport_key=None", "**payload"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        "**",
+        True,
+        True,
+    ),
+    "patch_repos_props": Route(
+        "PATCH",
+        "/api/v6.1.0.3/repos/props",
+        ("x_hvr_classified_transport_key=None", "**payload"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        "**",
+        True,
+        True,
+    ),
+    "patch_users_props": Route(
+        "PATCH",
+        "/api/v6.1.0.3/users/{user}/props",
+        ("user", "**payload"),
+        (),
+        (),
+        "**",
+        True,
+        True,
+    ),
+    "post_hubs": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs",
+        ("hub", "props=None"),
+        (),
+        (),
+        (("hub", True, False), ("props", False, False)),
+        True,
+        False,
+    ),
+    "post_hubs_alerts": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/alerts",
+        ("hub", "alert", "props", "x_hvr_classified_transport_key=None"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (("alert", True, False), ("props", True, False)),
+        True,
+        False,
+    ),
+    "post_hubs_alerts_clear": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/alerts/{alert}/clear",
+        ("hub", "alert"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "post_hubs_alerts_disable": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/alerts/{alert}/disable",
+        ("hub", "alert"),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "post_hubs_alerts_execute": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/alerts/{alert}/execute",
+        ("hub", "alert"),
+        (),
+        (),
+        None,
+        False,
+        False,
+    ),
+    "post_hubs_alerts_props_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/alerts/{alert}/props_delete",
+        ("hub", "alert", "props"),
+        (),
+        (),
+        (("props", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_alerts_test": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/alerts/{alert}/test",
+        ("hub", "alert"),
+        (),
+        (),
+        None,
+        False,
+        False,
+    ),
+    "post_hubs_channels_activate": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/activate",
+        (
+            "hub",
+            "channel",
+            "locs=None",
+            "tables=None",
+            "parallel_locs=None",
+            "components=None",
+            "start_immediate=None",
+            "replace_enroll=None",
+            "rewind_scan_start=None",
+            "rewind_emit=None",
+            "start_next_jobs=None",
+            "start_next_ev_ids=None",
+        ),
+        (),
+        (),
+        (
+            ("locs", False, False),
+            ("tables", False, False),
+            ("parallel_locs", False, False),
+            ("components", False, False),
+            ("start_immediate", False, True),
+            ("replace_enroll", False, True),
+            ("rewind_scan_start", False, False),
+            ("rewind_emit", False, False),
+            ("start_next_jobs", False, False),
+            ("start_next_ev_ids", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_channels_compare": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/compare",
+        (
+            "hub",
+            "channel",
+            "source_loc",
+            "target_loc",
+            "contexts=None",
+            "granularity=None",
+            "difference_filter=None",
+            "quota_run=None",
+            "parallel_sessions=None",
+            "db_sequences=None",
+            "slicing=None",
+            "tables=None",
+            "task=None",
+            "context_variables=None",
+            "file_preread_subtasks=None",
+            "start_immediate=None",
+            "online_compare=None",
+            "online_compare_sleep=None",
+            "select_moment=None",
+            "save_diff_file=None",
+            "prereader_intermediate_files=None",
+        ),
+        (),
+        (),
+        (
+            ("source_loc", True, False),
+            ("target_loc", True, False),
+            ("contexts", False, False),
+            ("granularity", False, False),
+            ("difference_filter", False, False),
+            ("quota_run", False, False),
+            ("parallel_sessions", False, False),
+            ("db_sequences", False, True),
+            ("slicing", False, False),
+            ("tables", False, False),
+            ("task", False, False),
+            ("context_variables", False, False),
+            ("file_preread_subtasks", False, False),
+            ("start_immediate", False, True),
+            ("online_compare", False, False),
+            ("online_compare_sleep", False, False),
+            ("select_moment", False, False),
+            ("save_diff_file", False, True),
+            ("prereader_intermediate_files", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_channels_controls_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/controls_delete",
+        ("hub", "channel", "ctrl_ids"),
+        (),
+        (),
+        (("ctrl_ids", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_channels_deactivate": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/deactivate",
+        (
+            "hub",
+            "channel",
+            "locs=None",
+            "tables=None",
+            "parallel_locs=None",
+            "components=None",
+            "start_immediate=None",
+        ),
+        (),
+        (),
+        (
+            ("locs", False, False),
+            ("tables", False, False),
+            ("parallel_locs", False, False),
+            ("components", False, False),
+            ("start_immediate", False, True),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_channels_locs_adapt_apply": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/locs/{loc}/adapt/apply",
+        (
+            "hub",
+            "channel",
+            "loc",
+            "tables_in_channel=None",
+            "add_tables=None",
+            "add_table_group=None",
+            "show_views=None",
+            "mapspec=None",
+        ),
+        (),
+        (),
+        (
+            ("tables_in_channel", False, False),
+            ("add_tables", False, True),
+            ("add_table_group", False, False),
+            ("show_views", False, True),
+            ("mapspec", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_channels_locs_adapt_check": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/locs/{loc}/adapt/check",
+        (
+            "hub",
+            "channel",
+            "loc",
+            "tables_in_channel=None",
+            "add_tables=None",
+            "show_views=None",
+            "fetch_extra=None",
+            "mapspec=None",
+            "mapspec_table_not_in_db_error=None",
+        ),
+        (),
+        (),
+        (
+            ("tables_in_channel", False, False),
+            ("add_tables", False, True),
+            ("show_views", False, True),
+            ("fetch_extra", False, False),
+            ("mapspec", False, False),
+            ("mapspec_table_not_in_db_error", False, True),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_channels_locs_adapt_check_table": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/locs/{loc}/adapt/check/{table}",
+        (
+            "hub",
+            "channel",
+            "loc",
+            "table",
+            "contexts=None",
+            "localize_datatypes=None",
+            "fetch_extra=None",
+        ),
+        (),
+        (),
+        (
+            ("contexts", False, False),
+            ("localize_datatypes", False, True),
+            ("fetch_extra", False, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_channels_locs_adapt_other_channels": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/locs/{loc}/adapt/other_channels",
+        ("hub", "channel", "loc", "tables=None"),
+        (),
+        (),
+        (("tables", False, False),),
+        True,
+        True,
+    ),
+    "post_hubs_channels_locs_slicing_suggest": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/locs/{loc}/slicing_suggest",
+        (
+            "hub",
+            "channel",
+            "loc",
+            "rows_per_slice=None",
+            "max_slices_per_table=None",
+            "repeat_last_refresh_slicing=None",
+            "repeat_last_compare_slicing=None",
+            "suggest_from_last_refresh_rows=None",
+            "suggest_from_last_compare_rows=None",
+            "suggest_from_db_stats=None",
+            "tables=None",
+        ),
+        (),
+        (),
+        (
+            ("rows_per_slice", False, False),
+            ("max_slices_per_table", False, False),
+            ("repeat_last_refresh_slicing", False, True),
+            ("repeat_last_compare_slicing", False, True),
+            ("suggest_from_last_refresh_rows", False, True),
+            ("suggest_from_last_compare_rows", False, True),
+            ("suggest_from_db_stats", False, True),
+            ("tables", False, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_channels_locs_tables_slicing_boundaries": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/locs/{loc}/tables/{table}/slicing_boundaries",
+        ("hub", "channel", "loc", "table", "col", "slices"),
+        (),
+        (),
+        (("col", True, False), ("slices", True, False)),
+        True,
+        True,
+    ),
+    "post_hubs_channels_locs_tasks_controls": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/locs/{loc}/tasks/{task}/controls",
+        (
+            "hub",
+            "channel",
+            "loc",
+            "task",
+            "ctrl_name=None",
+            "filters=None",
+            "set_env=None",
+            "journaling=None",
+            "finish_after_cycle=None",
+            "expiry_date=None",
+            "recv_expiry=None",
+        ),
+        (),
+        (),
+        (
+            ("ctrl_name", False, False),
+            ("filters", False, False),
+            ("set_env", False, False),
+            ("journaling", False, True),
+            ("finish_after_cycle", False, True),
+            ("expiry_date", False, False),
+            ("recv_expiry", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_channels_refresh": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/channels/{channel}/refresh",
+        (
+            "hub",
+            "channel",
+            "source_loc",
+            "target_loc",
+            "contexts=None",
+            "granularity=None",
+            "difference_filter=None",
+            "quota_run=None",
+            "parallel_sessions=None",
+            "db_sequences=None",
+            "slicing=None",
+            "tables=None",
+            "task=None",
+            "context_variables=None",
+            "file_preread_subtasks=None",
+            "start_immediate=None",
+            "create_tables=None",
+            "data_refresh=None",
+            "fire_db_triggers=None",
+            "foreign_keys=None",
+            "select_moment=None",
+            "online_refresh=None",
+            "start_next_jobs=None",
+        ),
+        (),
+        (),
+        (
+            ("source_loc", True, False),
+            ("target_loc", True, False),
+            ("contexts", False, False),
+            ("granularity", False, False),
+            ("difference_filter", False, False),
+            ("quota_run", False, False),
+            ("parallel_sessions", False, False),
+            ("db_sequences", False, True),
+            ("slicing", False, False),
+            ("tables", False, False),
+            ("task", False, False),
+            ("context_variables", False, False),
+            ("file_preread_subtasks", False, False),
+            ("start_immediate", False, True),
+            ("create_tables", False, False),
+            ("data_refresh", False, True),
+            ("fire_db_triggers", False, True),
+            ("foreign_keys", False, False),
+            ("select_moment", False, False),
+            ("online_refresh", False, False),
+            ("start_next_jobs", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_definition_action_modify": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/action_modify",
+        ("hub", "type", "old", "new"),
+        (),
+        (),
+        (("type", True, False), ("old", True, False), ("new", True, False)),
+        True,
+        False,
+    ),
+    "post_hubs_definition_action_replace": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/action_replace",
+        ("hub", "type", "old", "new"),
+        (),
+        (),
+        (("type", True, False), ("old", True, False), ("new", True, False)),
+        True,
+        False,
+    ),
+    "post_hubs_definition_channels": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels",
+        (
+            "hub",
+            "channel",
+            "description=None",
+            "loc_groups=None",
+            "tables=None",
+            "actions=None",
+        ),
+        (),
+        (),
+        (
+            ("channel", True, False),
+            ("description", False, False),
+            ("loc_groups", False, False),
+            ("tables", False, False),
+            ("actions", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_definition_channels_actions_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/actions_delete",
+        ("hub", "channel", "actions"),
+        (),
+        (),
+        (("actions", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_definition_channels_loc_groups": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/loc_groups",
+        ("hub", "channel", "loc_group", "members=None"),
+        (),
+        (),
+        (("loc_group", True, False), ("members", False, False)),
+        True,
+        False,
+    ),
+    "post_hubs_definition_channels_loc_groups_members_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/loc_groups/{loc_group}/members_delete",
+        ("hub", "channel", "loc_group", "members"),
+        (),
+        (),
+        (("members", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_definition_channels_loc_groups_rename": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/loc_groups/{loc_group}/rename",
+        ("hub", "channel", "loc_group", "new_name"),
+        (),
+        (),
+        (("new_name", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_definition_channels_rename": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/rename",
+        ("hub", "channel", "new_name"),
+        (),
+        (),
+        (("new_name", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_definition_channels_tables": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables",
+        ("hub", "channel", "table", "base_name=None", "table_group=None", "cols=None"),
+        (),
+        (),
+        (
+            ("table", True, False),
+            ("base_name", False, False),
+            ("table_group", False, False),
+            ("cols", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_definition_channels_tables_cols_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables/{table}/cols_delete",
+        ("hub", "channel", "table", "cols"),
+        (),
+        (),
+        (("cols", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_definition_channels_tables_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables_delete",
+        ("hub", "channel", "tables"),
+        (),
+        (),
+        (("tables", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_definition_channels_tables_rename": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables/{table}/rename",
+        ("hub", "channel", "table", "new_name"),
+        (),
+        (),
+        (("new_name", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_definition_hub_actions_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/hub_actions_delete",
+        ("hub", "actions"),
+        (),
+        (),
+        (("actions", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_definition_import": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/import",
+        (
+            "hub",
+            "changes",
+            "x_hvr_classified_transport_key=None",
+            "export_header=None",
+            "allowed_changes=None",
+            "loc_context=None",
+            "channel_context=None",
+            "table_context=None",
+            "on_add_exists=None",
+            "on_action_absent_loc=None",
+            "on_old_group_members=None",
+            "on_member_absent_loc=None",
+            "on_absent=None",
+        ),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (
+            ("export_header", False, False),
+            ("allowed_changes", False, False),
+            ("loc_context", False, False),
+            ("channel_context", False, False),
+            ("table_context", False, False),
+            ("on_add_exists", False, False),
+            ("on_action_absent_loc", False, False),
+            ("on_old_group_members", False, False),
+            ("on_member_absent_loc", False, False),
+            ("on_absent", False, False),
+            ("changes", True, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_definition_import_analyze": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/import/analyze",
+        (
+            "hub",
+            "changes",
+            "x_hvr_classified_transport_key=None",
+            "export_header=None",
+            "allowed_changes=None",
+            "loc_context=None",
+            "channel_context=None",
+            "table_context=None",
+        ),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (
+            ("export_header", False, False),
+            ("allowed_changes", False, False),
+            ("loc_context", False, False),
+            ("channel_context", False, False),
+            ("table_context", False, False),
+            ("changes", True, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_definition_locs": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs",
+        ("hub", "loc", "props", "x_hvr_classified_transport_key=None", "actions=None"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (("loc", True, False), ("props", True, False), ("actions", False, False)),
+        True,
+        False,
+    ),
+    "post_hubs_definition_locs_actions_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs/{loc}/actions_delete",
+        ("hub", "loc", "actions"),
+        (),
+        (),
+        (("actions", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_definition_locs_copy": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs/{loc}/copy",
+        ("hub", "loc", "new_name"),
+        (),
+        (),
+        (("new_name", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_definition_locs_props_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs/{loc}/props_delete",
+        ("hub", "loc", "props"),
+        (),
+        (),
+        (("props", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_definition_locs_rename": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs/{loc}/rename",
+        ("hub", "loc", "new_name"),
+        (),
+        (),
+        (("new_name", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_events_cancel": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/events_cancel",
+        ("hub", "ev_ids"),
+        (),
+        (),
+        (("ev_ids", True, False),),
+        True,
+        True,
+    ),
+    "post_hubs_freeze": Route(
+        "POST", "/api/v6.1.0.3/hubs/{hub}/freeze", ("hub",), (), (), None, True, False
+    ),
+    "post_hubs_jobs_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/jobs_delete",
+        ("hub", "jobs"),
+        (),
+        (),
+        (("jobs", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_jobs_start": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/jobs_start",
+        ("hub", "jobs", "unsuspend=None", "trigger_failed=None"),
+        (),
+        (),
+        (
+            ("jobs", True, False),
+            ("unsuspend", False, True),
+            ("trigger_failed", False, True),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_jobs_suspend": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/jobs_suspend",
+        ("hub", "jobs"),
+        (),
+        (),
+        (("jobs", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_jobs_unsuspend": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/jobs_unsuspend",
+        ("hub", "jobs"),
+        (),
+        (),
+        (("jobs", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_locs_agent_props_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/agent/props_delete",
+        (
+            "hub",
+            "loc",
+            "agent_props",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+        ),
+        (),
+        (),
+        (
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("agent_props", True, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_locs_agent_props_get": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/agent/props_get",
+        (
+            "hub",
+            "loc",
+            "x_hvr_classified_access=None",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+            "fetch=None",
+        ),
+        (),
+        (("x_hvr_classified_access", "X-Hvr-Classified-Access"),),
+        (
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("fetch", False, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_locs_agent_props_patch": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/agent/props_patch",
+        (
+            "hub",
+            "loc",
+            "agent_props",
+            "x_hvr_classified_transport_key=None",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+        ),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("agent_props", True, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_locs_agent_props_put": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/agent/props_put",
+        (
+            "hub",
+            "loc",
+            "agent_props",
+            "x_hvr_classified_transport_key=None",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+        ),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("agent_props", True, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_locs_agent_test": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/agent/test",
+        (
+            "hub",
+            "loc",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+        ),
+        (),
+        (),
+        (
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_locs_agent_users": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/agent/users",
+        (
+            "hub",
+            "loc",
+            "user",
+            "authentication",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+            "password=None",
+        ),
+        (),
+        (),
+        (
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("user", True, False),
+            ("authentication", True, False),
+            ("password", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_locs_agent_users_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/agent/users_delete",
+        (
+            "hub",
+            "loc",
+            "user",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+        ),
+        (),
+        (),
+        (
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("user", True, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_locs_agent_users_get": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/agent/users_get",
+        (
+            "hub",
+            "loc",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+            "user=None",
+        ),
+        (),
+        (),
+        (
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("user", False, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_locs_agent_users_password": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/agent/users_password",
+        (
+            "hub",
+            "loc",
+            "user",
+            "new_password",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+            "current_password=None",
+        ),
+        (),
+        (),
+        (
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("user", True, False),
+            ("new_password", True, False),
+            ("current_password", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_locs_test": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/locs/{loc}/test",
+        ("hub", "loc", "channel=None"),
+        (),
+        (),
+        (("channel", False, False),),
+        True,
+        True,
+    ),
+    "post_hubs_mapdoc_parse": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/mapdoc/parse",
+        ("hub", "mapdoc"),
+        (),
+        (),
+        (("mapdoc", True, False),),
+        True,
+        True,
+    ),
+    "post_hubs_new_loc_agent_get": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/agent_get",
+        ("hub", "loc_props", "loc_props_from=None"),
+        (),
+        (),
+        (("loc_props_from", False, False), ("loc_props", True, False)),
+        True,
+        True,
+    ),
+    "post_hubs_new_loc_agent_props_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/agent/props_delete",
+        (
+            "hub",
+            "loc_props",
+            "agent_props",
+            "loc_props_from=None",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+        ),
+        (),
+        (),
+        (
+            ("loc_props_from", False, False),
+            ("loc_props", True, False),
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("agent_props", True, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_new_loc_agent_props_get": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/agent/props_get",
+        (
+            "hub",
+            "loc_props",
+            "x_hvr_classified_access=None",
+            "loc_props_from=None",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+            "fetch=None",
+        ),
+        (),
+        (("x_hvr_classified_access", "X-Hvr-Classified-Access"),),
+        (
+            ("loc_props_from", False, False),
+            ("loc_props", True, False),
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("fetch", False, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_new_loc_agent_props_patch": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/agent/props_patch",
+        (
+            "hub",
+            "loc_props",
+            "agent_props",
+            "x_hvr_classified_transport_key=None",
+            "loc_props_from=None",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+        ),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (
+            ("loc_props_from", False, False),
+            ("loc_props", True, False),
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("agent_props", True, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_new_loc_agent_props_put": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/agent/props_put",
+        (
+            "hub",
+            "loc_props",
+            "agent_props",
+            "x_hvr_classified_transport_key=None",
+            "loc_props_from=None",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+        ),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (
+            ("loc_props_from", False, False),
+            ("loc_props", True, False),
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("agent_props", True, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_new_loc_agent_test": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/agent/test",
+        (
+            "hub",
+            "loc_props",
+            "loc_props_from=None",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+        ),
+        (),
+        (),
+        (
+            ("loc_props_from", False, False),
+            ("loc_props", True, False),
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_new_loc_agent_users": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/agent/users",
+        (
+            "hub",
+            "loc_props",
+            "user",
+            "authentication",
+            "loc_props_from=None",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+            "password=None",
+        ),
+        (),
+        (),
+        (
+            ("loc_props_from", False, False),
+            ("loc_props", True, False),
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("user", True, False),
+            ("authentication", True, False),
+            ("password", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_new_loc_agent_users_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/agent/users_delete",
+        (
+            "hub",
+            "loc_props",
+            "user",
+            "loc_props_from=None",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+        ),
+        (),
+        (),
+        (
+            ("loc_props_from", False, False),
+            ("loc_props", True, False),
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("user", True, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_new_loc_agent_users_get": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/agent/users_get",
+        (
+            "hub",
+            "loc_props",
+            "loc_props_from=None",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+            "user=None",
+        ),
+        (),
+        (),
+        (
+            ("loc_props_from", False, False),
+            ("loc_props", True, False),
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("user", False, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_new_loc_agent_users_password": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/agent/users_password",
+        (
+            "hub",
+            "loc_props",
+            "user",
+            "new_password",
+            "loc_props_from=None",
+            "setup_token=None",
+            "setup_timed=None",
+            "auth_user_password=None",
+            "current_password=None",
+        ),
+        (),
+        (),
+        (
+            ("loc_props_from", False, False),
+            ("loc_props", True, False),
+            ("setup_token", False, False),
+            ("setup_timed", False, True),
+            ("auth_user_password", False, False),
+            ("user", True, False),
+            ("new_password", True, False),
+            ("current_password", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_new_loc_db_schemas": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/db/schemas",
+        ("hub", "props", "channel=None", "props_from=None"),
+        (),
+        (),
+        (
+            ("channel", False, False),
+            ("props_from", False, False),
+            ("props", True, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_new_loc_dirs": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/dirs",
+        (
+            "hub",
+            "props",
+            "path=None",
+            "pattern=None",
+            "local=None",
+            "channel=None",
+            "props_from=None",
+        ),
+        (),
+        (),
+        (
+            ("path", False, False),
+            ("pattern", False, False),
+            ("local", False, True),
+            ("channel", False, False),
+            ("props_from", False, False),
+            ("props", True, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_new_loc_env_odbc_drivers": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/env/odbc_drivers",
+        (
+            "hub",
+            "props",
+            "odbcinst=None",
+            "odbcsysini=None",
+            "channel=None",
+            "props_from=None",
+        ),
+        (),
+        (),
+        (
+            ("odbcinst", False, False),
+            ("odbcsysini", False, False),
+            ("channel", False, False),
+            ("props_from", False, False),
+            ("props", True, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_new_loc_env_oratab": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/env/oratab",
+        ("hub", "props", "channel=None", "props_from=None"),
+        (),
+        (),
+        (
+            ("channel", False, False),
+            ("props_from", False, False),
+            ("props", True, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_new_loc_env_vars": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/env/vars",
+        ("hub", "vars", "props", "channel=None", "props_from=None"),
+        (),
+        (),
+        (
+            ("vars", True, False),
+            ("channel", False, False),
+            ("props_from", False, False),
+            ("props", True, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_new_loc_test": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/new_loc/test",
+        ("hub", "props", "channel=None", "props_from=None"),
+        (),
+        (),
+        (
+            ("channel", False, False),
+            ("props_from", False, False),
+            ("props", True, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_props_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/props_delete",
+        ("hub", "props"),
+        (),
+        (),
+        (("props", True, False),),
+        True,
+        False,
+    ),
+    "post_hubs_snapshot": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/snapshot",
+        (
+            "hub",
+            "x_hvr_classified_access=None",
+            "reason=None",
+            "channel_focus=None",
+            "event_trim=None",
+            "log_trim=None",
+            "stats_trim=None",
+            "definition_trim=None",
+            "dblog_dump=None",
+            "txfiles=None",
+        ),
+        (),
+        (("x_hvr_classified_access", "X-Hvr-Classified-Access"),),
+        (
+            ("reason", False, False),
+            ("channel_focus", False, False),
+            ("event_trim", False, False),
+            ("log_trim", False, False),
+            ("stats_trim", False, False),
+            ("definition_trim", False, False),
+            ("dblog_dump", False, False),
+            ("txfiles", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_hubs_stats_metrics_export": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/stats/metrics/export",
+        (
+            "hub",
+            "format",
+            "channel=None",
+            "loc=None",
+            "table=None",
+            "metric=None",
+            "time_gran=None",
+            "scope=None",
+            "tstamp_begin=None",
+            "tstamp_end=None",
+        ),
+        (),
+        (),
+        (
+            ("channel", False, False),
+            ("loc", False, False),
+            ("table", False, False),
+            ("metric", False, False),
+            ("time_gran", False, False),
+            ("scope", False, False),
+            ("tstamp_begin", False, False),
+            ("tstamp_end", False, False),
+            ("format", True, False),
+        ),
+        True,
+        True,
+    ),
+    "post_hubs_unfreeze": Route(
+        "POST", "/api/v6.1.0.3/hubs/{hub}/unfreeze", ("hub",), (), (), None, True, False
+    ),
+    "post_hubs_users_props_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubs/{hub}/users/{user}/props_delete",
+        ("hub", "user", "props"),
+        (),
+        (),
+        (("props", True, False),),
+        True,
+        False,
+    ),
+    "post_hubserver_props_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/hubserver/props_delete",
+        ("props",),
+        (),
+        (),
+        (("props", True, False),),
+        True,
+        False,
+    ),
+    "post_hubserver_props_test": Route(
+        "POST",
+        "/api/v6.1.0.3/hubserver/props_test",
+        ("props", "props_from=None"),
+        (),
+        (),
+        (("props_from", False, True), ("props", True, False)),
+        True,
+        True,
+    ),
+    "post_hubserver_restart": Route(
+        "POST", "/api/v6.1.0.3/hubserver/restart", (), (), (), None, True, False
+    ),
+    "post_hubserver_stop": Route(
+        "POST", "/api/v6.1.0.3/hubserver/stop", (), (), (), None, True, False
+    ),
+    "post_hubserver_test": Route(
+        "POST", "/api/v6.1.0.3/hubserver/test", (), (), (), None, True, True
+    ),
+    "post_hubserver_upload": Route(
+        "POST",
+        "/api/v6.1.0.3/hubserver/upload",
+        ("file",),
+        (),
+        (),
+        (("file", True, False),),
+        True,
+        False,
+    ),
+    "post_licenses": Route(
+        "POST",
+        "/api/v6.1.0.3/licenses",
+        ("license", "raw"),
+        (),
+        (),
+        (("license", True, False), ("raw", True, False)),
+        True,
+        False,
+    ),
+    "post_licensing_license_agreement_accepted": Route(
+        "POST",
+        "/api/v6.1.0.3/licensing/license_agreement_accepted",
+        (),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "post_metering_license_acquire": Route(
+        "POST", "/api/v6.1.0.3/metering/license_acquire", (), (), (), None, True, False
+    ),
+    "post_metering_purge": Route(
+        "POST",
+        "/api/v6.1.0.3/metering/purge",
+        ("period_end=None",),
+        (),
+        (),
+        (("period_end", False, False),),
+        True,
+        False,
+    ),
+    "post_metering_registration_status": Route(
+        "POST",
+        "/api/v6.1.0.3/metering/registration_status",
+        (),
+        (),
+        (),
+        None,
+        True,
+        False,
+    ),
+    "post_metering_upload": Route(
+        "POST",
+        "/api/v6.1.0.3/metering/upload",
+        ("period_begin=None", "period_end=None", "snapshots=None"),
+        (),
+        (),
+        (
+            ("period_begin", False, False),
+            ("period_end", False, False),
+            ("snapshots", False, True),
+        ),
+        True,
+        False,
+    ),
+    "post_repos": Route("POST", "/api/v6.1.0.3/repos", (), (), (), None, True, False),
+    "post_repos_props_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/repos/props_delete",
+        ("props",),
+        (),
+        (),
+        (("props", True, False),),
+        True,
+        False,
+    ),
+    "post_snapshot": Route(
+        "POST",
+        "/api/v6.1.0.3/snapshot",
+        ("ref", "hub", "x_hvr_classified_transport_key=None", "description=None"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (("ref", True, False), ("hub", True, False), ("description", False, False)),
+        True,
+        False,
+    ),
+    "post_snapshot_inspect": Route(
+        "POST",
+        "/api/v6.1.0.3/snapshot_inspect",
+        ("ref", "x_hvr_classified_transport_key=None"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (("ref", True, False),),
+        True,
+        True,
+    ),
+    "post_users": Route(
+        "POST",
+        "/api/v6.1.0.3/users",
+        ("user", "authentication", "password=None", "props=None"),
+        (),
+        (),
+        (
+            ("user", True, False),
+            ("authentication", True, False),
+            ("password", False, False),
+            ("props", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_users_props_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/users/{user}/props_delete",
+        ("user", "props"),
+        (),
+        (),
+        (("props", True, False),),
+        True,
+        False,
+    ),
+    "post_wallet": Route(
+        "POST",
+        "/api/v6.1.0.3/wallet",
+        ("props", "x_hvr_classified_transport_key=None", "password=None"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (("props", True, False), ("password", False, False)),
+        True,
+        False,
+    ),
+    "post_wallet_change": Route(
+        "POST",
+        "/api/v6.1.0.3/wallet/change",
+        ("x_hvr_classified_transport_key=None", "props=None", "password=None"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (("props", False, False), ("password", False, False)),
+        True,
+        False,
+    ),
+    "post_wallet_disable": Route(
+        "POST",
+        "/api/v6.1.0.3/wallet/disable",
+        ("force=None",),
+        (),
+        (),
+        (("force", False, True),),
+        True,
+        False,
+    ),
+    "post_wallet_key_history_delete": Route(
+        "POST",
+        "/api/v6.1.0.3/wallet/key_history_delete",
+        ("before_key_sequence=None", "before_rotation_tstamp=None"),
+        (),
+        (),
+        (
+            ("before_key_sequence", False, False),
+            ("before_rotation_tstamp", False, False),
+        ),
+        True,
+        False,
+    ),
+    "post_wallet_key_rotate": Route(
+        "POST", "/api/v6.1.0.3/wallet/key_rotate", (), (), (), None, True, False
+    ),
+    "post_wallet_migrate": Route(
+        "POST",
+        "/api/v6.1.0.3/wallet/migrate",
+        (
+            "props",
+            "x_hvr_classified_transport_key=None",
+            "password=None",
+            "rotate_encryption_key=None",
+        ),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (
+            ("props", True, False),
+            ("password", False, False),
+            ("rotate_encryption_key", False, True),
+        ),
+        True,
+        False,
+    ),
+    "post_wallet_reencrypt_continue": Route(
+        "POST",
+        "/api/v6.1.0.3/wallet/reencrypt_continue",
+        ("force=None",),
+        (),
+        (),
+        (("force", False, True),),
+        True,
+        False,
+    ),
+    "put_hubs_alerts_props": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/alerts/{alert}/props",
+        ("hub", "alert", "x_hvr_classified_transport_key=None", "**payload"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        "**",
+        True,
+        False,
+    ),
+    "put_hubs_definition_channels": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}",
+        (
+            "hub",
+            "channel",
+            "description=None",
+            "loc_groups=None",
+            "tables=None",
+            "actions=None",
+        ),
+        (),
+        (),
+        (
+            ("description", False, False),
+            ("loc_groups", False, False),
+            ("tables", False, False),
+            ("actions", False, False),
+        ),
+        True,
+        False,
+    ),
+    "put_hubs_definition_channels_actions": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/actions",
+        ("hub", "channel", "actions"),
+        (),
+        (),
+        (("actions", True, False),),
+        True,
+        False,
+    ),
+    "put_hubs_definition_channels_loc_groups": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/loc_groups/{loc_group}",
+        ("hub", "channel", "loc_group", "members=None"),
+        (),
+        (),
+        (("members", False, False),),
+        True,
+        False,
+    ),
+    "put_hubs_definition_channels_loc_groups_members": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/loc_groups/{loc_group}/members",
+        ("hub", "channel", "loc_group", "members"),
+        (),
+        (),
+        (("members", True, False),),
+        True,
+        False,
+    ),
+    "put_hubs_definition_channels_tables": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables",
+        ("hub", "channel", "**payload"),
+        (),
+        (),
+        "**",
+        True,
+        False,
+    ),
+    "put_hubs_definition_channels_tables_cols": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables/{table}/cols",
+        ("hub", "channel", "table", "**payload"),
+        (),
+        (),
+        "**",
+        True,
+        False,
+    ),
+    "put_hubs_definition_channels_tables_table": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/definition/channels/{channel}/tables/{table}",
+        ("hub", "channel", "table", "base_name=None", "table_group=None", "cols=None"),
+        (),
+        (),
+        (
+            ("base_name", False, False),
+            ("table_group", False, False),
+            ("cols", False, False),
+        ),
+        True,
+        False,
+    ),
+    "put_hubs_definition_hub_actions": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/definition/hub_actions",
+        ("hub", "actions"),
+        (),
+        (),
+        (("actions", True, False),),
+        True,
+        False,
+    ),
+    "put_hubs_definition_locs": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs/{loc}",
+        ("hub", "loc", "props", "x_hvr_classified_transport_key=None", "actions=None"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        (("props", True, False), ("actions", False, False)),
+        True,
+        False,
+    ),
+    "put_hubs_definition_locs_actions": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/definition/locs/{loc}/actions",
+        ("hub", "loc", "actions"),
+        (),
+        (),
+        (("actions", True, False),),
+        True,
+        False,
+    ),
+    "put_hubs_job_system_attributes": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/job_system/attributes/{attr}",
+        ("hub", "attr", "arg1", "arg2=None"),
+        (),
+        (),
+        (("arg1", True, False), ("arg2", False, False)),
+        True,
+        False,
+    ),
+    "put_hubs_job_system_env_vars": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/job_system/env_vars/{var}",
+        ("hub", "var", "value"),
+        (),
+        (),
+        (("value", True, False),),
+        True,
+        False,
+    ),
+    "put_hubs_jobs_attributes": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/jobs/{job}/attributes/{attr}",
+        ("hub", "job", "attr", "arg1", "arg2=None"),
+        (),
+        (),
+        (("arg1", True, False), ("arg2", False, False)),
+        True,
+        False,
+    ),
+    "put_hubs_jobs_env_vars": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/jobs/{job}/env_vars/{var}",
+        ("hub", "job", "var", "value"),
+        (),
+        (),
+        (("value", True, False),),
+        True,
+        False,
+    ),
+    "put_hubs_props": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/props",
+        ("hub", "**payload"),
+        (),
+        (),
+        "**",
+        True,
+        False,
+    ),
+    "put_hubs_users_props": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubs/{hub}/users/{user}/props",
+        ("hub", "user", "**payload"),
+        (),
+        (),
+        "**",
+        True,
+        False,
+    ),
+    "put_hubserver_props": Route(
+        "PUT",
+        "/api/v6.1.0.3/hubserver/props",
+        ("x_hvr_classified_transport_key=None", "**payload"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        "**",
+        True,
+        False,
+    ),
+    "put_licenses": Route(
+        "PUT",
+        "/api/v6.1.0.3/licenses/{license}",
+        ("license", "raw"),
+        (),
+        (),
+        (("raw", True, False),),
+        True,
+        False,
+    ),
+    "put_repos_props": Route(
+        "PUT",
+        "/api/v6.1.0.3/repos/props",
+        ("x_hvr_classified_transport_key=None", "**payload"),
+        (),
+        (("x_hvr_classified_transport_key", "X-Hvr-Classified-Transport-Key"),),
+        "**",
+        True,
+        False,
+    ),
+    "put_users_password": Route(
+        "PUT",
+        "/api/v6.1.0.3/users/{user}/password",
+        ("user", "new_password", "current_password=None"),
+        (),
+        (),
+        (("new_password", True, False), ("current_password", False, False)),
+        True,
+        False,
+    ),
+    "put_users_props": Route(
+        "PUT",
+        "/api/v6.1.0.3/users/{user}/props",
+        ("user", "**payload"),
+        (),
+        (),
+        "**",
+        True,
+        False,
+    ),
+}
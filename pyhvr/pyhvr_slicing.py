@@ -0,0 +1,276 @@
+import collections
+import heapq
+
+import pyhvr.pyhvr_refresh
+
+# One slice of a table; index is its number in the slicing of the table
+# (None for a table that is not sliced), rows its estimated share of rows
+Slice = collections.namedtuple("Slice", "table index slices rows")
+
+
+def slice_count(slicing):
+    """Number of slices of a slicing as post_hubs_channels_refresh takes it."""
+    if slicing.get("slices"):
+        return slicing["slices"]
+    for key in ("int_boundaries", "str_boundaries", "date_boundaries"):
+        if slicing.get(key):
+            # n boundaries cut a table in n + 1 slices
+            return len(slicing[key]) + 1
+    if slicing.get("series_values"):
+        return len(slicing["series_values"])
+    return 1
+
+
+def suggest_slicing(client, hub, channel, loc, tables, **kwargs):
+    """post_hubs_channels_locs_slicing_suggest for the tables: {table:
+    suggestion}, each with based_on, row_estimate and slicing unless
+    no_slicing is set. ``kwargs`` are the suggest options, e.g.
+    suggest_from_db_stats=True or rows_per_slice="1000000"."""
+    return (
+        client.post_hubs_channels_locs_slicing_suggest(
+            hub=hub, channel=channel, loc=loc, tables=list(tables), **kwargs
+        )
+        or {}
+    )
+
+
+def boundary_slicing(client, hub, channel, loc, table, col, slices):
+    """A boundary slicing of a table on ``col`` in ``slices`` slices from
+    post_hubs_channels_locs_tables_slicing_boundaries, None when the hub
+    has no boundaries for it."""
+    answer = client.post_hubs_channels_locs_tables_slicing_boundaries(
+        hub=hub, channel=channel, loc=loc, table=table, col=col, slices=slices
+    )
+    if not answer:
+        return None
+    return dict(answer, type="boundary", col=col)
+
+
+def table_slices(table, slicing, rows):
+    """The Slices of a table, each with an equal share of its rows."""
+    if not slicing:
+        return [Slice(table, None, 1, rows)]
+    count = slice_count(slicing)
+    return [Slice(table, i, count, rows / count) for i in range(count)]
+
+
+def pack_slices(slices, parallelism):
+    """Spread slices over at most ``parallelism`` bins with about the same
+    number of rows: largest slices first, each in the bin with the fewest
+    rows so far, or the fewest slices when the rows are equal (e.g. tables
+    without a row estimate). Returns the non-empty bins, largest first."""
+    bins = [(0, 0, i, []) for i in range(max(1, parallelism))]
+    heapq.heapify(bins)
+    for piece in sorted(slices, key=lambda s: (-s.rows, s.table, s.index or 0)):
+        rows, count, i, pieces = heapq.heappop(bins)
+        pieces.append(piece)
+        heapq.heappush(bins, (rows + piece.rows, count + 1, i, pieces))
+    return [
+        pieces
+        for _, _, _, pieces in sorted(bins, key=lambda b: (-b[0], b[2]))
+        if pieces
+    ]
+
+
+def bin_arguments(pieces, slicings):
+    """The tables and slicing arguments of the event that runs a bin; a
+    table with only some of its slices in the bin gets their selection."""
+    selections = collections.OrderedDict()
+    for piece in pieces:
+        selections.setdefault(piece.table, []).append(piece)
+    slicing = {}
+    for table, parts in selections.items():
+        if parts[0].index is None:
+            continue
+        slicing[table] = dict(slicings[table])
+        if len(parts) < parts[0].slices:
+            slicing[table]["selection"] = sorted(part.index for part in parts)
+    return list(selections), slicing
+
+
+class SlicedRun:
+    """A refresh (or compare) of tables in parallel events, balanced by
+    sliced row counts.
+
+    plan() asks the hub for a slicing of each table with
+    post_hubs_channels_locs_slicing_suggest, from the row estimates of the
+    source location. Tables without a suggestion that have a column in
+    ``columns`` get boundaries from
+    post_hubs_channels_locs_tables_slicing_boundaries. All slices are
+    packed into ``parallelism`` bins of about the same estimated number of
+    rows, and each bin becomes one event with the ``slicing`` argument,
+    selecting its slices of each table. With more than one bin, each event
+    gets a ``task`` of its own (the ``task`` argument, or refr or cmp, with
+    the number of the bin), so the bins run as separate jobs at the same
+    time instead of one after the other. run() starts the events with a
+    RefreshScheduler, which re-runs failed events; progress() shows per
+    table how many slices are queued, running, done or failed.
+
+    :param operation: post_hubs_channels_refresh or post_hubs_channels_compare
+    :param suggest: arguments of the slicing suggestion, by default
+        suggest_from_db_stats=True
+    :param kwargs: further arguments of every event, e.g. granularity="bulk"
+    """
+
+    def __init__(
+        self,
+        client,
+        hub,
+        channel,
+        source_loc,
+        target_loc,
+        tables,
+        parallelism=4,
+        operation="post_hubs_channels_refresh",
+        columns=None,
+        suggest=None,
+        retries=2,
+        **kwargs
+    ):
+        self.client = client
+        self.hub = hub
+        self.channel = channel
+        self.source_loc = source_loc
+        self.target_loc = target_loc
+        self.tables = list(tables)
+        self.parallelism = parallelism
+        self.operation = operation
+        self.columns = columns or {}
+        self.suggest = (
+            suggest if suggest is not None else {"suggest_from_db_stats": True}
+        )
+        self.retries = retries
+        self.kwargs = kwargs
+        self.suggestions = None
+        self.slicings = {}
+        self.bins = None
+        # the Slices each RefreshBatch runs
+        self.pieces = {}
+        self.scheduler = None
+
+    def plan(self):
+        """Fetch the slicings and pack the slices; returns the bins, lists
+        of Slices."""
+        self.suggestions = suggest_slicing(
+            self.client,
+            self.hub,
+            self.channel,
+            self.source_loc,
+            self.tables,
+            **self.suggest
+        )
+        slices = []
+        for table in self.tables:
+            suggestion = self.suggestions.get(table, {})
+            rows = int(suggestion.get("row_estimate") or 0)
+            slicing = (
+                None if suggestion.get("no_slicing") else suggestion.get("slicing")
+            )
+            if not slicing and table in self.columns:
+                slicing = boundary_slicing(
+                    self.client,
+                    self.hub,
+                    self.channel,
+                    self.source_loc,
+                    table,
+                    self.columns[table],
+                    self.parallelism,
+                )
+            if slicing:
+                self.slicings[table] = slicing
+            slices.extend(table_slices(table, slicing, rows))
+        self.bins = pack_slices(slices, self.parallelism)
+        return self.bins
+
+    def batches(self):
+        task = self.kwargs.get("task")
+        if task is None:
+            task = "cmp" if self.operation == "post_hubs_channels_compare" else "refr"
+        batches = []
+        for n, pieces in enumerate(self.bins):
+            tables, slicing = bin_arguments(pieces, self.slicings)
+            kwargs = {"slicing": slicing} if slicing else {}
+            if len(self.bins) > 1:
+                # one job per bin; bins of the same task would queue
+                kwargs["task"] = "%s%d" % (task, n)
+            batch = pyhvr.pyhvr_refresh.RefreshBatch(
+                self.channel, self.source_loc, self.target_loc, tables, kwargs
+            )
+            self.pieces[batch] = pieces
+            batches.append(batch)
+        return batches
+
+    def run(self, timeout=None):
+        """Start (or go on with) the events, see RefreshScheduler.run()."""
+        if self.bins is None:
+            self.plan()
+        if self.scheduler is None:
+            self.scheduler = pyhvr.pyhvr_refresh.RefreshScheduler(
+                self.client,
+                self.hub,
+                self.batches(),
+                max_per_loc=self.parallelism,
+                max_per_hub=self.parallelism,
+                retries=self.retries,
+                operation=self.operation,
+                **self.kwargs
+            )
+        return self.scheduler.run(timeout)
+
+    def progress(self):
+        """{table: {"slices", "queued", "running", "done", "failed", "rows",
+        "rows_done"}}, rows as estimated."""
+        states = {}
+        if self.scheduler is not None:
+            for state, batches in (
+                ("running", self.scheduler.running.values()),
+                ("done", self.scheduler.done),
+                ("failed", self.scheduler.failed),
+            ):
+                for batch in batches:
+                    for piece in self.pieces[batch]:
+                        states[piece] = state
+        progress = {}
+        for pieces in self.bins or []:
+            for piece in pieces:
+                table = progress.setdefault(
+                    piece.table,
+                    dict(
+                        slices=0,
+                        queued=0,
+                        running=0,
+                        done=0,
+                        failed=0,
+                        rows=0,
+                        rows_done=0,
+                    ),
+                )
+                state = states.get(piece, "queued")
+                table["slices"] += 1
+                table[state] += 1
+                table["rows"] += piece.rows
+                if state == "done":
+                    table["rows_done"] += piece.rows
+        return progress
+
+
+def sliced_refresh(
+    client, hub, channel, source_loc, target_loc, tables, parallelism=4, **kwargs
+):
+    """Refresh tables in ``parallelism`` events of sliced tables with about
+    the same number of rows; returns the finished SlicedRun."""
+    run = SlicedRun(
+        client, hub, channel, source_loc, target_loc, tables, parallelism, **kwargs
+    )
+    run.run()
+    return run
+
+
+def sliced_compare(
+    client, hub, channel, source_loc, target_loc, tables, parallelism=4, **kwargs
+):
+    """Compare tables like sliced_refresh() refreshes them."""
+    kwargs["operation"] = "post_hubs_channels_compare"
+    return sliced_refresh(
+        client, hub, channel, source_loc, target_loc, tables, parallelism, **kwargs
+    )
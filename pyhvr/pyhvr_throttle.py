@@ -0,0 +1,141 @@
+import contextlib
+import threading
+import time
+import urllib.parse
+
+import pyhvr.pyhvr_deadline
+import pyhvr.pyhvr_exceptions
+
+# Verbs that only read; all others are throttled as mutating calls
+READ_VERBS = ("GET", "HEAD")
+
+
+class TokenBucket:
+    """Allows ``rate`` requests per second on average and bursts of up to
+    ``burst`` requests."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        # Take a token, going into debt when there is none, so that waiting
+        # callers are served in order; returns the seconds until it is due
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+    def cancel(self):
+        with self.lock:
+            self.tokens = min(self.burst, self.tokens + 1)
+
+
+class Limit:
+    """Rate limit and in-flight cap for one kind of request.
+
+    :param rate: requests per second, None for no rate limit
+    :param burst: requests that may be sent at once before the rate applies,
+        by default one second worth of requests
+    :param max_in_flight: requests that may wait for an answer at the same
+        time, None for no cap
+    """
+
+    def __init__(self, rate=None, burst=None, max_in_flight=None):
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.slots = threading.Semaphore(max_in_flight) if max_in_flight else None
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+        self.in_flight = 0
+
+    @contextlib.contextmanager
+    def slot(self):
+        # Wait for a token and a free slot, but not beyond the deadline
+        start = time.monotonic()
+        if self.bucket is not None:
+            delay = self.bucket.reserve()
+            if delay > 0:
+                if not pyhvr.pyhvr_deadline.allows(delay):
+                    self.bucket.cancel()
+                    self.record(start)
+                    raise pyhvr.pyhvr_exceptions.TimeoutError(
+                        message="Deadline exceeded waiting for the rate limit"
+                    )
+                time.sleep(delay)
+        if self.slots is not None:
+            left = pyhvr.pyhvr_deadline.remaining()
+            if not self.slots.acquire(timeout=None if left is None else max(0, left)):
+                self.record(start)
+                raise pyhvr.pyhvr_exceptions.TimeoutError(
+                    message="Deadline exceeded waiting for a free request slot"
+                )
+        self.record(start, 1)
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+            if self.slots is not None:
+                self.slots.release()
+
+    def record(self, start, in_flight=0):
+        waited = time.monotonic() - start
+        with self.lock:
+            self.calls += 1
+            self.in_flight += in_flight
+            if waited > 0.001:
+                self.waited += 1
+                self.wait_seconds += waited
+
+    def stats(self):
+        """Requests seen, how many of them had to wait, the total seconds
+        they waited and the requests in flight now."""
+        with self.lock:
+            return {
+                "calls": self.calls,
+                "waited": self.waited,
+                "wait_seconds": self.wait_seconds,
+                "in_flight": self.in_flight,
+            }
+
+
+class Throttle:
+    """Client side limits for one hub server: ``read`` applies to GET
+    requests, ``write`` to the mutating verbs (POST, PUT, PATCH, DELETE)."""
+
+    def __init__(self, read=None, write=None):
+        self.read = read if read is not None else Limit()
+        self.write = write if write is not None else Limit()
+
+    def limit(self, verb):
+        return self.read if verb in READ_VERBS else self.write
+
+    def stats(self):
+        return {"read": self.read.stats(), "write": self.write.stats()}
+
+
+throttles = {}
+throttles_lock = threading.Lock()
+
+
+def for_uri(uri, read=None, write=None):
+    """The Throttle shared by all clients of the hub server at ``uri``.
+
+    The limits are set by the first call for a base URI; later calls return
+    the same Throttle and ignore ``read`` and ``write``.
+    """
+    url = urllib.parse.urlsplit(uri)
+    key = (url.scheme.lower(), url.netloc.lower())
+    with throttles_lock:
+        if key not in throttles:
+            throttles[key] = Throttle(read, write)
+        return throttles[key]
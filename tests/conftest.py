@@ -0,0 +1,251 @@
+import collections
+import json
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+import pyhvr
+import pyhvr.pyhvr_operations
+
+
+class StandinRequest:
+    def __init__(self, verb, path, query, headers, body):
+        self.verb = verb
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+
+class StandinHub:
+    """In-process stand-in for the hub's REST server.
+
+    Routes are registered per verb and path; a route is either a static
+    (status, body, headers) answer or a callable that gets the StandinRequest
+    and returns one. Login is always answered.
+    """
+
+    def __init__(self, expires_in=3600):
+        self.routes = {}
+        self.requests = []
+        self.connections = 0
+        self.logins = 0
+        self.refreshes = 0
+        self.login_delay = 0
+        self.expires_in = expires_in
+        self.lock = threading.Lock()
+        self.server = None
+
+    @property
+    def uri(self):
+        return "http://127.0.0.1:%d" % self.server.server_address[1]
+
+    def route(self, verb, path, body=None, status=200, headers=None):
+        if callable(body):
+            self.routes[(verb, path)] = body
+        else:
+            self.routes[(verb, path)] = (status, body, headers or {})
+
+    def calls(self, verb=None, path=None):
+        return [
+            r
+            for r in self.requests
+            if (verb is None or r.verb == verb) and (path is None or r.path == path)
+        ]
+
+    def login(self, request):
+        time.sleep(self.login_delay)
+        with self.lock:
+            if request.path == "/auth/v1/refresh":
+                self.refreshes += 1
+            else:
+                self.logins += 1
+            n = self.logins + self.refreshes
+        token = {"access_token": "token%d" % n, "expires_in": self.expires_in}
+        if request.path != "/auth/v1/setup":
+            token["refresh_token"] = "refresh%d" % n
+        return 200, token, {}
+
+    def answer(self, request):
+        if request.path.startswith("/auth/v1/"):
+            return self.login(request)
+        with self.lock:
+            self.requests.append(request)
+        route = self.routes.get((request.verb, request.path))
+        if route is None:
+            return 404, "F_JR0001: no route " + request.path, {}
+        if callable(route):
+            return route(request)
+        return route
+
+    def start(self):
+        hub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            wbufsize = -1
+
+            def setup(self):
+                with hub.lock:
+                    hub.connections += 1
+                BaseHTTPRequestHandler.setup(self)
+
+            def log_message(self, *args):
+                pass
+
+            def handle_any(self):
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                try:
+                    body = json.loads(raw) if raw else None
+                except ValueError:
+                    body = raw
+                request = StandinRequest(
+                    self.command,
+                    url.path,
+                    parse_qs(url.query),
+                    dict(self.headers),
+                    body,
+                )
+                status, payload, headers = hub.answer(request)
+                if payload is None:
+                    data = b""
+                elif isinstance(payload, bytes):
+                    data = payload
+                elif isinstance(payload, str):
+                    data = payload.encode()
+                else:
+                    data = json.dumps(payload).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = handle_any
+
+        class Server(socketserver.ThreadingMixIn, HTTPServer):
+            daemon_threads = True
+
+        self.server = Server(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def standin_hub():
+    hub = StandinHub()
+    hub.start()
+    yield hub
+    hub.stop()
+
+
+class StandinEvents:
+    """Events on the stand-in hub: get_hubs_events and
+    post_hubs_events_cancel, plus the operations of channels that post an
+    event (see operation()).
+
+    An event is ACTIVE until it was asked for ``polls`` times, then DONE,
+    or FAILED if ``fails(event)`` is true. The events that ran at the same
+    time are counted per location (``peak_locs``), per job (``peak_job``)
+    and on the hub (``peak``).
+    """
+
+    # the task a job is named after when the call has none
+    TASKS = {"refresh": "refr", "compare": "cmp"}
+
+    def __init__(self, hub, polls=2, hub_name="hvrhub"):
+        self.api = "/api/v6.1.0.3/hubs/" + hub_name
+        self.hub = hub
+        self.polls = polls
+        self.fails = lambda event: False
+        self.events = {}
+        self.bodies = []
+        self.queries = []
+        self.canceled = []
+        self.peak_locs = collections.Counter()
+        self.peak_job = 0
+        self.peak = 0
+        hub.route("GET", self.api + "/events", self.get)
+        hub.route("POST", self.api + "/events_cancel", self.cancel)
+
+    def operation(self, channel="chn", name="refresh"):
+        """Answer post_hubs_channels_<name> of ``channel`` with a new event."""
+
+        def start(request):
+            return self.start(channel, name, request.body)
+
+        self.hub.route("POST", "%s/channels/%s/%s" % (self.api, channel, name), start)
+
+    def add(self, ev_id=None, polls=None, **event):
+        """A new ACTIVE event, done after ``polls`` polls; returns its id."""
+        if ev_id is None:
+            ev_id = "2022-03-01T10:%02d:%02dZ" % divmod(len(self.events), 60)
+        polls = self.polls if polls is None else polls
+        self.events[ev_id] = dict(
+            event, ev_id=ev_id, n=len(self.events), state="ACTIVE", asked=0, polls=polls
+        )
+        return ev_id
+
+    def start(self, channel, name, body):
+        self.bodies.append(body)
+        source, target = body.get("source_loc"), body.get("target_loc")
+        task = body.get("task", self.TASKS.get(name, name))
+        job = "%s-%s-%s-%s" % (channel, task, source, target)
+        ev_id = self.add(type=name.title(), job=job, locs={source, target}, body=body)
+        active = [e for e in self.events.values() if e["state"] == "ACTIVE"]
+        self.peak = max(self.peak, len(active))
+        self.peak_job = max(self.peak_job, sum(e.get("job") == job for e in active))
+        for loc in (source, target):
+            running = sum(loc in e.get("locs", ()) for e in active)
+            self.peak_locs[loc] = max(self.peak_locs[loc], running)
+        return 201, {"job": job, "posted_ev_id": ev_id}, {}
+
+    def get(self, request):
+        self.queries.append(request.query)
+        answer = {}
+        for ev_id in request.query.get("ev_id", []):
+            event = self.events.get(ev_id)
+            if event is None:
+                continue
+            event["asked"] += 1
+            if event["state"] == "ACTIVE" and event["asked"] >= event["polls"]:
+                event["state"] = "FAILED" if self.fails(event) else "DONE"
+            answer[ev_id] = {
+                "type": event.get("type", "Refresh"),
+                "state": event["state"],
+            }
+            if event["state"] == "DONE":
+                answer[ev_id]["results"] = [
+                    {"table": "orders", "result": "rows", "value": "3"}
+                ]
+        return 200, answer, {}
+
+    def cancel(self, request):
+        ev_ids = request.body["ev_ids"]
+        self.canceled.extend(ev_ids)
+        for ev_id in ev_ids:
+            self.events[ev_id]["state"] = "CANCELED"
+        return 204, "", {}
+
+
+@pytest.fixture
+def standin_events(standin_hub):
+    return StandinEvents(standin_hub)
+
+
+@pytest.fixture
+def hvr_client(standin_hub):
+    client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+    # operations are polled for without the usual half second wait
+    pyhvr.pyhvr_operations.event_poller(client).poll_min = 0.01
+    return client
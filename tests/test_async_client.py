@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import pyhvr
+
+pytest.importorskip("aiohttp")
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_same_methods_as_client():
+    from pyhvr.pyhvr_async_client import AsyncClient
+
+    names = [n for n in dir(pyhvr.Client) if n.startswith(("get_", "post_", "put_"))]
+    for name in names:
+        assert asyncio.iscoroutinefunction(getattr(AsyncClient, name)), name
+
+
+def test_concurrency_limit(standin_hub):
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def jobs(request):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+        return 200, {"chan-activate": {"state": "RUNNING"}}, {}
+
+    standin_hub.route("GET", "/api/v6.1.0.3/hubs/hvrhub/jobs", jobs)
+
+    async def poll():
+        async with pyhvr.async_client(
+            username="admin", password="pw", uri=standin_hub.uri, max_concurrency=5
+        ) as hvr_client:
+            return await asyncio.gather(
+                *[
+                    hvr_client.get_hubs_jobs(hub="hvrhub", channel=["a", "b"])
+                    for _ in range(30)
+                ]
+            )
+
+    results = run(poll())
+
+    assert len(results) == 30
+    assert results[0] == {"chan-activate": {"state": "RUNNING"}}
+    assert standin_hub.logins == 1
+    assert in_flight[1] <= 5
+    assert standin_hub.calls()[0].query == {"channel": ["a", "b"]}
+
+
+def test_rest_error(standin_hub):
+    async def call():
+        async with pyhvr.async_client(
+            username="admin", password="pw", uri=standin_hub.uri
+        ) as hvr_client:
+            await hvr_client.get_hubserver_clock()
+
+    with pytest.raises(pyhvr.pyhvr_exceptions.RestError) as e:
+        run(call())
+    assert e.value.status_code == 404
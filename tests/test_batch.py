@@ -0,0 +1,52 @@
+import threading
+import time
+
+import pytest
+
+import pyhvr
+from pyhvr.pyhvr_exceptions import RestError
+
+
+def test_batch(standin_hub):
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def channel(request):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        name = request.path.split("/")[-1]
+        return 200, {"channel": name}, {}
+
+    for n in range(40):
+        standin_hub.route(
+            "GET", "/api/v6.1.0.3/hubs/hvrhub/definition/channels/ch%d" % n, channel
+        )
+    hvr_client = pyhvr.client(
+        username="admin", password="pw", uri=standin_hub.uri, pool_maxsize=4
+    )
+
+    calls = [
+        (
+            "get_hubs_definition_channels_channel",
+            {"hub": "hvrhub", "channel": "ch%d" % n},
+        )
+        for n in range(41)
+    ]
+    results = hvr_client.batch(calls)
+
+    assert results[:40] == [{"channel": "ch%d" % n} for n in range(40)]
+    assert isinstance(results[40], RestError)
+    assert results[40].status_code == 404
+    assert 1 < in_flight[1] <= 4
+    assert standin_hub.logins == 1
+
+
+def test_batch_unknown_method(standin_hub):
+    hvr_client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+
+    with pytest.raises(AttributeError):
+        hvr_client.batch([("get_nothing", {})])
@@ -0,0 +1,113 @@
+import time
+
+import pyhvr
+from pyhvr.pyhvr_cache import ResponseCache, mutation_scope
+
+BASE = "/api/v6.1.0.3/hubs/hvrhub/definition"
+
+
+def client(uri, cache):
+    return pyhvr.client(username="admin", password="pw", uri=uri, cache=cache)
+
+
+def test_hit_and_miss(standin_hub):
+    standin_hub.route("GET", BASE + "/channels/chn", {"tables": {}})
+    cache = ResponseCache()
+    hvr_client = client(standin_hub.uri, cache)
+
+    first = hvr_client.get_hubs_definition_channels_channel(hub="hvrhub", channel="chn")
+    first["tables"]["t"] = {}
+    second = hvr_client.get_hubs_definition_channels_channel(
+        hub="hvrhub", channel="chn"
+    )
+
+    assert second == {"tables": {}}
+    assert len(standin_hub.calls()) == 1
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "invalidations": 0,
+        "size": 1,
+    }
+
+
+def test_query_is_part_of_key(standin_hub):
+    standin_hub.route("GET", BASE, {"channels": {}})
+    hvr_client = client(standin_hub.uri, ResponseCache())
+
+    hvr_client.get_hubs_definition(hub="hvrhub")
+    hvr_client.get_hubs_definition(hub="hvrhub", channel=["a"])
+    hvr_client.get_hubs_definition(hub="hvrhub", channel=["a"])
+    assert len(standin_hub.calls()) == 2
+
+
+def test_only_definitions_are_cached(standin_hub):
+    standin_hub.route("GET", "/api/v6.1.0.3/hubs/hvrhub/jobs", {})
+    hvr_client = client(standin_hub.uri, ResponseCache())
+
+    hvr_client.get_hubs_jobs(hub="hvrhub")
+    hvr_client.get_hubs_jobs(hub="hvrhub")
+    assert len(standin_hub.calls()) == 2
+
+
+def test_ttl_and_lru(standin_hub):
+    for channel in ("a", "b", "c"):
+        standin_hub.route("GET", BASE + "/channels/" + channel, {})
+    cache = ResponseCache(maxsize=2, ttl=0.2)
+    hvr_client = client(standin_hub.uri, cache)
+
+    for channel in ("a", "b", "a", "c", "a"):
+        hvr_client.get_hubs_definition_channels_channel(hub="hvrhub", channel=channel)
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["hits"] == 2
+
+    time.sleep(0.25)
+    hvr_client.get_hubs_definition_channels_channel(hub="hvrhub", channel="a")
+    assert cache.stats()["hits"] == 2
+
+
+def test_mutation_invalidates_subtree_and_ancestors(standin_hub):
+    standin_hub.route("GET", BASE, {})
+    standin_hub.route("GET", BASE + "/channels/chn", {})
+    standin_hub.route("GET", BASE + "/channels/other", {})
+    standin_hub.route("GET", BASE + "/locs/src", {})
+    standin_hub.route("PATCH", BASE + "/channels/chn/tables", {})
+    cache = ResponseCache()
+    hvr_client = client(standin_hub.uri, cache)
+
+    hvr_client.get_hubs_definition(hub="hvrhub")
+    for channel in ("chn", "other"):
+        hvr_client.get_hubs_definition_channels_channel(hub="hvrhub", channel=channel)
+    hvr_client.get_hubs_definition_locs_loc(hub="hvrhub", loc="src")
+
+    hvr_client.patch_hubs_definition_channels_tables(
+        hub="hvrhub", channel="chn", tables={}
+    )
+    assert cache.stats()["invalidations"] == 2
+    assert cache.stats()["size"] == 2
+
+
+def test_failed_mutation_invalidates(standin_hub):
+    standin_hub.route("GET", BASE + "/channels/chn", {})
+    cache = ResponseCache()
+    hvr_client = client(standin_hub.uri, cache)
+
+    hvr_client.get_hubs_definition_channels_channel(hub="hvrhub", channel="chn")
+    try:
+        hvr_client.delete_hubs_definition_channels(hub="hvrhub", channel="chn")
+    except pyhvr.pyhvr_exceptions.RestError:
+        pass
+    assert cache.stats()["size"] == 0
+
+
+def test_mutation_scope():
+    assert mutation_scope(BASE + "/channels/chn/tables_delete") == tuple(
+        (BASE + "/channels/chn/tables").strip("/").split("/")
+    )
+    assert mutation_scope(BASE + "/locs/src/rename") == tuple(
+        BASE.strip("/").split("/")
+    )
+    assert mutation_scope(BASE + "/locs/src") == tuple(BASE.strip("/").split("/"))
+    assert mutation_scope(BASE + "/import/analyze") is None
+    assert mutation_scope("/api/v6.1.0.3/hubs/hvrhub/events") is None
@@ -0,0 +1,89 @@
+import math
+
+import pytest
+
+import pyhvr
+
+numpy = pytest.importorskip("numpy")
+
+from pyhvr.pyhvr_columnar import MetricFrame  # noqa: E402
+from pyhvr.pyhvr_metrics import epoch  # noqa: E402
+
+ANSWER = {
+    "Captured Rows": {
+        "1": {
+            "clt": {
+                "chn": {
+                    "src": {
+                        "orders": {
+                            "2022-03-01T10:00:00Z": 10,
+                            "2022-03-01T10:01:00Z": 5,
+                        },
+                        "lines": {"2022-03-01T10:00:00Z": 3},
+                    }
+                }
+            }
+        }
+    },
+    "Capture Latency": {
+        "1": {
+            "cl*": {
+                "chn": {
+                    "src": {
+                        "*": {"2022-03-01T10:00:00Z": "2", "2022-03-01T10:01:00Z": "x"}
+                    }
+                }
+            }
+        }
+    },
+}
+
+
+def test_columns():
+    frame = MetricFrame.from_answer(ANSWER)
+    assert len(frame) == 5
+    assert frame.tstamp.dtype == numpy.int64
+    assert frame.value.dtype == numpy.float64
+    assert frame.codes["table"].dtype == numpy.int32
+    assert list(frame.categories["table"]) == ["orders", "lines", "*"]
+    assert (
+        list(frame.column("metric")) == ["Captured Rows"] * 3 + ["Capture Latency"] * 2
+    )
+    assert frame.tstamp[0] == epoch("2022-03-01T10:00:00+00:00") == 1646128800
+    assert math.isnan(frame.value[-1])
+
+
+def test_aggregate_and_select():
+    frame = MetricFrame.from_answer(ANSWER)
+    assert frame.aggregate().to_dict() == {
+        ("Captured Rows",): 18.0,
+        ("Capture Latency",): 2.0,
+    }
+    assert frame.aggregate(by=("table", "tstamp"), how="count").to_dict() == {
+        ("orders", 1646128800): 1,
+        ("orders", 1646128860): 1,
+        ("lines", 1646128800): 1,
+        ("*", 1646128800): 1,
+    }
+    rows = frame.select(metric=["Captured Rows"], tstamp_end="2022-03-01T10:01:00Z")
+    assert len(rows) == 2
+    assert rows.aggregate(by=("metric",), how="max").to_dict() == {
+        ("Captured Rows",): 10.0
+    }
+    with pytest.raises(ValueError):
+        frame.aggregate(how="median")
+
+
+def test_get_metrics(standin_hub):
+    standin_hub.route("GET", "/api/v6.1.0.3/hubs/hvrhub/stats/metrics", ANSWER)
+    hvr_client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+    frame = pyhvr.pyhvr_columnar.get_metrics(hvr_client, "hvrhub", channel=["chn"])
+    assert len(frame) == 5
+    call = standin_hub.calls("GET", "/api/v6.1.0.3/hubs/hvrhub/stats/metrics")[0]
+    assert call.query == {"channel": ["chn"], "fetch_values": ["true"]}
+
+
+def test_get_metrics_empty_answer(standin_hub):
+    standin_hub.route("GET", "/api/v6.1.0.3/hubs/hvrhub/stats/metrics", None)
+    hvr_client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+    assert len(pyhvr.pyhvr_columnar.get_metrics(hvr_client, "hvrhub")) == 0
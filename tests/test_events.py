@@ -0,0 +1,89 @@
+import time
+
+import pytest
+
+import pyhvr
+
+API = "/api/v6.1.0.3/hubs/hvrhub/events"
+
+
+def test_wait_for_event(standin_events, hvr_client):
+    standin_events.add("2022-03-01T10:00:00.000001Z", polls=3)
+    event = hvr_client.wait_for_event(
+        "hvrhub", "2022-03-01T10:00:00.000001Z", timeout=5, poll_min=0.01
+    )
+    assert event["state"] == "DONE"
+    assert event["results"][0]["value"] == "3"
+    assert len(standin_events.queries) == 3
+    assert standin_events.queries[0]["fetch_results"] == ["true"]
+
+
+def test_wait_for_events_polls_them_together(standin_events, hvr_client):
+    a, b, c = (standin_events.add(polls=polls) for polls in (1, 2, 4))
+    finished = hvr_client.wait_for_events("hvrhub", [a, b, c], timeout=5, poll_min=0.01)
+    assert list(finished) == [a, b, c]
+    assert [q["ev_id"] for q in standin_events.queries] == [[a, b, c], [b, c], [c], [c]]
+
+
+def test_wait_timeout_and_unknown_event(standin_events, hvr_client):
+    standin_events.add("2022-03-01T10:00:00Z", polls=1000)
+    begin = time.monotonic()
+    with pytest.raises(pyhvr.pyhvr_exceptions.TimeoutError):
+        hvr_client.wait_for_event(
+            "hvrhub", "2022-03-01T10:00:00Z", timeout=0.3, poll_min=0.05
+        )
+    assert 0.3 <= time.monotonic() - begin < 1
+
+    with pytest.raises(pyhvr.pyhvr_exceptions.RestError) as e:
+        hvr_client.wait_for_event("hvrhub", "2022-03-01T11:00:00Z", timeout=1)
+    assert e.value.status_code == 404
+
+
+def test_wait_polls_until_the_timeout(standin_events, hvr_client):
+    # polls at 0, 0.2 and, instead of 0.6, at the timeout
+    standin_events.add("2022-03-01T10:00:00Z", polls=3)
+    event = hvr_client.wait_for_event(
+        "hvrhub", "2022-03-01T10:00:00Z", timeout=0.5, poll_min=0.2, poll_max=0.4
+    )
+    assert event["state"] == "DONE"
+    assert len(standin_events.queries) == 3
+
+
+def test_event_history_windows(standin_hub, hvr_client):
+    # a burst of 30 events in one minute, then one per hour
+    ev_ids = ["2022-03-01T10:00:%02d.000000Z" % i for i in range(30)]
+    ev_ids += ["2022-03-01T%02d:00:00.000000Z" % h for h in range(11, 20)]
+    queries = []
+
+    def events(request):
+        query = {k: v[0] for k, v in request.query.items()}
+        queries.append(query)
+        # inclusive bounds, at most max_events of them
+        found = [
+            e
+            for e in ev_ids
+            if query["ev_tstamp_begin"][:19] <= e[:19] <= query["ev_tstamp_end"][:19]
+        ]
+        found = found[: int(query["max_events"])]
+        return 200, {e: {"type": "Refresh", "state": "DONE"} for e in found}, {}
+
+    standin_hub.route("GET", API, events)
+    standin_hub.route("GET", "/api/v6.1.0.3/repos/events", events)
+    history = pyhvr.pyhvr_events.EventHistory(
+        hvr_client,
+        "hvrhub",
+        "2022-03-01T09:00:00Z",
+        "2022-03-01T20:00:00Z",
+        window=600,
+        max_events=8,
+        type=["Refresh"],
+    )
+    assert [e["ev_id"] for e in history] == ev_ids
+    assert history.splits > 0
+    assert history.truncated == 0
+    assert queries[0]["type"] == "Refresh"
+
+    repos = pyhvr.pyhvr_events.event_history(
+        hvr_client, None, "2022-03-01T18:30:00Z", "2022-03-01T20:00:00Z"
+    )
+    assert [e["ev_id"] for e in repos] == ev_ids[-1:]
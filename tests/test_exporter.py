@@ -0,0 +1,112 @@
+import threading
+import time
+
+import requests
+
+import pyhvr
+from pyhvr.pyhvr_exporter import Exporter, metric_name
+
+API = "/api/v6.1.0.3/hubs/hvrhub"
+
+METRICS = {
+    "Captured Rows": {
+        "1": {
+            "cl*": {
+                "chn": {
+                    "src": {
+                        "*": {"2022-03-01T10:00:00Z": 10, "2022-03-01T10:01:00Z": 7}
+                    }
+                }
+            }
+        }
+    }
+}
+
+
+def test_metric_name():
+    assert metric_name("Captured Rows") == "hvr_captured_rows"
+    assert metric_name("Capture Latency (Max)") == "hvr_capture_latency_max"
+
+
+def test_exporter_serves_last_poll(standin_hub):
+    standin_hub.route("GET", API + "/stats/metrics", METRICS)
+    standin_hub.route(
+        "GET",
+        API + "/jobs",
+        {"chn-cap-src": {"state": "RUNNING", "num_retries": 0, "latency": 4}},
+    )
+    standin_hub.route(
+        "GET", API + "/stats/oldest", {"1": {"cl*": "2022-03-01T00:00:00Z"}}
+    )
+    hvr_client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+    exporter = Exporter(hvr_client, ["hvrhub"])
+    exporter.poll()
+
+    server = exporter.server("127.0.0.1", 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = "http://127.0.0.1:%d" % server.server_address[1]
+        page = requests.get(url + "/metrics").text
+        assert requests.get(url + "/other").status_code == 404
+
+        # a scrape serves the page of the last poll, it does not call the hub
+        calls = len(standin_hub.calls())
+        requests.get(url + "/metrics")
+        assert len(standin_hub.calls()) == calls
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    lines = page.splitlines()
+    assert "# TYPE hvr_captured_rows gauge" in lines
+    assert (
+        'hvr_captured_rows{hub="hvrhub",channel="chn",loc="src",table="*",time_gran="1"} 7.0'
+        in lines
+    )
+    assert 'hvr_job_state{hub="hvrhub",job="chn-cap-src",state="RUNNING"} 1.0' in lines
+    assert 'hvr_job_latency{hub="hvrhub",job="chn-cap-src"} 4.0' in lines
+    assert (
+        'hvr_stats_oldest_timestamp_seconds{hub="hvrhub",time_gran="1",scope="cl*"} 1646092800.0'
+        in lines
+    )
+    assert 'hvr_up{hub="hvrhub"} 1.0' in lines
+
+    # a failing endpoint keeps its last values
+    standin_hub.route("GET", API + "/jobs", "F_JR0001: failed", 400)
+    exporter.poll()
+    lines = exporter.page.decode().splitlines()
+    assert 'hvr_job_latency{hub="hvrhub",job="chn-cap-src"} 4.0' in lines
+    assert 'hvr_up{hub="hvrhub"} 0.0' in lines
+    assert 'hvr_exporter_errors_total{hub="hvrhub",endpoint="jobs"} 1.0' in lines
+    assert "# TYPE hvr_exporter_errors_total counter" in lines
+
+    # so is one whose answer cannot be used
+    standin_hub.route("GET", API + "/stats/oldest", {"1": {"cl*": "yesterday"}})
+    exporter.poll()
+    lines = exporter.page.decode().splitlines()
+    assert (
+        'hvr_exporter_errors_total{hub="hvrhub",endpoint="stats_oldest"} 1.0' in lines
+    )
+
+
+def test_exporter_survives_failing_poll(standin_hub):
+    hvr_client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+    exporter = Exporter(hvr_client, ["hvrhub"], interval=0.01)
+    exporter.up["hvrhub"] = True
+
+    def samples():
+        raise ValueError("unexpected answer")
+
+    exporter.samples = samples
+    exporter.start()
+    try:
+        for _ in range(500):
+            if exporter.failures >= 2:
+                break
+            time.sleep(0.01)
+    finally:
+        exporter.close()
+    assert exporter.failures >= 2
+    lines = exporter.page.decode().splitlines()
+    assert 'hvr_up{hub="hvrhub"} 0.0' in lines
+    assert "# TYPE hvr_exporter_poll_failures_total counter" in lines
@@ -0,0 +1,96 @@
+import pyhvr
+import pyhvr.pyhvr_jobs
+
+API = "/api/v6.1.0.3/hubs/hvrhub/jobs"
+
+
+class Jobs:
+    """Jobs served like the hub does, with the last update of each"""
+
+    def __init__(self, standin_hub):
+        self.jobs = {}
+        self.updated = {}
+        self.clock = 0
+        self.schederr = "2022-03-01T00:00:00Z"
+        self.queries = []
+        # changes made just before the answer to the n-th request
+        self.changes = {}
+        standin_hub.route("GET", API, self.get)
+
+    def tstamp(self, clock):
+        return "2022-03-01T10:00:%02dZ" % clock
+
+    def set(self, job, **info):
+        self.clock += 1
+        self.jobs[job] = dict(self.jobs.get(job, {}), **info)
+        self.updated[job] = self.tstamp(self.clock)
+
+    def get(self, request):
+        self.queries.append(request.query)
+        for job, info in self.changes.pop(len(self.queries), {}).items():
+            self.set(job, **info)
+        since = request.query.get("updated_jobs_since", [""])[0]
+        jobs = {j: info for j, info in self.jobs.items() if self.updated[j] > since}
+        headers = {
+            "X-Hvr-Jobs-Last-Updated": self.tstamp(self.clock),
+            "X-Hvr-Err-Last-Updated": self.tstamp(self.clock),
+            "X-Hvr-Schederr-Last-Updated": self.schederr,
+        }
+        return 200, jobs, headers
+
+
+def test_watch_reports_changes(standin_hub):
+    jobs = Jobs(standin_hub)
+    jobs.set("chn-cap-src", state="RUNNING")
+    jobs.set("chn-integ-tgt", state="RUNNING")
+    hvr_client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+    watch = pyhvr.pyhvr_jobs.JobWatch(hvr_client, "hvrhub", channel="chn")
+
+    assert watch.poll() == []
+    assert sorted(watch.jobs) == ["chn-cap-src", "chn-integ-tgt"]
+
+    jobs.set("chn-integ-tgt", state="FAILED", log_job_err_tstamp="2022-03-01T10:01Z")
+    jobs.set("chn-refr-src-tgt", state="PENDING")
+    jobs.schederr = "2022-03-01T10:01:00Z"
+    assert watch.poll() == [
+        pyhvr.pyhvr_jobs.JobStateChanged(
+            "chn-integ-tgt", "RUNNING", "FAILED", jobs.jobs["chn-integ-tgt"]
+        ),
+        pyhvr.pyhvr_jobs.JobError(
+            "chn-integ-tgt", "2022-03-01T10:01Z", jobs.jobs["chn-integ-tgt"]
+        ),
+        pyhvr.pyhvr_jobs.JobAdded("chn-refr-src-tgt", {"state": "PENDING"}),
+        pyhvr.pyhvr_jobs.SchedulerError("2022-03-01T10:01:00Z"),
+    ]
+    # only the jobs changed since the last answer were asked for
+    assert jobs.queries[1]["updated_jobs_since"] == ["2022-03-01T10:00:02Z"]
+    assert jobs.queries[1]["channel"] == ["chn"]
+    assert watch.poll() == []
+
+    # a deleted job is only seen when all jobs are fetched
+    del jobs.jobs["chn-refr-src-tgt"]
+    watch.full_at = 0
+    assert watch.poll() == [
+        pyhvr.pyhvr_jobs.JobRemoved("chn-refr-src-tgt", {"state": "PENDING"})
+    ]
+    assert "updated_jobs_since" not in jobs.queries[-1]
+
+
+def test_watch_jobs_generator(standin_hub):
+    jobs = Jobs(standin_hub)
+    jobs.set("chn-cap-src", state="RUNNING")
+    jobs.changes[3] = {"chn-cap-src": {"state": "SUSPEND"}}
+    hvr_client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+    events = hvr_client.watch_jobs("hvrhub", poll_min=0.01, poll_max=0.05)
+    assert next(events) == pyhvr.pyhvr_jobs.JobStateChanged(
+        "chn-cap-src", "RUNNING", "SUSPEND", {"state": "SUSPEND"}
+    )
+    assert len(jobs.queries) == 3
+
+
+def test_watch_empty_answer(standin_hub):
+    standin_hub.route("GET", API, None)
+    hvr_client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+    watch = pyhvr.pyhvr_jobs.JobWatch(hvr_client, "hvrhub")
+    assert watch.poll() == []
+    assert watch.jobs == {}
@@ -0,0 +1,68 @@
+from pyhvr.pyhvr_log_parser import LogRecord, parse_log
+
+LOG = b"""2022-03-01T02:00:00+01:00: chn-cap-src: Capture cycle 1.
+2022-03-01T02:00:05+01:00: chn-integ-tgt: W_JR0804: Table 'orders' has no key.
+2022-03-01T02:00:10+01:00: chn-integ-tgt: F_JR071E: Integrate failed.
+  ORA-00942: table or view does not exist
+2022-03-01T02:15:00+01:00: hvrhub: Scheduler started.
+"""
+
+
+def test_parse():
+    records = list(parse_log(LOG))
+    assert [(r.tstamp, r.job, r.severity, r.code) for r in records] == [
+        ("2022-03-01T02:00:00+01:00", "chn-cap-src", "info", None),
+        ("2022-03-01T02:00:05+01:00", "chn-integ-tgt", "warning", "W_JR0804"),
+        ("2022-03-01T02:00:10+01:00", "chn-integ-tgt", "error", "F_JR071E"),
+        ("2022-03-01T02:15:00+01:00", "hvrhub", "info", None),
+    ]
+    assert records[2].message == (
+        "Integrate failed.\n  ORA-00942: table or view does not exist"
+    )
+    assert isinstance(records[0].raw, memoryview)
+    assert not hasattr(records[0], "__dict__")
+
+
+def test_filters():
+    def codes(**filters):
+        return [r.code for r in parse_log(LOG, **filters)]
+
+    assert codes(severity=["error", "warning"]) == ["W_JR0804", "F_JR071E"]
+    assert codes(codes=["F_JR071E"]) == ["F_JR071E"]
+    assert codes(jobs=["hvrhub"]) == [None]
+    assert codes(
+        tstamp_begin="2022-03-01T02:00:05", tstamp_end="2022-03-01 02:15:00"
+    ) == ["W_JR0804", "F_JR071E"]
+
+
+def test_filtered_record_keeps_its_continuation_lines():
+    records = list(parse_log(LOG, codes=["W_JR0804"]))
+    assert records[0].message == "Table 'orders' has no key."
+
+
+def test_str_and_partial_first_line():
+    text = "of a line cut off\n" + LOG.decode()
+    records = list(parse_log(text))
+    assert len(records) == 4
+    assert isinstance(records[0], LogRecord)
+
+
+def test_info_filter():
+    def jobs(**filters):
+        return [(r.job, r.severity) for r in parse_log(LOG, **filters)]
+
+    assert jobs(severity=["info"]) == [("chn-cap-src", "info"), ("hvrhub", "info")]
+    assert jobs(severity=["warning", "info"]) == [
+        ("chn-cap-src", "info"),
+        ("chn-integ-tgt", "warning"),
+        ("hvrhub", "info"),
+    ]
+
+
+def test_record_without_job():
+    text = b"2022-03-01T02:00:00: F_JR071E: no job\n2022-03-01T02:00:01: chn: ok\n"
+    expected = [(None, "F_JR071E", "error")]
+    for filters in ({}, {"codes": ["F_JR071E"]}, {"severity": ["error"]}):
+        records = list(parse_log(text, **filters))
+        assert [(r.job, r.code, r.severity) for r in records][:1] == expected
+    assert [r.job for r in parse_log(text, severity=["info"])] == ["chn"]
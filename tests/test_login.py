@@ -0,0 +1,58 @@
+import threading
+import time
+
+import pyhvr
+
+
+def test_single_flight_login(standin_hub):
+    standin_hub.route("GET", "/api/v6.1.0.3/hubserver/clock", {"tstamp": "now"})
+    standin_hub.login_delay = 0.2
+    hvr_client = pyhvr.client(
+        username="admin", password="pw", uri=standin_hub.uri, pool_maxsize=20
+    )
+    barrier = threading.Barrier(20)
+
+    def call():
+        barrier.wait()
+        hvr_client.get_hubserver_clock()
+
+    threads = [threading.Thread(target=call) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert standin_hub.logins == 1
+    assert len(standin_hub.calls("GET")) == 20
+    assert {r.headers["Authorization"] for r in standin_hub.calls()} == {
+        "bearer token1"
+    }
+
+
+def test_refresh_token(standin_hub):
+    standin_hub.route("GET", "/api/v6.1.0.3/hubserver/clock", {"tstamp": "now"})
+    hvr_client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+
+    hvr_client.get_hubserver_clock()
+    hvr_client.bearer_token_valid_until = 0
+    hvr_client.get_hubserver_clock()
+
+    assert standin_hub.logins == 1
+    assert standin_hub.refreshes == 1
+    assert standin_hub.calls()[1].headers["Authorization"] == "bearer token2"
+
+
+def test_background_refresh(standin_hub):
+    standin_hub.route("GET", "/api/v6.1.0.3/hubserver/clock", {"tstamp": "now"})
+    # token is valid for 61 - 60 seconds, renewed after 0.8 seconds
+    standin_hub.expires_in = 61
+    with pyhvr.client(
+        username="admin", password="pw", uri=standin_hub.uri, background_refresh=True
+    ) as hvr_client:
+        hvr_client.login()
+        time.sleep(1.2)
+        assert standin_hub.refreshes == 1
+        assert hvr_client.bearer_token == "token2"
+        hvr_client.get_hubserver_clock()
+
+    assert standin_hub.logins == 1
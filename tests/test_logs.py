@@ -0,0 +1,260 @@
+import hashlib
+import zlib
+
+import pyhvr
+
+LOGS = "/api/v6.1.0.3/hubs/hvrhub/logs/"
+API = LOGS + "hvr.out"
+
+
+class Log:
+    """A log file served like the hub does, with offsets and a head CRC"""
+
+    def __init__(self, standin_hub, data=b"", file="hvr.out"):
+        self.data = data
+        self.archives = {}
+        self.requests = []
+        standin_hub.route("GET", LOGS + file, self.get)
+
+    def rotate(self, archive):
+        self.archives[archive] = self.data
+        self.data = b""
+
+    def get(self, request):
+        self.requests.append(request.query)
+        query = {k: v[0] for k, v in request.query.items()}
+        headers = {
+            "X-Hvr-File-Size": str(len(self.data)),
+            "X-Hvr-Head-Crc": str(zlib.crc32(self.data[:16])) if self.data else "0",
+        }
+        if self.archives:
+            headers["X-Hvr-Log-Previous"] = list(self.archives)[-1]
+        if (
+            query.get("head_crc", headers["X-Hvr-Head-Crc"])
+            != headers["X-Hvr-Head-Crc"]
+        ):
+            headers["X-Hvr-Offset-Begin"] = headers["X-Hvr-Offset-End"] = "0"
+            return 200, b"", headers
+        return answer(self.data, query, headers)
+
+
+def answer(data, query, headers):
+    max_lines = int(query.get("max_lines", 1000000))
+    if query.get("search_eof") == "true":
+        begin = len(data)
+        for _ in range(max_lines):
+            begin = data.rfind(b"\n", 0, begin - 1) + 1 if begin else 0
+            if begin == 0:
+                break
+    else:
+        begin = int(query.get("offset_begin", 0))
+    end = begin
+    for _ in range(max_lines):
+        nl = data.find(b"\n", end)
+        end = len(data) if nl < 0 else nl + 1
+        if nl < 0:
+            break
+    if "offset_end" in query:
+        end = min(end, int(query["offset_end"]))
+    headers = dict(
+        headers, **{"X-Hvr-Offset-Begin": str(begin), "X-Hvr-Offset-End": str(end)}
+    )
+    return 200, data[begin:end], headers
+
+
+def lines(n, start=0):
+    return b"".join(b"line %d\n" % i for i in range(start, start + n))
+
+
+def test_tail_without_follow(standin_hub, hvr_client):
+    Log(standin_hub, lines(20))
+    tail = hvr_client.tail_log("hvrhub", "hvr.out", follow=False, lines=3)
+    assert list(tail) == ["line 17", "line 18", "line 19"]
+
+
+def test_whole_file_in_chunks(standin_hub, hvr_client):
+    log = Log(standin_hub, lines(25) + b"partial")
+    tail = hvr_client.tail_log(
+        "hvrhub", "hvr.out", follow=False, lines=None, chunk_lines=10
+    )
+    assert list(tail) == ["line %d" % i for i in range(25)] + ["partial"]
+    assert len(log.requests) == 3
+
+
+def test_follow_reads_only_new_bytes(standin_hub, hvr_client):
+    log = Log(standin_hub, lines(5))
+    tail = hvr_client.tail_log("hvrhub", "hvr.out", lines=1, poll_min=0.01)
+
+    assert next(tail) == "line 4"
+    log.data += b"line 5\nline"
+    assert next(tail) == "line 5"
+    log.data += b" 6\n"
+    assert next(tail) == "line 6"
+    assert all(q["offset_begin"] != ["0"] for q in log.requests[1:])
+
+
+def test_rotation(standin_hub, hvr_client):
+    log = Log(standin_hub, lines(3))
+    tail = hvr_client.tail_log("hvrhub", "hvr.out", lines=None, poll_min=0.01)
+    assert [next(tail) for _ in range(3)] == ["line 0", "line 1", "line 2"]
+
+    log.data += lines(2, 3)
+    log.rotate("hvr.out_20220101")
+    log.data = lines(2, 100)
+    standin_hub.route(
+        "GET",
+        API + "/archive/hvr.out_20220101",
+        lambda r: answer(
+            log.archives["hvr.out_20220101"], {k: v[0] for k, v in r.query.items()}, {}
+        ),
+    )
+    assert [next(tail) for _ in range(4)] == [
+        "line 3",
+        "line 4",
+        "line 100",
+        "line 101",
+    ]
+
+
+def test_truncation(standin_hub, hvr_client):
+    log = Log(standin_hub, lines(3))
+    tail = hvr_client.tail_log("hvrhub", "hvr.out", lines=1, poll_min=0.01)
+    assert next(tail) == "line 2"
+
+    log.data = b"new\n"
+    assert next(tail) == "new"
+
+
+def test_follow_job_logs(standin_hub, hvr_client):
+    standin_hub.route(
+        "GET",
+        "/api/v6.1.0.3/hubs/hvrhub/jobs",
+        {
+            "chn-cap-src": {"state": "RUNNING"},
+            "chn-integ-tgt": {"state": "RUNNING"},
+            "chn-refr-src-tgt": {"state": "PENDING"},
+        },
+    )
+    cap = Log(standin_hub, b"2022-01-01T10:00:00: old\n", "chn-cap-src.out")
+    integ = Log(standin_hub, b"", "chn-integ-tgt.out")
+    follower = hvr_client.follow_logs(
+        "hvrhub", lines=None, poll_min=0.01, poll_max=0.05
+    )
+    lines = iter(follower)
+
+    cap.data += b"2022-01-01T10:00:02: cap 2\n"
+    integ.data += (
+        b"2022-01-01T10:00:01: integ 1\n  detail\n2022-01-01T10:00:03: integ 3\n"
+    )
+    assert [next(lines) for _ in range(5)] == [
+        ("chn-cap-src.out", "2022-01-01T10:00:00: old"),
+        ("chn-integ-tgt.out", "2022-01-01T10:00:01: integ 1"),
+        ("chn-integ-tgt.out", "  detail"),
+        ("chn-cap-src.out", "2022-01-01T10:00:02: cap 2"),
+        ("chn-integ-tgt.out", "2022-01-01T10:00:03: integ 3"),
+    ]
+    assert sorted(follower.tails) == ["chn-cap-src.out", "chn-integ-tgt.out"]
+    follower.close()
+
+
+def test_follower_drops_missing_file(standin_hub, hvr_client):
+    log = Log(standin_hub, b"", "a.out")
+    follower = hvr_client.follow_logs(
+        "hvrhub",
+        files=["a.out", "missing.out"],
+        lines=None,
+        poll_min=0.01,
+        poll_max=0.05,
+    )
+    lines = iter(follower)
+    log.data = b"x\n"
+    assert next(lines) == ("a.out", "x")
+    assert list(follower.tails) == ["a.out"]
+    assert follower.errors["missing.out"].status_code == 404
+
+
+def test_read_log_range(standin_hub, hvr_client):
+    archive = b"".join(b"2022-01-01T01:%02d:00: a%d\n" % (i, i) for i in range(50))
+    data = b"".join(b"2022-01-01T02:%02d:00: b%d\n" % (i, i) for i in range(50))
+    log = Log(standin_hub, data)
+
+    def search(request):
+        tstamp = request.query["search_tstamp"][0].encode()
+        for path, content in (("hvr.out_1", archive), ("hvr.out", data)):
+            offset = 0
+            for line in content.splitlines(True):
+                if line[:19] >= tstamp:
+                    return 200, {"path": "/hvr/log/" + path, "offset": str(offset)}, {}
+                offset += len(line)
+        return 200, {"path": "hvr.out", "offset": "-1"}, {}
+
+    def get_archive(request):
+        query = {k: v[0] for k, v in request.query.items()}
+        return answer(archive, query, {"X-Hvr-Log-Next": "hvr.out"})
+
+    standin_hub.route("GET", API + "/search", search)
+    standin_hub.route("GET", API + "/archive/hvr.out_1", get_archive)
+
+    lines = list(
+        hvr_client.read_log_range(
+            "hvrhub",
+            "hvr.out",
+            "2022-01-01T02:10:00",
+            "2022-01-01T02:15:00",
+            chunk_lines=2,
+        )
+    )
+    assert lines == [data.splitlines()[i].decode() for i in range(10, 15)]
+    assert len(log.requests) == 3
+
+    lines = list(
+        hvr_client.read_log_range(
+            "hvrhub", "hvr.out", "2022-01-01T01:48:00", "2022-01-01T02:02:00"
+        )
+    )
+    assert [line.split(": ")[1] for line in lines] == ["a48", "a49", "b0", "b1"]
+
+    assert (
+        list(hvr_client.read_log_range("hvrhub", "hvr.out", "2022-01-01T03:00:00"))
+        == []
+    )
+
+
+def test_download_log_archive(standin_hub, tmp_path, hvr_client):
+    archive = lines(20000)
+    requests = []
+
+    def get_archive(request):
+        query = {k: v[0] for k, v in request.query.items()}
+        requests.append(query)
+        if query.get("offset_begin") == "50000" and fail:
+            return 500, "F_JR0001: failed", {}
+        return answer(archive, query, {})
+
+    standin_hub.route(
+        "GET", "/api/v6.1.0.3/logs/hvr.out/archive/hvr_1.out", get_archive
+    )
+    path = str(tmp_path / "hvr_1.out")
+
+    fail = True
+    try:
+        hvr_client.download_log_archive(
+            None, "hvr.out", "hvr_1.out", path, chunk_size=10000
+        )
+    except pyhvr.pyhvr_exceptions.RestError:
+        pass
+    assert (tmp_path / "hvr_1.out.part.json").exists()
+
+    fail = False
+    requests.clear()
+    digest = hvr_client.download_log_archive(
+        None, "hvr.out", "hvr_1.out", path, chunk_size=10000
+    )
+
+    assert open(path, "rb").read() == archive
+    assert digest == hashlib.sha256(archive).hexdigest()
+    assert not (tmp_path / "hvr_1.out.part.json").exists()
+    # size check before and after, and the chunks the first attempt missed
+    chunks = [q for q in requests if "offset_begin" in q]
+    assert 1 <= len(chunks) < len(archive) // 10000
+    assert len(requests) == len(chunks) + 2
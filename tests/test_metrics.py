@@ -0,0 +1,139 @@
+import pyhvr
+import pyhvr.pyhvr_retry
+from pyhvr.pyhvr_metrics import MetricsExport, MetricsPoller, export_metrics
+
+API = "/api/v6.1.0.3/hubs/hvrhub/stats/metrics"
+
+
+def answer(metric, values, channel="chn", loc="src", table="*", scope="cl*"):
+    return {metric: {"1": {scope: {channel: {loc: {table: values}}}}}}
+
+
+def test_poll_merges_updates_since_last_answer(standin_hub):
+    answers = [
+        (
+            answer("Captured Rows", {"2022-03-01T10:00:00Z": 10}),
+            {
+                "X-Hvr-Logs-Last-Updated": "2022-03-01T10:00:30Z",
+                "X-Hvr-Glob-Last-Updated": "2022-03-01T10:00:20Z",
+            },
+        ),
+        (
+            answer("Captured Rows", {"2022-03-01T10:01:00Z": 7}),
+            {"X-Hvr-Logs-Last-Updated": "2022-03-01T10:01:30Z"},
+        ),
+    ]
+    queries = []
+
+    def metrics(request):
+        queries.append(request.query)
+        payload, headers = answers[len(queries) - 1]
+        return 200, payload, headers
+
+    standin_hub.route("GET", API, metrics)
+    hvr_client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+    poller = MetricsPoller(hvr_client, "hvrhub", channel=["chn"], time_gran=["1"])
+
+    key = ("chn", "src", "*", "Captured Rows", "1")
+    assert poller.poll() == {key}
+    assert poller.poll() == {key}
+    assert poller.get("chn", "src", "*", "Captured Rows", 1) == {
+        "2022-03-01T10:00:00Z": 10,
+        "2022-03-01T10:01:00Z": 7,
+    }
+
+    assert "updated_logs_since" not in queries[0]
+    assert queries[0]["fetch_values"] == ["true"]
+    assert queries[0]["channel"] == ["chn"]
+    assert queries[1]["updated_logs_since"] == ["2022-03-01T10:00:30Z"]
+    assert queries[1]["updated_glob_since"] == ["2022-03-01T10:00:20Z"]
+    assert poller.logs_since == "2022-03-01T10:01:30Z"
+    assert poller.glob_since == "2022-03-01T10:00:20Z"
+
+    poller.prune("2022-03-01T10:00:30Z")
+    assert poller.get("chn", "src", "*", "Captured Rows", "1") == {
+        "2022-03-01T10:01:00Z": 7
+    }
+
+
+def test_poll_empty_answer(standin_hub):
+    standin_hub.route("GET", API, None)
+    hvr_client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+    poller = MetricsPoller(hvr_client, "hvrhub")
+    assert poller.poll() == set()
+    assert poller.polls == 1
+
+
+def test_export_shards_retries_and_merges_in_order(standin_hub, tmp_path):
+    failed = set()
+
+    def metrics(request):
+        begin = request.query["tstamp_begin"][0]
+        channel = request.query["channel"][0]
+        # every shard fails once
+        if (begin, channel) not in failed:
+            failed.add((begin, channel))
+            return 503, "F_JR0001: busy", {}
+        day = begin[:10]
+        values = {
+            day + "T00:00:00Z": 1,
+            day + "T12:00:00Z": 2 if channel == "a" else 3,
+            # the first value of the next shard, answered by both
+            "2022-03-0%dT00:00:00Z" % (int(day[-1]) + 1): 9,
+        }
+        return 200, answer("Captured Rows", values, channel=channel), {}
+
+    standin_hub.route("GET", API, metrics)
+    hvr_client = pyhvr.client(
+        username="admin",
+        password="pw",
+        uri=standin_hub.uri,
+        retry=pyhvr.pyhvr_retry.RetryPolicy(retries=0),
+    )
+    export = MetricsExport(
+        hvr_client,
+        "hvrhub",
+        "2022-03-01T00:00:00Z",
+        "2022-03-03T00:00:00Z",
+        channel=["a", "b"],
+        channels_per_shard=1,
+    )
+    rows = [(r.tstamp, r.channel, r.value) for r in export]
+    assert rows == [
+        ("2022-03-01T00:00:00Z", "a", 1),
+        ("2022-03-01T00:00:00Z", "b", 1),
+        ("2022-03-01T12:00:00Z", "a", 2),
+        ("2022-03-01T12:00:00Z", "b", 3),
+        ("2022-03-02T00:00:00Z", "a", 1),
+        ("2022-03-02T00:00:00Z", "b", 1),
+        ("2022-03-02T12:00:00Z", "a", 2),
+        ("2022-03-02T12:00:00Z", "b", 3),
+    ]
+    assert export.retried == 4
+
+    path = str(tmp_path / "metrics.csv")
+    assert (
+        export_metrics(
+            hvr_client,
+            "hvrhub",
+            "2022-03-01T00:00:00Z",
+            "2022-03-02T00:00:00Z",
+            path=path,
+            channel=["a"],
+        )
+        == 2
+    )
+    assert open(path).read().splitlines() == [
+        "tstamp,channel,loc,table,metric,time_gran,value",
+        "2022-03-01T00:00:00Z,a,src,*,Captured Rows,1,1",
+        "2022-03-01T12:00:00Z,a,src,*,Captured Rows,1,2",
+    ]
+
+
+def test_export_empty_answer(standin_hub):
+    standin_hub.route("GET", API, None)
+    hvr_client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+    export = MetricsExport(
+        hvr_client, "hvrhub", "2022-03-01T00:00:00Z", "2022-03-02T00:00:00Z"
+    )
+    assert list(export) == []
@@ -0,0 +1,137 @@
+import copy
+
+from pyhvr.pyhvr_mirror import DefinitionMirror, apply_change
+
+API = "/api/v6.1.0.3"
+
+DEFINITION = {
+    "locs": {"src": {"props": {"Class": "postgresql"}, "actions": []}},
+    "channels": {
+        "chn": {
+            "description": "",
+            "loc_groups": {"SOURCE": {"members": ["src"]}},
+            "tables": {"orders": {"base_name": "orders", "cols": {}}},
+            "actions": [{"type": "Capture", "loc_scope": "SOURCE"}],
+        }
+    },
+    "hub_actions": [],
+}
+
+
+class Hub:
+    """Definition, events and their changes as served by the stand-in hub"""
+
+    def __init__(self, standin_hub):
+        self.events = {}
+        self.changes = {}
+        standin_hub.route(
+            "GET", API + "/hubserver/clock", {"clock": "2022-01-01T00:00:00Z"}
+        )
+        standin_hub.route(
+            "GET",
+            API + "/hubs/hvrhub/definition",
+            lambda r: (200, DEFINITION, {"X-Hvr-View-Tstamp": "2022-01-01T00:00:01Z"}),
+        )
+        standin_hub.route("GET", API + "/hubs/hvrhub/events", self.get_events)
+        standin_hub.route(
+            "GET", API + "/hubs/hvrhub/definition/change/events", self.get_changes
+        )
+
+    def add(self, ev_id, *changes):
+        self.events[ev_id] = {"type": "Definition_Change", "state": "DONE"}
+        self.changes[ev_id] = list(changes)
+
+    def get_events(self, request):
+        begin = request.query["ev_tstamp_begin"][0]
+        return 200, {k: v for k, v in self.events.items() if k >= begin}, {}
+
+    def get_changes(self, request):
+        changes = [c for ev_id in request.query["ev_id"] for c in self.changes[ev_id]]
+        return 200, {"changes": changes}, {}
+
+
+def test_load_and_refresh(standin_hub, hvr_client):
+    hub = Hub(standin_hub)
+    mirror = DefinitionMirror(hvr_client, "hvrhub")
+    mirror.load()
+    assert mirror.view_tstamp == "2022-01-01T00:00:01Z"
+    assert mirror.table("chn", "orders")["base_name"] == "orders"
+
+    assert mirror.refresh() == 0
+    hub.add(
+        "2022-01-01T00:00:02Z",
+        {"add_table": {"channel": "chn", "table": "lines", "base_name": "lines"}},
+    )
+    hub.add(
+        "2022-01-01T00:00:03Z",
+        {"rename_loc": {"loc": "src", "new_name": "pg"}},
+        {"modify_loc_props": {"loc": "pg", "props": {"Database_Port": 5432}}},
+    )
+    assert mirror.refresh() == 3
+    assert mirror.tables("chn")["lines"] == {"base_name": "lines", "cols": {}}
+    assert mirror.loc("pg")["props"]["Database_Port"] == 5432
+    assert mirror.channel("chn")["loc_groups"]["SOURCE"]["members"] == ["pg"]
+    assert mirror.view_tstamp == "2022-01-01T00:00:03Z"
+
+    # events at the watermark are only applied once
+    assert mirror.refresh() == 0
+    assert len(standin_hub.calls("GET", API + "/hubs/hvrhub/definition")) == 1
+    assert (
+        len(standin_hub.calls("GET", API + "/hubs/hvrhub/definition/change/events"))
+        == 1
+    )
+
+
+def test_reload_when_change_does_not_apply(standin_hub, hvr_client):
+    hub = Hub(standin_hub)
+    mirror = DefinitionMirror(hvr_client, "hvrhub")
+    mirror.load()
+
+    hub.add("2022-01-01T00:00:02Z", {"delete_channel": {"channel": "unknown"}})
+    mirror.refresh()
+    assert mirror.loads == 2
+    assert mirror.channels() == ["chn"]
+
+
+def test_apply_change():
+    definition = copy.deepcopy(DEFINITION)
+    for change in [
+        {"add_channel": {"channel": "chn2", "description": "second"}},
+        {"rename_table": {"channel": "chn", "table": "orders", "new_name": "o"}},
+        {"add_cols": {"channel": "chn", "table": "o", "cols": {"id": {"sequence": 1}}}},
+        {
+            "delete_loc_group_members": {
+                "channel": "chn",
+                "loc_group": "SOURCE",
+                "members": ["src"],
+            }
+        },
+        {"add_hub_actions": {"actions": [{"type": "Environment"}]}},
+        {
+            "modify_action": {
+                "type": "Capture",
+                "old": {"channel": "chn", "loc_scope": "SOURCE"},
+                "new": {"params": {"IgnoreSessionName": "x"}},
+            }
+        },
+    ]:
+        apply_change(definition, change)
+
+    assert definition["channels"]["chn2"]["description"] == "second"
+    assert definition["channels"]["chn"]["tables"]["o"]["cols"] == {
+        "id": {"sequence": 1}
+    }
+    assert definition["channels"]["chn"]["loc_groups"]["SOURCE"]["members"] == []
+    assert definition["hub_actions"] == [{"type": "Environment"}]
+    assert definition["channels"]["chn"]["actions"] == [
+        {"type": "Capture", "loc_scope": "SOURCE", "params": {"IgnoreSessionName": "x"}}
+    ]
+
+
+def test_load_empty_definition(standin_hub, hvr_client):
+    Hub(standin_hub)
+    standin_hub.route("GET", API + "/hubs/hvrhub/definition", None)
+    mirror = DefinitionMirror(hvr_client, "hvrhub")
+    mirror.load()
+    assert mirror.definition == {"locs": {}, "channels": {}, "hub_actions": []}
+    assert mirror.channels() == []
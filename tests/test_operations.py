@@ -0,0 +1,78 @@
+import concurrent.futures
+
+import pytest
+
+import pyhvr
+from pyhvr.pyhvr_operations import as_completed, wait
+
+API = "/api/v6.1.0.3/hubs/hvrhub"
+
+
+def refresh(hvr_client):
+    return hvr_client.submit(
+        "post_hubs_channels_refresh",
+        hub="hvrhub",
+        channel="chn",
+        source_loc="src",
+        target_loc="tgt",
+    )
+
+
+def test_operations_share_one_poller(standin_events, hvr_client):
+    standin_events.operation()
+    standin_events.fails = lambda event: event["n"] == 2
+    operations = [refresh(hvr_client) for _ in range(4)]
+    assert operations[0].job == "chn-refr-src-tgt"
+
+    done, not_done = wait(operations, timeout=5)
+    assert not not_done
+    assert operations[0].result()["state"] == "DONE"
+    with pytest.raises(pyhvr.pyhvr_exceptions.EventFailed) as e:
+        operations[2].result()
+    assert e.value.event["state"] == "FAILED"
+    # one get_hubs_events call per cycle for all of them
+    assert all(len(query["ev_id"]) == 4 for query in standin_events.queries)
+    assert set(as_completed(operations, timeout=1)) == set(operations)
+
+
+def test_cancel_and_snapshot(standin_hub, standin_events, hvr_client):
+    standin_events.polls = 1000
+    standin_events.operation()
+    operation = refresh(hvr_client)
+    assert not operation.done()
+    assert operation.cancel()
+    assert standin_events.canceled == [operation.ev_id]
+    with pytest.raises(concurrent.futures.CancelledError):
+        operation.result(timeout=1)
+    assert not operation.cancel()
+
+    assert wait([operation], timeout=1).done == {operation}
+    assert list(as_completed([operation], timeout=1)) == [operation]
+
+    standin_hub.route("POST", API + "/snapshot", {"ref": "snapshot_1"})
+    snapshot = hvr_client.submit("post_hubs_snapshot", hub="hvrhub")
+    assert snapshot.done()
+    assert snapshot.result() == {"ref": "snapshot_1"}
+
+
+def test_event_canceled_on_the_hub(standin_events, hvr_client):
+    standin_events.polls = 1000
+    standin_events.operation()
+    operation = refresh(hvr_client)
+    standin_events.events[operation.ev_id]["state"] = "CANCELED"
+    done, not_done = wait([operation], timeout=2)
+    assert done == {operation}
+    assert operation.cancelled()
+    assert list(as_completed([operation], timeout=1)) == [operation]
+
+
+def test_poller_error_fails_operations(standin_hub, standin_events, hvr_client):
+    standin_events.operation()
+    standin_hub.route("GET", API + "/events", "<html>no events</html>")
+    operation = refresh(hvr_client)
+    with pytest.raises(ValueError):
+        operation.result(timeout=2)
+
+    # the next operation gets a poller thread of its own
+    standin_hub.route("GET", API + "/events", standin_events.get)
+    assert refresh(hvr_client).result(timeout=2)["state"] == "DONE"
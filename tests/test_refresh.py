@@ -0,0 +1,129 @@
+import concurrent.futures
+
+import pyhvr
+import pyhvr.pyhvr_refresh
+
+
+def fail_first_bad(events):
+    """The first refresh of table "bad" fails."""
+
+    def fails(event):
+        bad = [e for e in events.events.values() if "bad" in e["body"]["tables"]]
+        return bool(bad) and bad[0] is event
+
+    events.fails = fails
+
+
+def test_plan_batches():
+    batches = pyhvr.pyhvr_refresh.plan_batches(
+        [
+            ("chn", "src", "tgt", ["t%d" % i for i in range(5)]),
+            ("chn", "src", "tgt2", ["u"], {"granularity": "bulk"}),
+        ],
+        tables_per_batch=2,
+    )
+    assert [batch.tables for batch in batches] == [
+        ["t0", "t1"],
+        ["t2", "t3"],
+        ["t4"],
+        ["u"],
+    ]
+    assert batches[3].kwargs == {"granularity": "bulk"}
+
+
+def test_scheduler_limits_and_requeues(standin_events, hvr_client):
+    standin_events.operation()
+    fail_first_bad(standin_events)
+    plan = [
+        ("chn", "src", "tgt1", ["a", "b", "c", "d"]),
+        ("chn", "src", "tgt2", ["e", "f", "bad"]),
+        ("chn", "src2", "tgt3", ["g", "h"]),
+    ]
+    report = pyhvr.pyhvr_refresh.refresh_plan(
+        hvr_client,
+        "hvrhub",
+        plan,
+        tables_per_batch=2,
+        max_per_loc=2,
+        max_per_hub=3,
+        parallel_sessions=4,
+    )
+    assert report["done"] == 5
+    assert report["failed"] == 0
+    assert report["retried"] == 1
+    assert report["tables_done"] == 9
+    assert report["tables_per_minute"] > 0
+    assert standin_events.peak_locs["src"] == 2
+    assert standin_events.peak <= 3
+    # batches of one channel, source and target share a job
+    assert standin_events.peak_job == 1
+    assert all(body["parallel_sessions"] == 4 for body in standin_events.bodies)
+    # the failed batch was refreshed again
+    assert [body["tables"] for body in standin_events.bodies].count(["bad"]) == 2
+
+
+def test_scheduler_gives_up(standin_events, hvr_client):
+    standin_events.operation()
+    fail_first_bad(standin_events)
+    scheduler = pyhvr.pyhvr_refresh.RefreshScheduler(
+        hvr_client,
+        "hvrhub",
+        pyhvr.pyhvr_refresh.plan_batches([("chn", "src", "tgt", ["bad"])]),
+        retries=0,
+    )
+    report = scheduler.run(timeout=10)
+    assert report["failed"] == 1
+    assert report["tables_failed"] == 1
+    assert isinstance(scheduler.failed[0].error, pyhvr.pyhvr_exceptions.EventFailed)
+
+
+def test_batches_with_own_task_run_together(standin_events, hvr_client):
+    standin_events.operation()
+    batches = [
+        pyhvr.pyhvr_refresh.RefreshBatch("chn", "src", "tgt", ["a"], {"task": "refr1"}),
+        pyhvr.pyhvr_refresh.RefreshBatch("chn", "src", "tgt", ["b"], {"task": "refr2"}),
+    ]
+    report = pyhvr.pyhvr_refresh.RefreshScheduler(hvr_client, "hvrhub", batches).run(
+        timeout=10
+    )
+    assert report["done"] == 2
+    assert standin_events.peak_locs["src"] == 2
+    assert standin_events.peak_job == 1
+
+
+def test_scheduler_retries_failed_start(standin_hub, standin_events, hvr_client):
+    answers = [(503, "F_JR0002: hub busy", {})]
+
+    def refresh(request):
+        if answers:
+            return answers.pop()
+        return standin_events.start("chn", "refresh", request.body)
+
+    standin_hub.route("POST", standin_events.api + "/channels/chn/refresh", refresh)
+    scheduler = pyhvr.pyhvr_refresh.RefreshScheduler(
+        hvr_client,
+        "hvrhub",
+        pyhvr.pyhvr_refresh.plan_batches([("chn", "src", "tgt", ["a"])]),
+        retry_delay=0.01,
+    )
+    report = scheduler.run(timeout=10)
+    assert report["done"] == 1
+    assert report["retried"] == 1
+    assert scheduler.done[0].attempts == 2
+
+
+def test_scheduler_does_not_rerun_canceled(standin_events, hvr_client):
+    standin_events.polls = 1000
+    standin_events.operation()
+    scheduler = pyhvr.pyhvr_refresh.RefreshScheduler(
+        hvr_client,
+        "hvrhub",
+        pyhvr.pyhvr_refresh.plan_batches([("chn", "src", "tgt", ["a"])]),
+    )
+    assert scheduler.run(timeout=0.05)["running"] == 1
+    operation = list(scheduler.running)[0]
+    assert operation.cancel()
+    report = scheduler.run(timeout=5)
+    assert report["failed"] == 1
+    assert report["retried"] == 0
+    assert isinstance(scheduler.failed[0].error, concurrent.futures.CancelledError)
@@ -0,0 +1,102 @@
+import socket
+
+import pytest
+
+import pyhvr
+from pyhvr.pyhvr_exceptions import ConnectionError, RestError
+from pyhvr.pyhvr_retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def flaky(failures, status=503, headers=None):
+    calls = []
+
+    def answer(request):
+        calls.append(request)
+        if len(calls) <= failures:
+            return status, "F_JR0001: busy", headers or {}
+        return 200, {"ok": True}, {}
+
+    return answer
+
+
+def client(uri, **kwargs):
+    return pyhvr.client(
+        username="admin",
+        password="pw",
+        uri=uri,
+        retry=RetryPolicy(backoff=0.001, **kwargs),
+    )
+
+
+def test_retry_get(standin_hub):
+    standin_hub.route("GET", "/api/v6.1.0.3/hubserver/clock", flaky(2))
+
+    assert client(standin_hub.uri).get_hubserver_clock() == {"ok": True}
+    assert len(standin_hub.calls()) == 3
+
+
+def test_retries_exhausted(standin_hub):
+    standin_hub.route("GET", "/api/v6.1.0.3/hubserver/clock", flaky(5))
+
+    with pytest.raises(RestError) as e:
+        client(standin_hub.uri, retries=2).get_hubserver_clock()
+    assert e.value.status_code == 503
+    assert len(standin_hub.calls()) == 3
+
+
+def test_no_retry_for_client_error(standin_hub):
+    standin_hub.route("GET", "/api/v6.1.0.3/hubserver/clock", flaky(1, status=400))
+
+    with pytest.raises(RestError):
+        client(standin_hub.uri).get_hubserver_clock()
+    assert len(standin_hub.calls()) == 1
+
+
+def test_post_only_when_retry_safe(standin_hub):
+    standin_hub.route("POST", "/api/v6.1.0.3/hubs/hvrhub/channels/c/refresh", flaky(1))
+    standin_hub.route("POST", "/api/v6.1.0.3/hubs/hvrhub/locs/l/test", flaky(1))
+    hvr_client = client(standin_hub.uri)
+
+    with pytest.raises(RestError):
+        hvr_client.post_hubs_channels_refresh(
+            hub="hvrhub", channel="c", source_loc="s", target_loc="t"
+        )
+    assert hvr_client.post_hubs_locs_test(hub="hvrhub", loc="l") == {"ok": True}
+    assert len(standin_hub.calls()) == 3
+
+
+def test_retry_after(standin_hub):
+    standin_hub.route(
+        "GET",
+        "/api/v6.1.0.3/hubserver/clock",
+        flaky(1, status=429, headers={"Retry-After": "3600"}),
+    )
+
+    # longer than backoff_max: fail instead of waiting an hour
+    with pytest.raises(RestError):
+        client(standin_hub.uri).get_hubserver_clock()
+
+    policy = RetryPolicy(backoff=0.001, jitter=False)
+    assert policy.delay(0, 503, "2") == 2
+    assert policy.delay(0, 503, "Thu, 01 Jan 1970 00:00:00 GMT") == 0.001
+    assert parse_retry_after("soon") is None
+
+
+def test_budget():
+    policy = RetryPolicy(budget=RetryBudget(ratio=0, min_tokens=1))
+
+    assert policy.delay(0, 503) is not None
+    assert policy.delay(0, 503) is None
+
+
+def test_connection_error(standin_hub):
+    hvr_client = client(standin_hub.uri)
+    hvr_client.login()
+    # nothing listens on this port anymore
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    hvr_client.uri = "http://127.0.0.1:%d" % sock.getsockname()[1]
+    sock.close()
+
+    with pytest.raises(ConnectionError):
+        hvr_client.get_hubserver_clock()
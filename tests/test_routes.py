@@ -0,0 +1,82 @@
+import inspect
+
+import pyhvr
+from pyhvr.pyhvr_routes import ROUTES, LazyMethod
+
+
+class Capture(pyhvr.Client):
+    def request(
+        self,
+        verb,
+        path,
+        query,
+        headers,
+        payload,
+        is_json,
+        retry_safe=False,
+        timeout=None,
+    ):
+        return verb, path, query, headers, payload, is_json
+
+
+hvr_client = Capture(uri="http://localhost:4340", setup_mode=False)
+
+
+def test_lazy_binding():
+    assert isinstance(pyhvr.Client.__dict__["get_hubs_dirs"], LazyMethod)
+    assert "get_hubs_dirs" in dir(pyhvr.Client)
+
+    signature = inspect.signature(pyhvr.Client.get_hubs_dirs)
+
+    assert str(signature) == "(self, hub, path=None, pattern=None, *, timeout=None)"
+    assert inspect.isfunction(pyhvr.Client.__dict__["get_hubs_dirs"])
+    assert len(ROUTES) == 238
+
+
+def test_query_and_bool():
+    assert hvr_client.get_hubs_events(
+        hub="hvrhub", ev_id="123", fetch_results=True, current_only=False
+    ) == (
+        "GET",
+        "/api/v6.1.0.3/hubs/hvrhub/events",
+        {"ev_id": "123", "fetch_results": "true"},
+        {},
+        None,
+        True,
+    )
+
+
+def test_body_and_header():
+    assert hvr_client.put_hubs_definition_locs(
+        "hvrhub", "loc1", {"Class": "postgresql"}, x_hvr_classified_transport_key="k"
+    ) == (
+        "PUT",
+        "/api/v6.1.0.3/hubs/hvrhub/definition/locs/loc1",
+        None,
+        {"X-Hvr-Classified-Transport-Key": "k"},
+        {"props": {"Class": "postgresql"}},
+        True,
+    )
+
+
+def test_body_passthrough():
+    assert hvr_client.patch_hubs_definition_locs_props(
+        hub="hvrhub", loc="loc4", Database_Port=5432
+    ) == (
+        "PATCH",
+        "/api/v6.1.0.3/hubs/hvrhub/definition/locs/loc4/props",
+        None,
+        {},
+        {"Database_Port": 5432},
+        True,
+    )
+
+
+def test_retry_safe():
+    assert ROUTES["patch_hubs_definition_locs_props"].retry_safe
+    assert ROUTES["post_hubs_locs_test"].retry_safe
+    assert not ROUTES["post_hubs_channels_refresh"].retry_safe
+
+
+def test_text_response():
+    assert hvr_client.get_hubs_logs(hub="hvrhub", file="hvr.out")[-1] is False
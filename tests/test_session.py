@@ -0,0 +1,26 @@
+import pyhvr
+
+
+def test_keep_alive(standin_hub):
+    standin_hub.route("GET", "/api/v6.1.0.3/hubserver/clock", {"tstamp": "now"})
+    hvr_client = pyhvr.client(username="admin", password="pw", uri=standin_hub.uri)
+
+    for _ in range(20):
+        assert hvr_client.get_hubserver_clock() == {"tstamp": "now"}
+
+    # login and all calls share one pooled connection
+    assert standin_hub.logins == 1
+    assert standin_hub.connections == 1
+    assert len(standin_hub.calls("GET")) == 20
+
+
+def test_close(standin_hub):
+    standin_hub.route("GET", "/api/v6.1.0.3/hubserver/clock", {"tstamp": "now"})
+
+    with pyhvr.client(
+        username="admin", password="pw", uri=standin_hub.uri, pool_maxsize=2
+    ) as hvr_client:
+        hvr_client.get_hubserver_clock()
+    hvr_client.get_hubserver_clock()
+
+    assert standin_hub.connections == 2
@@ -0,0 +1,138 @@
+import pyhvr.pyhvr_slicing
+
+LOC = "/api/v6.1.0.3/hubs/hvrhub/channels/chn/locs/src"
+
+SUGGESTIONS = {
+    "orders": {
+        "based_on": "suggest_from_db_stats",
+        "row_estimate": "4000",
+        "slicing": {"type": "modulo", "col": "o_id", "slices": 4},
+    },
+    "customer": {
+        "based_on": "suggest_from_db_stats",
+        "row_estimate": "1500",
+        "slicing": {
+            "type": "boundary",
+            "col": "c_id",
+            "int_boundaries": ["500", "1000"],
+        },
+    },
+    "item": {"based_on": "no_data", "row_estimate": "800", "no_slicing": True},
+    "region": {
+        "based_on": "suggest_from_db_stats",
+        "row_estimate": "5",
+        "no_slicing": True,
+    },
+}
+
+
+def slicing_hub(standin_hub, standin_events, operation="refresh"):
+    """Slicing suggestions and events of ``operation``"""
+
+    def suggest(request):
+        tables = request.body["tables"]
+        return 200, {table: SUGGESTIONS[table] for table in tables}, {}
+
+    standin_hub.route("POST", LOC + "/slicing_suggest", suggest)
+    standin_hub.route(
+        "POST", LOC + "/tables/item/slicing_boundaries", {"int_boundaries": ["400"]}
+    )
+    standin_events.operation("chn", operation)
+    return standin_events
+
+
+def test_slice_count():
+    assert (
+        pyhvr.pyhvr_slicing.slice_count({"type": "modulo", "col": "c", "slices": 3})
+        == 3
+    )
+    assert (
+        pyhvr.pyhvr_slicing.slice_count(
+            {"type": "boundary", "col": "c", "int_boundaries": ["1"]}
+        )
+        == 2
+    )
+    assert (
+        pyhvr.pyhvr_slicing.slice_count(
+            {"type": "series", "col": "c", "series_values": ["a", "b"]}
+        )
+        == 2
+    )
+
+
+def test_pack_slices_balances_rows():
+    slices = [pyhvr.pyhvr_slicing.Slice("big", i, 4, 250) for i in range(4)]
+    slices += [
+        pyhvr.pyhvr_slicing.Slice("mid", None, 1, 300),
+        pyhvr.pyhvr_slicing.Slice("small", None, 1, 100),
+    ]
+    bins = pyhvr.pyhvr_slicing.pack_slices(slices, 3)
+    assert sorted(sum(piece.rows for piece in pieces) for pieces in bins) == [
+        400,
+        500,
+        500,
+    ]
+    assert len(pyhvr.pyhvr_slicing.pack_slices(slices[:2], 3)) == 2
+
+
+def test_pack_slices_without_row_estimates():
+    slices = [pyhvr.pyhvr_slicing.Slice("t", i, 8, 0) for i in range(8)]
+    bins = pyhvr.pyhvr_slicing.pack_slices(slices, 4)
+    assert [len(pieces) for pieces in bins] == [2, 2, 2, 2]
+
+
+def test_sliced_refresh(standin_hub, standin_events, hvr_client):
+    hub = slicing_hub(standin_hub, standin_events)
+    run = pyhvr.pyhvr_slicing.sliced_refresh(
+        hvr_client,
+        "hvrhub",
+        "chn",
+        "src",
+        "tgt",
+        ["orders", "customer", "item", "region"],
+        parallelism=3,
+        columns={"item": "i_id"},
+        granularity="bulk",
+    )
+    assert len(hub.bodies) == 3
+    assert all(body["granularity"] == "bulk" for body in hub.bodies)
+    # each bin is a job of its own, and they ran at the same time
+    assert sorted(body["task"] for body in hub.bodies) == ["refr0", "refr1", "refr2"]
+    assert hub.peak == 3
+    assert hub.peak_job == 1
+
+    # each slice of each table is refreshed by exactly one event
+    selected = {}
+    for body in hub.bodies:
+        for table in body["tables"]:
+            slicing = body.get("slicing", {}).get(table)
+            if slicing is None:
+                selected.setdefault(table, []).append(None)
+            else:
+                count = pyhvr.pyhvr_slicing.slice_count(slicing)
+                selected.setdefault(table, []).extend(
+                    slicing.get("selection", range(count))
+                )
+    assert sorted(selected["orders"]) == [0, 1, 2, 3]
+    assert sorted(selected["customer"]) == [0, 1, 2]
+    assert sorted(selected["item"]) == [0, 1]
+    assert selected["region"] == [None]
+
+    progress = run.progress()
+    assert progress["orders"]["slices"] == 4
+    assert progress["orders"]["done"] == 4
+    assert progress["orders"]["rows_done"] == 4000
+    assert run.scheduler.report()["done"] == 3
+
+
+def test_sliced_compare(standin_hub, standin_events, hvr_client):
+    hub = slicing_hub(standin_hub, standin_events, "compare")
+    run = pyhvr.pyhvr_slicing.sliced_compare(
+        hvr_client, "hvrhub", "chn", "src", "tgt", ["orders"], parallelism=2, task="c"
+    )
+    assert [body["slicing"]["orders"]["selection"] for body in hub.bodies] == [
+        [0, 2],
+        [1, 3],
+    ]
+    assert [body["task"] for body in hub.bodies] == ["c0", "c1"]
+    assert run.progress()["orders"]["done"] == 4
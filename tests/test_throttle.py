@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+
+import pyhvr
+from pyhvr.pyhvr_exceptions import TimeoutError
+from pyhvr.pyhvr_throttle import Limit, Throttle, for_uri
+
+CLOCK = "/api/v6.1.0.3/hubserver/clock"
+CANCEL = "/api/v6.1.0.3/hubs/hvrhub/events_cancel"
+
+
+def client(uri, throttle):
+    return pyhvr.client(username="admin", password="pw", uri=uri, throttle=throttle)
+
+
+def test_rate_limit(standin_hub):
+    standin_hub.route("GET", CLOCK, {"ok": True})
+    throttle = Throttle(read=Limit(rate=20, burst=1))
+    hvr_client = client(standin_hub.uri, throttle)
+    hvr_client.login()
+
+    start = time.monotonic()
+    for _ in range(5):
+        hvr_client.get_hubserver_clock()
+    assert time.monotonic() - start >= 0.15
+
+    stats = throttle.stats()["read"]
+    assert stats["calls"] == 5
+    assert stats["waited"] == 4
+    assert stats["wait_seconds"] >= 0.15
+    assert stats["in_flight"] == 0
+
+
+def test_max_in_flight(standin_hub):
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def answer(request):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.pop()
+        return 200, {"ok": True}, {}
+
+    standin_hub.route("GET", CLOCK, answer)
+    hvr_client = client(standin_hub.uri, Throttle(read=Limit(max_in_flight=2)))
+
+    hvr_client.batch([("get_hubserver_clock", {})] * 8, max_workers=8)
+    assert max(peak) == 2
+
+
+def test_read_and_write_limits_are_separate(standin_hub):
+    standin_hub.route("GET", CLOCK, {"ok": True})
+    standin_hub.route("POST", CANCEL, {"ok": True})
+    throttle = Throttle(write=Limit(rate=2, burst=1))
+    hvr_client = client(standin_hub.uri, throttle)
+    hvr_client.login()
+
+    hvr_client.post_hubs_events_cancel(hub="hvrhub", ev_ids=["1"])
+    start = time.monotonic()
+    for _ in range(5):
+        hvr_client.get_hubserver_clock()
+    assert time.monotonic() - start < 0.2
+    assert throttle.stats()["read"]["waited"] == 0
+
+    hvr_client.post_hubs_events_cancel(hub="hvrhub", ev_ids=["1"])
+    assert throttle.stats()["write"]["waited"] == 1
+
+
+def test_deadline_while_waiting(standin_hub):
+    standin_hub.route("GET", CLOCK, {"ok": True})
+    hvr_client = client(standin_hub.uri, Throttle(read=Limit(rate=1, burst=1)))
+    hvr_client.login()
+
+    hvr_client.get_hubserver_clock()
+    with pytest.raises(TimeoutError):
+        with hvr_client.deadline(0.2):
+            hvr_client.get_hubserver_clock()
+    assert len(standin_hub.calls()) == 1
+
+
+def test_shared_per_uri():
+    throttle = for_uri("http://hub.example.com:4340", read=Limit(rate=5))
+    assert for_uri("HTTP://hub.example.com:4340/") is throttle
+    assert for_uri("http://other.example.com:4340") is not throttle
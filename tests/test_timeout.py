@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+import pytest
+
+import pyhvr
+from pyhvr.pyhvr_exceptions import TimeoutError
+from pyhvr.pyhvr_retry import RetryPolicy
+
+CLOCK = "/api/v6.1.0.3/hubserver/clock"
+
+
+def slow(seconds, status=200):
+    def answer(request):
+        time.sleep(seconds)
+        return status, {"ok": True}, {}
+
+    return answer
+
+
+def client(uri, **kwargs):
+    return pyhvr.client(username="admin", password="pw", uri=uri, **kwargs)
+
+
+def test_per_call_timeout(standin_hub):
+    standin_hub.route("GET", CLOCK, slow(0.5))
+    hvr_client = client(standin_hub.uri, retry=RetryPolicy(retries=0))
+
+    with pytest.raises(TimeoutError):
+        hvr_client.get_hubserver_clock(timeout=0.1)
+    assert hvr_client.get_hubserver_clock() == {"ok": True}
+
+
+def test_default_timeout(standin_hub):
+    standin_hub.route("GET", CLOCK, slow(0.5))
+    hvr_client = client(standin_hub.uri, timeout=0.1, retry=RetryPolicy(retries=0))
+
+    with pytest.raises(TimeoutError):
+        hvr_client.get_hubserver_clock()
+
+
+def test_deadline_spans_calls(standin_hub):
+    standin_hub.route("GET", CLOCK, slow(0.2))
+    hvr_client = client(standin_hub.uri, retry=RetryPolicy(retries=0))
+    hvr_client.login()
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        with hvr_client.deadline(0.3):
+            hvr_client.get_hubserver_clock()
+            hvr_client.get_hubserver_clock()
+    assert time.monotonic() - start < 0.5
+
+
+def test_deadline_skips_retry(standin_hub):
+    standin_hub.route("GET", CLOCK, slow(0, status=503))
+    hvr_client = client(standin_hub.uri, retry=RetryPolicy(backoff=1, jitter=False))
+
+    start = time.monotonic()
+    with pytest.raises(pyhvr.pyhvr_exceptions.RestError):
+        with hvr_client.deadline(0.5):
+            hvr_client.get_hubserver_clock()
+    assert time.monotonic() - start < 0.5
+    assert len(standin_hub.calls()) == 1
+
+
+def test_deadline_in_batch(standin_hub):
+    standin_hub.route("GET", CLOCK, slow(0.5))
+    hvr_client = client(standin_hub.uri, retry=RetryPolicy(retries=0))
+    hvr_client.login()
+
+    with hvr_client.deadline(0.1):
+        results = hvr_client.batch([("get_hubserver_clock", {})] * 2)
+    assert all(isinstance(r, TimeoutError) for r in results)
+
+
+def test_async_timeout(standin_hub):
+    standin_hub.route("GET", CLOCK, slow(0.5))
+
+    async def main():
+        async with pyhvr.async_client(
+            username="admin",
+            password="pw",
+            uri=standin_hub.uri,
+            retry=RetryPolicy(retries=0),
+        ) as hvr_client:
+            with pytest.raises(TimeoutError):
+                await hvr_client.get_hubserver_clock(timeout=0.1)
+            with pytest.raises(TimeoutError):
+                with hvr_client.deadline(0.1):
+                    await hvr_client.get_hubserver_clock()
+
+    asyncio.run(main())